@@ -4,3 +4,9 @@ from django.apps import AppConfig
 
 class ApiConfig(AppConfig):
     name = 'api'
+
+    def ready(self):
+        from api import caching, nplusone  # noqa: F401
+        from api.perf import instrument_serializers
+
+        instrument_serializers()
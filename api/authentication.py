@@ -1,5 +1,6 @@
 # Standard Library
 import logging
+import time
 
 # Third-Party Imports
 from decouple import config
@@ -10,6 +11,9 @@ from firebase_admin import auth, credentials, initialize_app
 from rest_framework import exceptions
 from rest_framework.authentication import TokenAuthentication
 
+# App Imports
+from core.metrics import FIREBASE_VERIFY_DURATION
+
 ADMIN_USER = 'admin'
 SUPERUSER = 'superuser'
 
@@ -31,11 +35,18 @@ initialize_app(cred)
 
 class FirebaseTokenAuthentication(TokenAuthentication):
     def authenticate_credentials(self, key):
+        start = time.perf_counter()
         try:
             token = auth.verify_id_token(key)
         except Exception:
+            FIREBASE_VERIFY_DURATION.observe(
+                time.perf_counter() - start, result='invalid'
+            )
             raise exceptions.AuthenticationFailed('Unable to authenticate.')
         else:
+            FIREBASE_VERIFY_DURATION.observe(
+                time.perf_counter() - start, result='valid'
+            )
             email = token.get('email')
             user = User.objects.get(email=email)
 
@@ -0,0 +1,75 @@
+# Standard Library
+from functools import wraps
+
+# Third-Party Imports
+from django.conf import settings
+from django.core.cache import cache
+
+# App Imports
+from api.mixins import cached_response
+from api.perf import serializer_hooks
+from core.cache import make_key, model_namespace, pinned_namespace_versions
+
+
+def cache_response(*models, per_centre=False):
+    """
+    Serve a viewset action, such as `list` or `retrieve`, from the cache
+    until a row of one of `models` is written.
+
+    The response must only depend on the URL, or with `per_centre` on the
+    URL and the requesting user's centre; then only writes in that centre
+    invalidate it, for models kept per centre.
+    """
+
+    def decorator(action):
+        @wraps(action)
+        def cached_action(self, request, *args, **kwargs):
+            centre_id = getattr(request.user, 'location_id', None)
+            if not per_centre:
+                centre_id = None
+            return cached_response(
+                self,
+                request,
+                [model_namespace(model, centre_id) for model in models],
+                lambda: action(self, request, *args, **kwargs),
+                vary_on=(centre_id,),
+            )
+
+        return cached_action
+
+    return decorator
+
+
+def cache_representation(*models):
+    """
+    Class decorator caching a serializer's representation of each instance
+    until it, or a row of one of `models` the representation reads, is
+    written. The representation must not depend on the request.
+    """
+
+    def decorator(serializer_class):
+        to_representation = serializer_class.to_representation
+
+        @wraps(to_representation)
+        def cached_to_representation(self, instance):
+            namespaces = [model_namespace(type(instance))]
+            namespaces += [model_namespace(model) for model in models]
+            key = make_key(namespaces, serializer_class.__name__, instance.pk)
+            data = cache.get(key)
+            if data is None:
+                data = to_representation(self, instance)
+                cache.set(key, data, settings.API_CACHE_TIMEOUT)
+            return data
+
+        serializer_class.to_representation = cached_to_representation
+        return serializer_class
+
+    return decorator
+
+
+def _pin_namespace_versions(serializer):
+    # a list of cached representations looks each namespace version up once
+    return pinned_namespace_versions()
+
+
+serializer_hooks.append(_pin_namespace_versions)
@@ -0,0 +1,28 @@
+# Third-Party Imports
+from jet.dashboard.dashboard import DefaultIndexDashboard
+from jet.dashboard.modules import DashboardModule
+
+# App Imports
+from api.perf import recorder
+
+
+class PerformanceModule(DashboardModule):
+    """The slowest API views sampled by `PerformanceMiddleware`."""
+
+    title = 'Slowest API endpoints'
+    template = 'api/dashboard/performance.html'
+    limit = 10
+
+    def __init__(self, title=None, limit=10, **kwargs):
+        kwargs.update({'limit': limit})
+        super().__init__(title, **kwargs)
+
+    def init_with_context(self, context):
+        self.children = recorder.summary()['views'][: self.limit]
+
+
+class IndexDashboard(DefaultIndexDashboard):
+    def init_with_context(self, context):
+        super().init_with_context(context)
+        self.available_children.append(PerformanceModule)
+        self.children.append(PerformanceModule(column=2, order=1))
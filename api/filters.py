@@ -6,12 +6,15 @@ from django.db.models import Q
 from django_filters import rest_framework as filters
 
 # App Imports
+from core.constants import CHECKIN, CHECKOUT
 from core.models import Asset, User
 
 logger = logging.getLogger(__name__)
 
 NULL_VALUE = 'unspecified'
 
+CHECKIN_STATUS_CHOICES = (('checked_in', CHECKIN), ('checked_out', CHECKOUT))
+
 
 class BaseFilter(filters.FilterSet):
     def filter_with_multiple_query_values(self, queryset, name, value):
@@ -28,6 +31,12 @@ class AssetFilter(BaseFilter):
     email = filters.CharFilter(
         field_name='assigned_to__user__email', lookup_expr='icontains'
     )
+    email_prefix = filters.CharFilter(
+        field_name='assigned_to__user__email', lookup_expr='istartswith'
+    )
+    assignee = filters.CharFilter(
+        label='Assignee email or name', method='filter_by_assignee'
+    )
     model_number = filters.CharFilter(
         field_name='model_number__model_number',
         lookup_expr='iexact',
@@ -42,10 +51,39 @@ class AssetFilter(BaseFilter):
         field_name='current_status', lookup_expr='iexact'
     )
     verified = filters.CharFilter(field_name='verified', lookup_expr='iexact')
+    checkin_status = filters.ChoiceFilter(
+        label='Checkin status',
+        choices=CHECKIN_STATUS_CHOICES,
+        method='filter_by_checkin_status',
+    )
+
+    def filter_by_assignee(self, queryset, name, value):
+        """
+        Match the assignee's email, first name or last name. Each column has
+        its own trigram index on PostgreSQL (see migration 0038).
+        """
+        return queryset.filter(
+            Q(assigned_to__user__email__icontains=value)
+            | Q(assigned_to__user__first_name__icontains=value)
+            | Q(assigned_to__user__last_name__icontains=value)
+        )
+
+    def filter_by_checkin_status(self, queryset, name, value):
+        log_type = dict(CHECKIN_STATUS_CHOICES)[value]
+        return queryset.filter(last_log_type=log_type)
 
     class Meta:
         model = Asset
-        fields = ['asset_type', 'model_number', 'email', 'current_status', 'verified']
+        fields = [
+            'asset_type',
+            'model_number',
+            'email',
+            'email_prefix',
+            'assignee',
+            'current_status',
+            'verified',
+            'checkin_status',
+        ]
 
 
 class UserFilter(BaseFilter):
@@ -0,0 +1,95 @@
+# Standard Library
+import hashlib
+import json
+
+# Third-Party Imports
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+# App Imports
+from core.cache import make_key
+
+
+def response_etag(data):
+    """
+    The ETag of response data, the same in every worker process that
+    renders the same data.
+    """
+    content = json.dumps(data, cls=JSONEncoder, sort_keys=True)
+    return quote_etag(hashlib.md5(content.encode()).hexdigest())
+
+
+def cached_response(view, request, namespaces, get_response, vary_on=()):
+    """
+    Serve a GET response from the cache, keyed on the versions of
+    `namespaces`, the view, the URL and `vary_on`, and answer conditional GETs
+    with 304 while the client's ETag still matches the response data.
+    """
+    key = make_key(
+        namespaces,
+        view.__class__.__name__,
+        request.get_host(),
+        request.get_full_path(),
+        *vary_on
+    )
+    cached = cache.get(key)
+    if cached is None:
+        response = get_response()
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        etag = response_etag(response.data)
+        cache.set(key, (etag, response.data), settings.API_CACHE_TIMEOUT)
+    else:
+        etag, data = cached
+        response = Response(data)
+    if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    if etag in if_none_match or '*' in if_none_match:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ('Authorization',))
+    return response
+
+
+class CachedResponseMixin:
+    """
+    Serve GET responses from a versioned cache namespace and answer
+    conditional GETs with 304 while the client's ETag is still current.
+    Writes to the namespace's models bump its version (see core.signals).
+    """
+
+    cache_namespace = None
+
+    def get_cached_response(self, request, get_response):
+        return cached_response(self, request, self.cache_namespace, get_response)
+
+
+class CachedListMixin(CachedResponseMixin):
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(
+            request, lambda: super(CachedListMixin, self).list(request, *args, **kwargs)
+        )
+
+
+class RelatedFieldsMixin:
+    """
+    Load the relations a viewset's serializer reads together with its rows.
+    Viewsets list foreign keys in `select_related_fields` and reverse or
+    many-to-many relations in `prefetch_related_fields`.
+    """
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_related_fields)
+        return queryset
@@ -0,0 +1,112 @@
+# Standard Library
+import logging
+import sys
+from collections import Counter
+from contextlib import contextmanager
+
+# Third-Party Imports
+from django.conf import settings
+from rest_framework import serializers
+
+# App Imports
+from api.perf import _wrap_queries, serializer_hooks
+
+logger = logging.getLogger(__name__)
+
+LOG = 'log'
+RAISE = 'raise'
+
+_to_representation = serializers.Serializer.to_representation.__code__
+
+
+class NPlusOneError(Exception):
+    """Raised in NPLUSONE_MODE 'raise' when a serializer repeats a query."""
+
+
+def _field_path():
+    """
+    Name the serializer fields being rendered, outermost first, from the
+    `Serializer.to_representation` frames on the stack.
+    """
+    names = []
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code is _to_representation:
+            serializer = frame.f_locals.get('self')
+            field = frame.f_locals.get('field')
+            name = type(serializer).__name__
+            if field is not None:
+                name = '{}.{}'.format(name, field.field_name)
+            names.append(name)
+        frame = frame.f_back
+    return ' > '.join(reversed(names))
+
+
+def _ignored(path):
+    return any(name in settings.NPLUSONE_IGNORE for name in path.split(' > '))
+
+
+class QueryShapeCounter:
+    """Count the queries made per field path and SQL text."""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        self.counts[_field_path(), sql] += 1
+        return execute(sql, params, many, context)
+
+    def repeated(self, threshold):
+        return [
+            (path, sql, count)
+            for (path, sql), count in self.counts.items()
+            if count >= threshold and not _ignored(path)
+        ]
+
+
+def _report(serializer, repeated):
+    for path, sql, count in repeated:
+        logger.warning(
+            'N+1 queries in %s: %s identical queries',
+            path,
+            count,
+            extra={
+                'nplusone': {
+                    'serializer': type(serializer).__name__,
+                    'field': path,
+                    'queries': count,
+                    'sql': sql,
+                }
+            },
+        )
+    if settings.NPLUSONE_MODE == RAISE:
+        raise NPlusOneError(
+            '\n'.join(
+                '{} made {} identical queries: {}'.format(path, count, sql)
+                for path, sql, count in repeated
+            )
+        )
+
+
+@contextmanager
+def detect_repeated_queries(serializer):
+    """
+    Watch the queries made while `serializer` is evaluated and report every
+    query that one field makes NPLUSONE_THRESHOLD or more times with only
+    its parameters changing.
+    """
+    counter = QueryShapeCounter()
+    with _wrap_queries(counter):
+        yield
+    repeated = counter.repeated(settings.NPLUSONE_THRESHOLD)
+    if repeated:
+        _report(serializer, repeated)
+
+
+def _detector(serializer):
+    if settings.NPLUSONE_MODE in (LOG, RAISE):
+        return detect_repeated_queries(serializer)
+    return None
+
+
+serializer_hooks.append(_detector)
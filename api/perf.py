@@ -0,0 +1,309 @@
+# Standard Library
+import os
+import random
+import socket
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager, ExitStack
+from copy import deepcopy
+
+# Third-Party Imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from rest_framework import serializers
+
+# App Imports
+from core import metrics
+
+# bucket upper bounds; one more bucket counts everything above the last
+TIME_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+SIZE_BUCKETS = (1 << 10, 10 << 10, 100 << 10, 1 << 20, 10 << 20)
+
+METRICS = {
+    'queries': QUERY_BUCKETS,
+    'sql_ms': TIME_BUCKETS,
+    'serializer_ms': TIME_BUCKETS,
+    'total_ms': TIME_BUCKETS,
+    'response_bytes': SIZE_BUCKETS,
+}
+
+WORKERS_KEY = 'art:perf:workers'
+WORKER_KEY = 'art:perf:worker:{}'
+
+_local = threading.local()
+
+
+def _new_histogram(metric):
+    return {'count': 0, 'sum': 0, 'max': 0, 'buckets': [0] * (len(METRICS[metric]) + 1)}
+
+
+def _observe(histogram, metric, value):
+    histogram['count'] += 1
+    histogram['sum'] += value
+    histogram['max'] = max(histogram['max'], value)
+    histogram['buckets'][bisect_left(METRICS[metric], value)] += 1
+
+
+def _merge(into, histogram):
+    into['count'] += histogram['count']
+    into['sum'] += histogram['sum']
+    into['max'] = max(into['max'], histogram['max'])
+    into['buckets'] = [a + b for a, b in zip(into['buckets'], histogram['buckets'])]
+
+
+def _quantile(histogram, metric, fraction):
+    """
+    Estimate a quantile as the upper bound of the bucket it falls in,
+    capped at the largest value seen.
+    """
+    rank = fraction * histogram['count']
+    seen = 0
+    for bound, count in zip(
+        METRICS[metric] + (histogram['max'],), histogram['buckets']
+    ):
+        seen += count
+        if count and seen >= rank:
+            return min(bound, histogram['max'])
+    return histogram['max']
+
+
+def _summarise(histogram, metric):
+    count = histogram['count']
+    bounds = [str(bound) for bound in METRICS[metric]] + ['+Inf']
+    return {
+        'mean': round(histogram['sum'] / count, 2) if count else 0,
+        'p50': _quantile(histogram, metric, 0.5),
+        'p95': _quantile(histogram, metric, 0.95),
+        'max': histogram['max'],
+        'buckets': dict(zip(bounds, histogram['buckets'])),
+    }
+
+
+class PerformanceRecorder:
+    """
+    Rolling per-view histograms for this process, bucketed into windows of
+    PERF_WINDOW_SECONDS of which the last PERF_WINDOWS are kept.
+
+    Every PERF_FLUSH_INTERVAL seconds the windows are copied to the cache,
+    so any worker sharing that cache can report on all of them.
+    """
+
+    def __init__(self):
+        self.worker = '{}:{}'.format(socket.gethostname(), os.getpid())
+        self.lock = threading.Lock()
+        self.windows = {}
+        self.flushed_at = 0
+
+    @property
+    def retention(self):
+        return settings.PERF_WINDOW_SECONDS * settings.PERF_WINDOWS
+
+    def record(self, view, sample):
+        now = time.time()
+        window = int(now // settings.PERF_WINDOW_SECONDS)
+        with self.lock:
+            views = self.windows.setdefault(window, {})
+            if view not in views:
+                views[view] = {metric: _new_histogram(metric) for metric in METRICS}
+            for metric, value in sample.items():
+                _observe(views[view][metric], metric, value)
+            oldest = window - settings.PERF_WINDOWS
+            for expired in [start for start in self.windows if start <= oldest]:
+                del self.windows[expired]
+        if now - self.flushed_at >= settings.PERF_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            windows = deepcopy(self.windows)
+        self.flushed_at = time.time()
+        cache.set(WORKER_KEY.format(self.worker), windows, self.retention)
+        workers = cache.get(WORKERS_KEY) or set()
+        if self.worker not in workers:
+            cache.set(WORKERS_KEY, workers | {self.worker}, None)
+
+    def summary(self):
+        """
+        Merge the windows of every worker still reporting and summarise each
+        view, slowest total time first.
+        """
+        self.flush()
+        workers = cache.get(WORKERS_KEY) or {self.worker}
+        reports = cache.get_many([WORKER_KEY.format(worker) for worker in workers])
+        if len(reports) < len(workers):
+            # forget workers whose windows have expired
+            cache.set(
+                WORKERS_KEY,
+                {worker for worker in workers if WORKER_KEY.format(worker) in reports},
+                None,
+            )
+
+        oldest = (
+            int(time.time() // settings.PERF_WINDOW_SECONDS) - settings.PERF_WINDOWS
+        )
+        merged = {}
+        for windows in reports.values():
+            for start, views in windows.items():
+                if start <= oldest:
+                    continue
+                for view, histograms in views.items():
+                    if view not in merged:
+                        merged[view] = {
+                            metric: _new_histogram(metric) for metric in METRICS
+                        }
+                    for metric, histogram in histograms.items():
+                        _merge(merged[view][metric], histogram)
+
+        rows = [
+            dict(
+                {'view': view, 'requests': histograms['total_ms']['count']},
+                **{
+                    metric: _summarise(histogram, metric)
+                    for metric, histogram in histograms.items()
+                }
+            )
+            for view, histograms in merged.items()
+        ]
+        rows.sort(key=lambda row: -merged[row['view']]['total_ms']['sum'])
+        return {
+            'window_seconds': self.retention,
+            'sample_rate': settings.PERF_SAMPLE_RATE,
+            'workers': len(reports),
+            'views': rows,
+        }
+
+
+recorder = PerformanceRecorder()
+
+
+# callables given the serializer whose `.data` is about to be evaluated;
+# each may return a context manager to run around the evaluation
+serializer_hooks = []
+
+
+def instrument_serializers():
+    """
+    Run `serializer_hooks` around the outermost `.data` evaluation of every
+    serializer. Serializers used inside another one are part of the outer
+    evaluation.
+    """
+    data = serializers.BaseSerializer.data
+    if getattr(data.fget, 'instrumented', False):
+        return
+
+    def instrumented_data(self):
+        if getattr(_local, 'serializing', False):
+            return data.fget(self)
+        with ExitStack() as stack:
+            for hook in serializer_hooks:
+                manager = hook(self)
+                if manager is not None:
+                    stack.enter_context(manager)
+            _local.serializing = True
+            try:
+                return data.fget(self)
+            finally:
+                _local.serializing = False
+
+    instrumented_data.instrumented = True
+    serializers.BaseSerializer.data = property(instrumented_data)
+
+
+@contextmanager
+def _time_serializer(sample):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        sample['serializer_ms'] += (time.perf_counter() - start) * 1000
+
+
+def _sampled_serializer_timer(serializer):
+    sample = getattr(_local, 'sample', None)
+    return _time_serializer(sample) if sample is not None else None
+
+
+serializer_hooks.append(_sampled_serializer_timer)
+
+
+@contextmanager
+def _wrap_queries(wrapper):
+    """Pass every query made in the block, on any database, through `wrapper`."""
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(wrapper))
+        yield
+
+
+def _view_name(request):
+    match = request.resolver_match
+    return match.view_name if match else 'unresolved'
+
+
+def _time_query(sample, execute, sql, params, many, context):
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        sample['queries'] += 1
+        sample['sql_ms'] += (time.perf_counter() - start) * 1000
+
+
+def _count_query(counter, execute, sql, params, many, context):
+    counter[0] += 1
+    return execute(sql, params, many, context)
+
+
+class PerformanceMiddleware:
+    """
+    Record the query count, SQL time, serializer time, total time and
+    response size of a PERF_SAMPLE_RATE fraction of requests, per view.
+
+    Queries made while a streaming response is consumed are not counted.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if random.random() >= settings.PERF_SAMPLE_RATE:
+            return self.get_response(request)
+
+        sample = {'queries': 0, 'sql_ms': 0.0, 'serializer_ms': 0.0}
+        _local.sample = sample
+        start = time.perf_counter()
+        try:
+            with _wrap_queries(lambda *args: _time_query(sample, *args)):
+                response = self.get_response(request)
+        finally:
+            _local.sample = None
+        sample['total_ms'] = (time.perf_counter() - start) * 1000
+        if not response.streaming:
+            sample['response_bytes'] = len(response.content)
+
+        recorder.record('{} {}'.format(request.method, _view_name(request)), sample)
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Count the latency, database queries and response status of every
+    request, per route, for the /metrics endpoint.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = [0]
+        start = time.perf_counter()
+        with _wrap_queries(lambda *args: _count_query(queries, *args)):
+            response = self.get_response(request)
+        labels = {'method': request.method, 'route': _view_name(request)}
+        metrics.REQUEST_DURATION.observe(time.perf_counter() - start, **labels)
+        metrics.REQUEST_QUERIES.observe(queries[0], **labels)
+        metrics.RESPONSES.inc(status=response.status_code, **labels)
+        return response
@@ -0,0 +1,56 @@
+# Standard Library
+import csv
+import io
+import json
+
+# Third-Party Imports
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+
+class Echo:
+    """
+    File-like object whose write() hands back the value, letting csv.writer
+    produce one encoded line at a time for streaming responses.
+    """
+
+    def write(self, value):
+        return value
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Declares the `csv` format so `?format=csv` passes content negotiation.
+    Export views stream their own body; this only renders error payloads.
+    """
+
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not isinstance(data, dict):
+            data = {'detail': data}
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(data.keys())
+        writer.writerow(data.values())
+        return buffer.getvalue().encode(self.charset)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Declares the `ndjson` (newline delimited JSON) format so `?format=ndjson`
+    passes content negotiation. Renders error payloads as a single line.
+    """
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return (json.dumps(data, cls=DjangoJSONEncoder) + '\n').encode(self.charset)
@@ -14,6 +14,7 @@ from .assets import (  # noqa: F401
     AssetConditionSerializer,
     AssetHealthSerializer,
     AssetIncidentReportSerializer,
+    AssetLogBatchSerializer,
     AssetLogSerializer,
     AssetMakeSerializer,
     AssetModelNumberSerializer,
@@ -22,6 +23,8 @@ from .assets import (  # noqa: F401
     AssetStatusSerializer,
     AssetSubCategorySerializer,
     AssetTypeSerializer,
+    BulkAllocationSerializer,
+    BulkAssetStatusSerializer,
 )
 from .users import (  # noqa: F401
     SecurityUserEmailsSerializer,
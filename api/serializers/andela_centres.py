@@ -3,6 +3,7 @@ from pycountry import countries
 from rest_framework import serializers
 
 # App Imports
+from api.caching import cache_representation
 from core import models
 
 
@@ -24,6 +25,7 @@ class OfficeFloorSectionSerializer(serializers.ModelSerializer):
         fields = ("name", "floor", "id")
 
 
+@cache_representation(models.OfficeFloorSection, models.OfficeFloor, models.OfficeBlock)
 class OfficeWorkspaceSerializer(serializers.ModelSerializer):
     floor = serializers.SerializerMethodField()
     block = serializers.SerializerMethodField()
@@ -1,10 +1,17 @@
+# Standard Library
+from datetime import timedelta
+
 # Third-Party Imports
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.utils import timezone
 from rest_framework import serializers
 
 # App Imports
-from core import models
-from core.constants import CHECKIN, CHECKOUT
+from core import constants, models
+
+STATUS_HISTORY_LENGTH = 20
 
 
 class AssetSerializer(serializers.ModelSerializer):
@@ -64,18 +71,7 @@ class AssetSerializer(serializers.ModelSerializer):
         return obj.model_number.make_label
 
     def get_checkin_status(self, obj):
-        try:
-            asset_log = (
-                models.AssetLog.objects.filter(asset=obj)
-                .order_by('-created_at')
-                .first()
-            )
-            if asset_log.log_type == CHECKIN:
-                return "checked_in"
-            elif asset_log.log_type == CHECKOUT:
-                return "checked_out"
-        except AttributeError:
-            return None
+        return obj.checkin_status
 
     def get_assigned_to(self, obj):
         if not obj.assigned_to:
@@ -91,7 +87,11 @@ class AssetSerializer(serializers.ModelSerializer):
         elif obj.assigned_to.user:
             from api.serializers import UserSerializer
 
-            serialized_data = UserSerializer(obj.assigned_to.user)
+            user = obj.assigned_to.user
+            if hasattr(obj, 'assignee_asset_count'):
+                # counted with the asset by annotate_assignee_asset_count
+                user.allocated_asset_count = obj.assignee_asset_count
+            serialized_data = UserSerializer(user)
         else:
             return None
         return serialized_data.data
@@ -113,7 +113,7 @@ class AssetSerializer(serializers.ModelSerializer):
         return asset_make.asset_type.asset_type
 
     def get_allocation_history(self, obj):
-        allocations = models.AllocationHistory.objects.filter(asset=obj.id)
+        allocations = obj.allocationhistory_set.all()
         return [
             {
                 "id": allocation.id,
@@ -169,47 +169,91 @@ class AssetLogSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         instance_data = super().to_representation(instance)
-        asset = models.Asset.objects.get(id=instance.asset.id)
-        serial_no = asset.serial_number
-        asset_code = asset.asset_code
+        serial_no = instance.asset.serial_number
+        asset_code = instance.asset.asset_code
         instance_data['checked_by'] = instance.checked_by.email
         instance_data['asset'] = f"{serial_no} - {asset_code}"
         return instance_data
 
 
-class AssetStatusSerializer(AssetSerializer):
-    status_history = serializers.SerializerMethodField()
+def include_requested(serializer, name):
+    """Whether `?include=` on the serializer's request lists `name`."""
+    request = serializer.context.get('request')
+    if request is None:
+        return False
+    return name in request.query_params.get('include', '').split(',')
+
+
+def status_history_by_status(status_ids):
+    """
+    Load the earlier status records of the assets of the given status
+    records in one query, at most STATUS_HISTORY_LENGTH per record and newest
+    first. Returns {status id: [record, ...]}.
+    """
+    history = {status_id: [] for status_id in status_ids}
+    if not history:
+        return history
+    table = connection.ops.quote_name(models.AssetStatus._meta.db_table)
+    records = models.AssetStatus.objects.raw(
+        'SELECT * FROM (SELECT earlier.*, later.id AS status_id, row_number() '
+        'OVER (PARTITION BY later.id ORDER BY earlier.created_at DESC, '
+        'earlier.id DESC) AS position FROM {table} later JOIN {table} earlier '
+        'ON earlier.asset_id = later.asset_id '
+        'AND earlier.created_at < later.created_at WHERE later.id IN ({ids})) '
+        'history WHERE position <= %s ORDER BY status_id, position'.format(
+            table=table, ids=', '.join(['%s'] * len(history))
+        ),
+        [*history, STATUS_HISTORY_LENGTH],
+    )
+    for record in records:
+        history[record.status_id].append(
+            {
+                'id': record.id,
+                'asset': record.asset_id,
+                'current_status': record.current_status,
+                'previous_status': record.previous_status,
+                'created_at': record.created_at,
+            }
+        )
+    return history
+
+
+class AssetStatusListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        if include_requested(self, 'history'):
+            statuses = list(data.all() if hasattr(data, 'all') else data)
+            self.context['status_history'] = status_history_by_status(
+                [status.id for status in statuses]
+            )
+            data = statuses
+        return super().to_representation(data)
+
+
+class AssetStatusSerializer(serializers.ModelSerializer):
+    """
+    Status records, with the asset's earlier records (newest first, at
+    most STATUS_HISTORY_LENGTH) under `status_history` when the request
+    asks for `?include=history`.
+    """
 
     class Meta:
         model = models.AssetStatus
-        fields = (
-            "id",
-            "asset",
-            "current_status",
-            "status_history",
-            "previous_status",
-            "created_at",
-        )
+        fields = ("id", "asset", "current_status", "previous_status", "created_at")
+        list_serializer_class = AssetStatusListSerializer
 
     def get_status_history(self, obj):
-        asset_status = models.AssetStatus.objects.filter(asset=obj.asset)
-        return [
-            {
-                "id": asset.id,
-                "asset": asset.asset_id,
-                "current_status": asset.current_status,
-                "previous_status": asset.previous_status,
-                "created_at": asset.created_at,
-            }
-            for asset in asset_status
-            if obj.created_at > asset.created_at
-        ]
+        history = self.context.get('status_history', {})
+        if obj.id not in history:
+            history = status_history_by_status([obj.id])
+        return history[obj.id]
 
     def to_representation(self, instance):
         instance_data = super().to_representation(instance)
         serial_no = instance.asset.serial_number
         asset_code = instance.asset.asset_code
         instance_data['asset'] = f"{asset_code} - {serial_no}"
+        if include_requested(self, 'history'):
+            instance_data['status_history'] = self.get_status_history(instance)
         return instance_data
 
 
@@ -232,6 +276,75 @@ class AllocationsSerializer(serializers.ModelSerializer):
         return instance_data
 
 
+class BulkAllocationItemSerializer(serializers.Serializer):
+    asset = serializers.IntegerField()
+    current_owner = serializers.IntegerField()
+
+
+def validate_batch_size(value):
+    if len(value) > settings.BULK_OPERATION_MAX_ITEMS:
+        raise serializers.ValidationError(
+            'Ensure this field has no more than {} elements.'.format(
+                settings.BULK_OPERATION_MAX_ITEMS
+            )
+        )
+    return value
+
+
+class BulkAllocationSerializer(serializers.Serializer):
+    allocations = BulkAllocationItemSerializer(many=True, allow_empty=False)
+
+    def validate_allocations(self, value):
+        return validate_batch_size(value)
+
+
+class AssetLogScanSerializer(serializers.Serializer):
+    asset = serializers.CharField(max_length=50, help_text='Asset code or serial')
+    log_type = serializers.ChoiceField(choices=constants.ASSET_LOG_CHOICES)
+    client_timestamp = serializers.DateTimeField()
+    idempotency_key = serializers.CharField(max_length=64)
+
+    def validate_client_timestamp(self, value):
+        # a scan dated ahead would stay the asset's latest until that date
+        latest = timezone.now() + timedelta(seconds=settings.SCAN_CLOCK_SKEW_SECONDS)
+        if value > latest:
+            raise serializers.ValidationError(
+                'Scan time is in the future; check the scanner\'s clock.'
+            )
+        return value
+
+
+class AssetLogBatchSerializer(serializers.Serializer):
+    scans = AssetLogScanSerializer(many=True, allow_empty=False)
+
+    def validate_scans(self, value):
+        return validate_batch_size(value)
+
+
+class AssetIdentifierField(serializers.Field):
+    """An asset id (integer) or asset code (string)."""
+
+    default_error_messages = {'invalid': 'Enter an asset id or asset code.'}
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool) or not isinstance(data, (int, str)) or data == '':
+            self.fail('invalid')
+        return data
+
+    def to_representation(self, value):
+        return value
+
+
+class BulkAssetStatusSerializer(serializers.Serializer):
+    assets = serializers.ListField(child=AssetIdentifierField(), allow_empty=False)
+    current_status = serializers.ChoiceField(
+        choices=[constants.AVAILABLE, constants.LOST, constants.DAMAGED]
+    )
+
+    def validate_assets(self, value):
+        return validate_batch_size(value)
+
+
 class AssetCategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = models.AssetCategory
@@ -282,9 +395,8 @@ class AssetModelNumberSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         instance_data = super().to_representation(instance)
-        instance_data['make_label'] = models.AssetMake.objects.get(
-            id=instance.make_label.id
-        ).make_label
+        make_label = instance.make_label
+        instance_data['make_label'] = make_label.make_label if make_label else None
         return instance_data
 
     def to_internal_value(self, data):
@@ -368,6 +480,7 @@ class AssetIncidentReportSerializer(serializers.ModelSerializer):
             'witnesses',
             'submitted_by',
             'police_abstract_obtained',
+            'created_at',
         )
 
     def get_submitted_by(self, instance):
@@ -46,6 +46,8 @@ class UserSerializer(serializers.ModelSerializer):
         an instance of the AssetAssignee when /api/v1/manage-assets is loaded
 
         """
+        if hasattr(obj, 'allocated_asset_count'):
+            return obj.allocated_asset_count
         try:
             return obj.assetassignee.asset_set.count()
         except AttributeError:
@@ -70,7 +72,11 @@ class UserSerializerWithAssets(UserSerializer):
     def get_allocated_assets(self, obj):
         from .assets import AssetSerializer
 
-        assets = models.Asset.objects.filter(assigned_to__user=obj)
+        try:
+            # prefetched by UserViewSet
+            assets = obj.assetassignee.asset_set.all()
+        except models.AssetAssignee.DoesNotExist:
+            assets = models.Asset.objects.none()
         serialized_assets = AssetSerializer(assets, many=True)
         return serialized_assets.data
 
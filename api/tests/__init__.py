@@ -5,7 +5,7 @@ from unittest.mock import patch
 # Third-Party Imports
 from django.apps import apps
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import override_settings, TestCase
 from rest_framework.reverse import reverse
 
 # App Imports
@@ -16,6 +16,7 @@ logging.disable(logging.WARNING)
 User = get_user_model()
 
 
+@override_settings(NPLUSONE_MODE='raise')
 class APIBaseTestCase(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -8,7 +8,14 @@ from rest_framework.test import APIClient
 
 # App Imports
 from api.tests import APIBaseTestCase
-from core.models import AllocationHistory, AssetAssignee, Department, OfficeWorkspace
+from core.models import (
+    AllocationHistory,
+    Asset,
+    AssetAssignee,
+    AssetStatus,
+    Department,
+    OfficeWorkspace,
+)
 
 User = get_user_model()
 client = APIClient()
@@ -113,3 +120,100 @@ class AllocationTestCase(APIBaseTestCase):
         self.assertEqual(response.data['current_status'], 'Allocated')
         self.assertEqual(response.data['serial_number'], self.asset.serial_number)
         self.assertEqual(response.status_code, 200)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_bulk_allocation_of_assets(self, mock_verify_id_token):
+        """Test allocating several assets in one request"""
+        department = Department.objects.create(name="Fellowship")
+        department_assignee = AssetAssignee.objects.get(department=department)
+        history_count = AllocationHistory.objects.count()
+        status_count = AssetStatus.objects.count()
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        data = {
+            'allocations': [
+                {'asset': self.asset.id, 'current_owner': self.asset_assignee.id},
+                {'asset': self.asset_1.id, 'current_owner': department_assignee.id},
+            ]
+        }
+        response = client.post(
+            reverse('allocations-bulk'),
+            data,
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [result['current_owner'] for result in response.data['results']],
+            [self.user.email, department.name],
+        )
+        self.assertEqual(AllocationHistory.objects.count(), history_count + 2)
+        self.assertEqual(AssetStatus.objects.count(), status_count + 2)
+        asset = Asset.objects.get(id=self.asset.id)
+        self.assertEqual(asset.current_status, 'Allocated')
+        self.assertEqual(asset.assigned_to, self.asset_assignee)
+        self.assertIn(self.user.email, asset.search_text)
+        self.assertEqual(
+            Asset.objects.get(id=self.asset_1.id).assigned_to, department_assignee
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_bulk_allocation_is_rejected_if_any_item_is_invalid(
+        self, mock_verify_id_token
+    ):
+        """Test nothing is allocated when one item in the batch is invalid"""
+        history_count = AllocationHistory.objects.count()
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        data = {
+            'allocations': [
+                {'asset': self.asset.id, 'current_owner': self.asset_assignee.id},
+                {'asset': self.asset.id, 'current_owner': self.asset_assignee.id},
+                {'asset': self.asset_1.id, 'current_owner': 0},
+            ]
+        }
+        response = client.post(
+            reverse('allocations-bulk'),
+            data,
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.status_code, 400)
+        errors = response.data['allocations']
+        self.assertEqual(errors[0], {})
+        self.assertIn('asset', errors[1])
+        self.assertIn('current_owner', errors[2])
+        self.assertEqual(AllocationHistory.objects.count(), history_count)
+        self.assertEqual(
+            Asset.objects.get(id=self.asset.id).current_status, 'Available'
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_bulk_allocation_query_count_does_not_grow_with_batch(
+        self, mock_verify_id_token
+    ):
+        """Test the number of queries is independent of the batch size"""
+        assets = [
+            Asset.objects.create(
+                asset_code="IC0099{}".format(i),
+                serial_number="SN0099{}".format(i),
+                model_number=self.assetmodel,
+            )
+            for i in range(5)
+        ]
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        data = {
+            'allocations': [
+                {'asset': asset.id, 'current_owner': self.asset_assignee.id}
+                for asset in assets
+            ]
+        }
+        # authentication, the savepoint pair, six queries for the batch and
+        # six for the inventory summary: two increments, then the asset type
+        # lookup and the first Allocated row with its savepoint pair
+        with self.assertNumQueries(15):
+            response = client.post(
+                reverse('allocations-bulk'),
+                data,
+                format='json',
+                HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            )
+        self.assertEqual(response.status_code, 201)
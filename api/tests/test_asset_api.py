@@ -334,3 +334,69 @@ class AssetTestCase(APIBaseTestCase):
         )
         self.assertEqual(response.data['count'], count + 1)
         self.assertEqual(response.status_code, 200)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_search_assets_by_partial_asset_code(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.security_user.email}
+        response = client.get(
+            "{}?q={}".format(reverse('assets-search'), 'c0014'),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_checked_by),
+        )
+        self.assertEqual(response.status_code, 200)
+        codes = [asset['asset_code'] for asset in response.data['results']]
+        self.assertIn(self.asset.asset_code, codes)
+        self.assertIn(self.asset_1.asset_code, codes)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_search_ranks_exact_code_match_first(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.security_user.email}
+        response = client.get(
+            "{}?q={}".format(reverse('assets-search'), self.asset_1.asset_code),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_checked_by),
+        )
+        self.assertEqual(
+            response.data['results'][0]['asset_code'], self.asset_1.asset_code
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_search_assets_by_model_and_assignee(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.security_user.email}
+        response = client.get(
+            "{}?q={} {}".format(
+                reverse('assets-search'), self.assetmodel.model_number, self.user.email
+            ),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_checked_by),
+        )
+        codes = [asset['asset_code'] for asset in response.data['results']]
+        self.assertEqual(codes, [self.asset.asset_code])
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_search_only_returns_own_assets_for_normal_users(
+        self, mock_verify_id_token
+    ):
+        mock_verify_id_token.return_value = {'email': self.other_user.email}
+        response = client.get(
+            "{}?q={}".format(reverse('assets-search'), self.asset.asset_code),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_other_user),
+        )
+        self.assertEqual(response.data['count'], 0)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_search_assets_requires_query(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.security_user.email}
+        response = client.get(
+            reverse('assets-search'),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_checked_by),
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {'q': ['This field is required.']})
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_admin_searches_all_assets_in_their_centre(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        response = client.get(
+            "{}?q={}".format(reverse('assets-search'), self.asset_1.serial_number),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_admin),
+        )
+        codes = [asset['asset_code'] for asset in response.data['results']]
+        self.assertEqual(codes, [self.asset_1.asset_code])
@@ -6,6 +6,7 @@ from rest_framework.test import APIClient
 
 # App Imports
 from api.tests import APIBaseTestCase
+from core.cache import bump_namespace_version, TAXONOMY
 from core.models import AssetCategory
 
 client = APIClient()
@@ -102,3 +103,60 @@ class AssetCategoryAPITest(APIBaseTestCase):
         self.assertEqual(
             response.data.get('results')[2].get('category_name'), "Electronics"
         )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_categories_list_returns_etag_and_304_when_unchanged(
+        self, mock_verify_token
+    ):
+        mock_verify_token.return_value = {'email': self.user.email}
+        response = client.get(
+            self.category_url, HTTP_AUTHORIZATION="Token {}".format(self.token_user)
+        )
+        etag = response['ETag']
+        response = client.get(
+            self.category_url,
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_categories_etag_depends_on_the_data_only(self, mock_verify_token):
+        mock_verify_token.return_value = {'email': self.user.email}
+        response = client.get(
+            self.category_url, HTTP_AUTHORIZATION="Token {}".format(self.token_user)
+        )
+        etag = response['ETag']
+        # as seen by a worker whose cache version of the list differs
+        bump_namespace_version(TAXONOMY)
+        response = client.get(
+            self.category_url,
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 304)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_cached_categories_list_is_invalidated_on_write(self, mock_verify_token):
+        mock_verify_token.return_value = {'email': self.user.email}
+        response = client.get(
+            self.category_url, HTTP_AUTHORIZATION="Token {}".format(self.token_user)
+        )
+        etag = response['ETag']
+        count = response.data['count']
+        with self.assertNumQueries(1):
+            # only the user lookup done during authentication
+            client.get(
+                self.category_url, HTTP_AUTHORIZATION="Token {}".format(self.token_user)
+            )
+
+        AssetCategory.objects.create(category_name="Furniture")
+        response = client.get(
+            self.category_url,
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['count'], count + 1)
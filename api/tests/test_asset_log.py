@@ -1,9 +1,12 @@
 # Standard Library
+from datetime import timedelta
 from unittest.mock import patch
 
 # Third-Party Imports
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.utils import timezone
+from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
 # App Imports
@@ -124,6 +127,23 @@ class AssetLogModelTest(APIBaseTestCase):
         self.assertEqual(len(response.data['results']), AssetLog.objects.count())
         self.assertEqual(response.status_code, 200)
 
+    @patch('api.authentication.auth.verify_id_token')
+    def test_security_user_list_query_count_does_not_grow_with_logs(
+        self, mock_verify_id_token
+    ):
+        mock_verify_id_token.return_value = {'email': self.security_user.email}
+        for log_type in ('Checkin', 'Checkout', 'Checkin'):
+            AssetLog.objects.create(
+                checked_by=self.security_user, asset=self.asset_1, log_type=log_type
+            )
+        # user, security user and centre lookups, the count and the page
+        with self.assertNumQueries(5):
+            response = client.get(
+                self.asset_logs_url,
+                HTTP_AUTHORIZATION="Token {}".format(self.token_checked_by),
+            )
+        self.assertEqual(len(response.data['results']), 5)
+
     @patch('api.authentication.auth.verify_id_token')
     def test_authenticated_normal_user_create_checkin(self, mock_verify_id_token):
         mock_verify_id_token.return_value = {'email': self.user.email}
@@ -245,3 +265,105 @@ class AssetLogModelTest(APIBaseTestCase):
         )
         self.assertEqual(response.data, {'detail': 'Method "PATCH" not allowed.'})
         self.assertEqual(response.status_code, 405)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_security_user_uploads_batch_of_scans(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.security_user.email}
+        count = AssetLog.objects.count()
+        data = {
+            'scans': [
+                {
+                    'asset': self.test_other_asset.serial_number.lower(),
+                    'log_type': 'Checkout',
+                    'client_timestamp': '2019-01-10T08:00:00Z',
+                    'idempotency_key': 'gate-1-0001',
+                },
+                {
+                    'asset': self.test_other_asset.asset_code,
+                    'log_type': 'Checkin',
+                    'client_timestamp': '2019-01-10T07:00:00Z',
+                    'idempotency_key': 'gate-1-0002',
+                },
+                {
+                    'asset': 'IC-UNKNOWN',
+                    'log_type': 'Checkin',
+                    'client_timestamp': '2019-01-10T07:30:00Z',
+                    'idempotency_key': 'gate-1-0003',
+                },
+            ]
+        }
+        response = client.post(
+            reverse('asset-logs-batch'),
+            data,
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_checked_by),
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result['status'] for result in response.data['results']],
+            ['created', 'created', 'error'],
+        )
+        self.assertEqual(AssetLog.objects.count(), count + 2)
+        # the latest scan wins, whatever order the queue was uploaded in
+        self.assertEqual(
+            Asset.objects.get(id=self.test_other_asset.id).checkin_status, 'checked_out'
+        )
+
+        response = client.post(
+            reverse('asset-logs-batch'),
+            data,
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_checked_by),
+        )
+        self.assertEqual(
+            [result['status'] for result in response.data['results']],
+            ['duplicate', 'duplicate', 'error'],
+        )
+        self.assertEqual(AssetLog.objects.count(), count + 2)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_future_dated_scans_cannot_block_later_scans(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.security_user.email}
+        count = AssetLog.objects.count()
+
+        def upload(log_type, client_timestamp, idempotency_key):
+            return client.post(
+                reverse('asset-logs-batch'),
+                {
+                    'scans': [
+                        {
+                            'asset': self.test_other_asset.asset_code,
+                            'log_type': log_type,
+                            'client_timestamp': client_timestamp.isoformat(),
+                            'idempotency_key': idempotency_key,
+                        }
+                    ]
+                },
+                format='json',
+                HTTP_AUTHORIZATION="Token {}".format(self.token_checked_by),
+            )
+
+        response = upload('Checkout', timezone.now() + timedelta(days=365), 'gate-2-1')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('future', str(response.data['scans'][0]['client_timestamp']))
+        self.assertEqual(AssetLog.objects.count(), count)
+
+        # a clock a little ahead of ours is allowed for
+        response = upload('Checkin', timezone.now() + timedelta(seconds=30), 'gate-2-2')
+        self.assertEqual(response.status_code, 200)
+        response = upload('Checkout', timezone.now() + timedelta(minutes=1), 'gate-2-3')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            Asset.objects.get(id=self.test_other_asset.id).checkin_status, 'checked_out'
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_normal_user_cannot_upload_batch_of_scans(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.post(
+            reverse('asset-logs-batch'),
+            {'scans': []},
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.status_code, 403)
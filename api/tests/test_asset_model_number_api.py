@@ -164,3 +164,22 @@ class AssetModelNumberAPITest(APIBaseTestCase):
         self.assertEqual(
             response.data.get('results')[2].get('model_number'), "XD6GRD6 Q3"
         )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_model_numbers_list_fetches_make_labels_in_one_query(
+        self, mock_verify_id_token
+    ):
+        for number in range(5):
+            AssetModelNumber.objects.create(
+                model_number="MN00{}".format(number), make_label=self.make_label
+            )
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        # user lookup, count and page; no per-row make label lookups
+        with self.assertNumQueries(3):
+            response = client.get(
+                self.asset_model_no_url,
+                HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            )
+        self.assertEqual(
+            response.data['results'][0]['make_label'], self.make_label.make_label
+        )
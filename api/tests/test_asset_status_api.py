@@ -3,11 +3,13 @@ from unittest.mock import patch
 
 # Third-Party Imports
 from django.contrib.auth import get_user_model
+from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
 # App Imports
+from api.serializers.assets import STATUS_HISTORY_LENGTH
 from api.tests import APIBaseTestCase
-from core.models import Asset
+from core.models import AllocationHistory, Asset, AssetStatus
 
 User = get_user_model()
 client = APIClient()
@@ -49,6 +51,61 @@ class AssetStatusAPITest(APIBaseTestCase):
         )
         self.assertEqual(response.status_code, 200)
 
+    @patch('api.authentication.auth.verify_id_token')
+    def test_asset_status_history_is_included_on_request(self, mock_verify_id_token):
+        for current_status in ('Damaged', 'Lost'):
+            AssetStatus.objects.create(
+                asset=Asset.objects.get(id=self.asset.id), current_status=current_status
+            )
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.get(
+            self.asset_status_urls,
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertNotIn('status_history', response.data['results'][0])
+
+        # user and centre lookups, the count, the page and the history
+        with self.assertNumQueries(5):
+            response = client.get(
+                '{}?include=history'.format(self.asset_status_urls),
+                HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            )
+        latest = response.data['results'][0]
+        self.assertEqual(latest['current_status'], 'Lost')
+        self.assertEqual(
+            [record['current_status'] for record in latest['status_history']],
+            ['Damaged', 'Available'],
+        )
+
+        response = client.get(
+            '{}/{}/?include=history'.format(
+                self.asset_status_urls, self.asset_status.id
+            ),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.data['status_history'], [])
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_asset_status_history_is_bounded(self, mock_verify_id_token):
+        asset = Asset.objects.get(id=self.asset.id)
+        statuses = [
+            AssetStatus.objects.create(asset=asset, current_status=current_status)
+            for current_status in ['Damaged', 'Available'] * 12
+        ]
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.get(
+            '{}/{}/?include=history'.format(self.asset_status_urls, statuses[-1].id),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+
+        history = response.data['status_history']
+        self.assertEqual(len(history), STATUS_HISTORY_LENGTH)
+        self.assertEqual(
+            [record['id'] for record in history],
+            [status.id for status in statuses[-2:-22:-1]],
+        )
+        self.assertEqual(history[0]['created_at'], statuses[-2].created_at)
+
     @patch('api.authentication.auth.verify_id_token')
     def test_authenticated_user_post_asset_status(self, mock_verify_id_token):
         mock_verify_id_token.return_value = {'email': self.user.email}
@@ -141,3 +198,96 @@ class AssetStatusAPITest(APIBaseTestCase):
         )
         self.assertEqual(response.data, {'detail': 'Method "DELETE" not allowed.'})
         self.assertEqual(response.status_code, 405)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_bulk_status_transition_by_id_and_code(self, mock_verify_id_token):
+        AllocationHistory.objects.create(
+            asset=Asset.objects.get(id=self.asset.id), current_owner=self.asset_assignee
+        )
+        history_count = AllocationHistory.objects.count()
+        status_count = AssetStatus.objects.count()
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.post(
+            reverse('asset-status-bulk'),
+            {
+                'assets': [self.asset.id, self.asset_1.asset_code.lower()],
+                'current_status': 'Damaged',
+            },
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(AssetStatus.objects.count(), status_count + 2)
+        self.assertEqual(
+            Asset.objects.get(id=self.asset_1.id).current_status, 'Damaged'
+        )
+
+        response = client.post(
+            reverse('asset-status-bulk'),
+            {'assets': [self.asset.id], 'current_status': 'Available'},
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.status_code, 201)
+        asset = Asset.objects.get(id=self.asset.id)
+        self.assertEqual(asset.current_status, 'Available')
+        self.assertIsNone(asset.assigned_to)
+        self.assertNotIn(self.user.email, asset.search_text)
+        self.assertEqual(AllocationHistory.objects.count(), history_count + 1)
+        self.assertEqual(
+            AllocationHistory.objects.filter(asset=asset)
+            .latest('created_at')
+            .previous_owner,
+            self.asset_assignee,
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_bulk_status_transition_rejects_invalid_assets(self, mock_verify_id_token):
+        status_count = AssetStatus.objects.count()
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.post(
+            reverse('asset-status-bulk'),
+            {
+                'assets': [self.asset.id, 'IC-MISSING', self.asset_1.id],
+                'current_status': 'Available',
+            },
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.status_code, 400)
+        errors = response.data['assets']
+        self.assertIn('already', errors[0]['asset'][0])
+        self.assertIn('does not exist', errors[1]['asset'][0])
+        self.assertEqual(AssetStatus.objects.count(), status_count)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_bulk_status_transition_rejects_ambiguous_codes(self, mock_verify_id_token):
+        Asset.objects.filter(id=self.asset.id).update(
+            asset_code=self.asset_1.asset_code.lower()
+        )
+        status_count = AssetStatus.objects.count()
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.post(
+            reverse('asset-status-bulk'),
+            {'assets': [self.asset_1.asset_code.lower()], 'current_status': 'Damaged'},
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(
+            'matches more than one asset', response.data['assets'][0]['asset'][0]
+        )
+        self.assertEqual(AssetStatus.objects.count(), status_count)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_bulk_status_transition_cannot_allocate(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.post(
+            reverse('asset-status-bulk'),
+            {'assets': [self.asset.id], 'current_status': 'Allocated'},
+            format='json',
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('current_status', response.data)
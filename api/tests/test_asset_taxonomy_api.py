@@ -0,0 +1,82 @@
+# Standard Library
+from unittest.mock import patch
+
+# Third-Party Imports
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+# App Imports
+from api.tests import APIBaseTestCase
+from core.models import AssetMake, AssetModelNumber
+
+client = APIClient()
+
+
+class AssetTaxonomyAPITest(APIBaseTestCase):
+    """Tests for the asset taxonomy tree endpoint"""
+
+    def setUp(self):
+        self.url = reverse('asset-taxonomy')
+
+    def test_non_authenticated_user_cannot_get_taxonomy(self):
+        response = client.get(self.url)
+        self.assertEqual(
+            response.data, {'detail': 'Authentication credentials were not provided.'}
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_can_get_taxonomy_tree(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.get(
+            self.url, HTTP_AUTHORIZATION="Token {}".format(self.token_user)
+        )
+        self.assertEqual(response.status_code, 200)
+        category = next(
+            item for item in response.data if item['id'] == self.asset_category.id
+        )
+        self.assertEqual(category['category_name'], self.asset_category.category_name)
+        sub_category = category['sub_categories'][0]
+        self.assertEqual(
+            sub_category['sub_category_name'], self.asset_sub_category.sub_category_name
+        )
+        asset_type = sub_category['asset_types'][0]
+        self.assertEqual(asset_type['asset_type'], self.asset_type.asset_type)
+        make = asset_type['asset_makes'][0]
+        self.assertEqual(make['make_label'], self.make_label.make_label)
+        self.assertEqual(
+            make['model_numbers'],
+            [{'id': self.assetmodel.id, 'model_number': self.assetmodel.model_number}],
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_taxonomy_tree_uses_one_query_per_level(self, mock_verify_id_token):
+        AssetMake.objects.create(make_label="Other Make", asset_type=self.asset_type)
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        # user lookup plus one query per taxonomy level
+        with self.assertNumQueries(6):
+            client.get(self.url, HTTP_AUTHORIZATION="Token {}".format(self.token_user))
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_taxonomy_tree_supports_conditional_get(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.get(
+            self.url, HTTP_AUTHORIZATION="Token {}".format(self.token_user)
+        )
+        etag = response['ETag']
+        response = client.get(
+            self.url,
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 304)
+
+        AssetModelNumber.objects.create(
+            model_number="IMN777", make_label=self.make_label
+        )
+        response = client.get(
+            self.url,
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('IMN777', str(response.data))
@@ -0,0 +1,135 @@
+# Standard Library
+from datetime import timedelta
+from unittest.mock import patch
+
+# Third-Party Imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+# App Imports
+from api.tests import APIBaseTestCase
+from core.models import (
+    AllocationHistory,
+    Asset,
+    AssetCondition,
+    AssetIncidentReport,
+    AssetLog,
+    AssetStatus,
+)
+
+client = APIClient()
+
+
+class AssetTimelineTestCase(APIBaseTestCase):
+    def setUp(self):
+        self.url = reverse('assets-timeline', args=[self.asset.uuid])
+        self.now = timezone.now()
+        self._at(AssetStatus, self.asset_status.id, hours=10)
+        self._at(AssetCondition, self.asset_condition.id, hours=8)
+        self._at(AssetIncidentReport, self.incident_report.id, hours=2)
+        allocation = AllocationHistory.objects.create(
+            asset=Asset.objects.get(id=self.asset.id), current_owner=self.asset_assignee
+        )
+        self._at(AllocationHistory, allocation.id, hours=6)
+        # allocating the asset also recorded its new status
+        for record in AssetStatus.objects.exclude(id=self.asset_status.id):
+            self._at(AssetStatus, record.id, hours=5)
+        log = AssetLog.objects.create(
+            asset=self.asset, checked_by=self.security_user, log_type='Checkin'
+        )
+        self._at(AssetLog, log.id, hours=4)
+
+    def _at(self, model, record_id, hours):
+        model.objects.filter(id=record_id).update(
+            created_at=self.now - timedelta(hours=hours)
+        )
+
+    def _get(self, url=None, email=None, token=None):
+        with patch('api.authentication.auth.verify_id_token') as verify_id_token:
+            verify_id_token.return_value = {'email': email or self.security_user.email}
+            return client.get(
+                url or self.url,
+                HTTP_AUTHORIZATION='Token {}'.format(token or self.token_checked_by),
+            )
+
+    def test_timeline_merges_the_asset_history_newest_first(self):
+        response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [entry['type'] for entry in response.data['results']],
+            ['incident', 'log', 'status', 'allocation', 'condition', 'status'],
+        )
+        self.assertIsNone(response.data['next'])
+        incident = response.data['results'][0]
+        self.assertEqual(incident['incident_description'], 'Mugging')
+        self.assertEqual(incident['submitted_by'], None)
+
+    def test_timeline_is_paginated_with_a_cursor(self):
+        entries = []
+        url = '{}?page_size=4'.format(self.url)
+        while url:
+            response = self._get(url)
+            self.assertLessEqual(len(response.data['results']), 4)
+            entries += response.data['results']
+            url = response.data['next']
+
+        self.assertEqual(len(entries), 6)
+        self.assertEqual(entries, self._get().data['results'])
+
+    def test_records_without_a_time_come_last(self):
+        AssetIncidentReport.objects.filter(id=self.incident_report.id).update(
+            created_at=None
+        )
+        first = self._get('{}?page_size=5'.format(self.url))
+        self.assertEqual(first.data['results'][0]['type'], 'log')
+
+        rest = self._get(first.data['next'])
+        self.assertEqual(
+            [entry['type'] for entry in rest.data['results']], ['incident']
+        )
+        self.assertIsNone(rest.data['next'])
+
+    def test_records_at_the_same_time_are_not_skipped(self):
+        AssetLog.objects.update(created_at=self.now)
+        AssetLog.objects.create(
+            asset=self.asset, checked_by=self.security_user, log_type='Checkout'
+        )
+        AssetLog.objects.update(created_at=self.now)
+
+        entries = []
+        url = '{}?page_size=1'.format(self.url)
+        while url:
+            response = self._get(url)
+            entries += response.data['results']
+            url = response.data['next']
+        self.assertEqual(
+            [entry['type'] for entry in entries][:3], ['log'] * 2 + ['incident']
+        )
+        self.assertEqual(len(entries), 7)
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self._get('{}?cursor=nonsense'.format(self.url))
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data, {'detail': 'Invalid cursor'})
+
+    def test_users_only_see_the_timeline_of_their_assets(self):
+        response = self._get(email=self.other_user.email, token=self.token_other_user)
+        self.assertEqual(response.status_code, 404)
+
+    def test_query_count_does_not_grow_with_the_history(self):
+        self._get()
+        with CaptureQueriesContext(connection) as short_history:
+            self._get()
+        for _ in range(5):
+            AssetCondition.objects.create(asset=self.asset, notes='working')
+            AssetLog.objects.create(
+                asset=self.asset, checked_by=self.security_user, log_type='Checkin'
+            )
+        with CaptureQueriesContext(connection) as long_history:
+            self._get()
+
+        self.assertEqual(len(long_history), len(short_history))
@@ -6,6 +6,7 @@ from rest_framework.test import APIClient
 
 # App Imports
 from api.tests import APIBaseTestCase
+from core.models import AndelaCentre, OfficeBlock
 
 client = APIClient()
 
@@ -77,3 +78,28 @@ class OfficeBlockAPITest(APIBaseTestCase):
         )
         self.assertEqual(response.data, {'detail': 'Method "DELETE" not allowed.'})
         self.assertEqual(response.status_code, 405)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_office_block_list_is_cached_per_centre(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        response = client.get(
+            self.office_block_url, HTTP_AUTHORIZATION="Token {}".format(self.token_user)
+        )
+        count = response.data['count']
+
+        other_centre = AndelaCentre.objects.create(
+            centre_name="Lagos", country=self.country
+        )
+        OfficeBlock.objects.create(name="Epic", location=other_centre)
+        with self.assertNumQueries(1):
+            # only the user lookup done during authentication
+            client.get(
+                self.office_block_url,
+                HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            )
+
+        OfficeBlock.objects.create(name="Block B", location=self.centre)
+        response = client.get(
+            self.office_block_url, HTTP_AUTHORIZATION="Token {}".format(self.token_user)
+        )
+        self.assertEqual(response.data['count'], count + 1)
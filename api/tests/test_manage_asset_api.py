@@ -1,8 +1,12 @@
 # Standard Library
+import csv
+import json
 from unittest.mock import patch
 
 # Third-Party Imports
 from django.contrib.auth import get_user_model
+from django.db import connection
+from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
 # App Imports
@@ -322,6 +326,78 @@ class ManageAssetTestCase(APIBaseTestCase):
         )
         self.assertFalse(len(response.data['results']) > 0)
 
+    @patch('api.authentication.auth.verify_id_token')
+    def test_asset_filter_by_email_prefix(self, mock_verify_id_token):
+        AllocationHistory.objects.create(
+            asset=Asset.objects.get(id=self.asset.id),
+            current_owner=self.user.assetassignee,
+        )
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        response = client.get(
+            '{}?email_prefix={}'.format(self.manage_asset_urls, 'TEST@'),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(
+            response.data['results'][0]['assigned_to']['email'], self.user.email
+        )
+
+        response = client.get(
+            '{}?email_prefix={}'.format(self.manage_asset_urls, 'site.com'),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(len(response.data['results']), 0)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_asset_filter_by_assignee_name(self, mock_verify_id_token):
+        user = User.objects.get(id=self.user.id)
+        user.first_name = 'Wanjiru'
+        user.save()
+        AllocationHistory.objects.create(
+            asset=Asset.objects.get(id=self.asset.id),
+            current_owner=self.user.assetassignee,
+        )
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        response = client.get(
+            '{}?assignee={}'.format(self.manage_asset_urls, 'anjir'),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(
+            response.data['results'][0]['asset_code'], self.asset.asset_code
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_asset_filter_by_checkin_status(self, mock_verify_id_token):
+        AssetLog.objects.create(
+            checked_by=self.security_user,
+            asset=Asset.objects.get(id=self.asset.id),
+            log_type="Checkout",
+        )
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        response = client.get(
+            '{}?checkin_status=checked_out'.format(self.manage_asset_urls),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['checkin_status'], "checked_out")
+
+        response = client.get(
+            '{}?checkin_status=checked_in'.format(self.manage_asset_urls),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(len(response.data['results']), 0)
+
+    def test_user_email_search_index_exists(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, 'core_user')
+        expected = {
+            'postgresql': 'core_user_email_trgm',
+            'sqlite': 'core_user_email_nocase',
+        }.get(connection.vendor)
+        if expected:
+            self.assertIn(expected, constraints)
+
     @patch('api.authentication.auth.verify_id_token')
     def test_asset_filter_by_asset_type(self, mock_verify_id_token):
         mock_verify_id_token.return_value = {'email': self.admin_user.email}
@@ -498,3 +574,73 @@ class ManageAssetTestCase(APIBaseTestCase):
         )
 
         self.assertFalse(response.data.get('verified'))
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_admin_can_export_assets_as_csv(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        response = client.get(
+            '{}?format=csv'.format(reverse('manage-assets-export')),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_admin),
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        content = b''.join(response.streaming_content).decode('utf-8')
+        rows = list(csv.DictReader(content.splitlines()))
+        self.assertEqual(len(rows), Asset.objects.count())
+        exported = {row['asset_code']: row for row in rows}
+        self.assertEqual(
+            exported[self.asset.asset_code]['asset_type'], self.asset_type.asset_type
+        )
+        self.assertEqual(
+            exported[self.asset.asset_code]['model_number'],
+            self.assetmodel.model_number,
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_admin_can_export_assets_as_ndjson(self, mock_verify_id_token):
+        AllocationHistory.objects.create(
+            asset=Asset.objects.get(id=self.asset.id),
+            current_owner=self.user.assetassignee,
+        )
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        response = client.get(
+            '{}?format=ndjson'.format(reverse('manage-assets-export')),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_admin),
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(len(rows), Asset.objects.count())
+        exported = {row['asset_code']: row for row in rows}
+        self.assertEqual(
+            exported[self.asset.asset_code]['assigned_to'], self.user.email
+        )
+        self.assertEqual(exported[self.asset.asset_code]['uuid'], str(self.asset.uuid))
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_asset_export_honours_filters(self, mock_verify_id_token):
+        AllocationHistory.objects.create(
+            asset=Asset.objects.get(id=self.asset.id),
+            current_owner=self.user.assetassignee,
+        )
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        response = client.get(
+            '{}?format=ndjson&email={}'.format(
+                reverse('manage-assets-export'), self.user.email
+            ),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_admin),
+        )
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['asset_code'], self.asset.asset_code)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_non_admin_cannot_export_assets(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = client.get(
+            '{}?format=csv'.format(reverse('manage-assets-export')),
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,122 @@
+# Standard Library
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
+
+# Third-Party Imports
+from django.test import override_settings
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+# App Imports
+from api.tests import APIBaseTestCase
+from core.slack_bot import SlackIntegration
+
+client = APIClient()
+
+METRICS_DIR = tempfile.mkdtemp()
+
+
+def _sample(text, sample):
+    """Return the value of one sample line of a /metrics response."""
+    for line in text.splitlines():
+        if line.startswith(sample + ' '):
+            return float(line.rsplit(' ', 1)[1])
+    return 0
+
+
+@override_settings(METRICS_DIR=METRICS_DIR, METRICS_TOKEN='scraper-secret')
+class MetricsAPITest(APIBaseTestCase):
+    """Tests for the Prometheus metrics endpoint"""
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(METRICS_DIR, ignore_errors=True)
+        super().tearDownClass()
+
+    def _metrics(self, **headers):
+        headers.setdefault('HTTP_AUTHORIZATION', 'Bearer scraper-secret')
+        response = client.get(reverse('metrics'), **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8'
+        )
+        return response.content.decode()
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_requests_are_counted_per_route(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        labels = '{method="GET",route="allocations-list"}'
+        before = self._metrics()
+
+        client.get(
+            self.allocations_urls, HTTP_AUTHORIZATION="Token {}".format(self.token_user)
+        )
+
+        after = self._metrics()
+        count = 'art_http_request_duration_seconds_count' + labels
+        self.assertEqual(_sample(after, count), _sample(before, count) + 1)
+        responses = 'art_http_responses_total{method="GET",route="allocations-list",status="200"}'
+        self.assertEqual(_sample(after, responses), _sample(before, responses) + 1)
+        queries = 'art_http_request_db_queries_sum' + labels
+        self.assertGreater(_sample(after, queries), _sample(before, queries))
+        self.assertIn('# TYPE art_http_request_duration_seconds histogram', after)
+
+    def test_values_of_other_workers_are_added(self):
+        sample = 'art_slack_request_failures_total{method="chat.postMessage"}'
+        before = _sample(self._metrics(), sample)
+        with open(os.path.join(METRICS_DIR, '99999999.json'), 'w') as values:
+            json.dump(
+                {'art_slack_request_failures_total': [[['chat.postMessage'], 3]]},
+                values,
+            )
+        self.addCleanup(os.remove, os.path.join(METRICS_DIR, '99999999.json'))
+
+        self.assertEqual(_sample(self._metrics(), sample), before + 3)
+
+    def test_failed_slack_calls_are_counted(self):
+        sample = 'art_slack_request_failures_total{method="users.list"}'
+        before = _sample(self._metrics(), sample)
+        slack = SlackIntegration()
+        slack.slack_client = MagicMock()
+        slack.slack_client.api_call.return_value = {
+            'ok': False,
+            'error': 'invalid_auth',
+        }
+
+        slack.get_user_slack_email('U123')
+
+        self.assertEqual(_sample(self._metrics(), sample), before + 1)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_invalid_firebase_tokens_are_timed(self, mock_verify_id_token):
+        mock_verify_id_token.side_effect = ValueError('Token expired')
+        sample = 'art_firebase_verify_duration_seconds_count{result="invalid"}'
+        before = _sample(self._metrics(), sample)
+
+        response = client.get(self.allocations_urls, HTTP_AUTHORIZATION="Token expired")
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(_sample(self._metrics(), sample), before + 1)
+
+    def test_token_is_required_when_configured(self):
+        response = client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 401)
+
+        response = client.get(
+            reverse('metrics'), HTTP_AUTHORIZATION='Bearer wrong-secret'
+        )
+        self.assertEqual(response.status_code, 401)
+
+        self._metrics()
+
+    @override_settings(METRICS_TOKEN='', DEBUG=False)
+    def test_metrics_are_hidden_without_a_token_outside_debug(self):
+        response = client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(METRICS_TOKEN='', DEBUG=True)
+    def test_metrics_are_open_without_a_token_in_debug(self):
+        self._metrics(HTTP_AUTHORIZATION='')
@@ -0,0 +1,57 @@
+# Standard Library
+from unittest.mock import patch
+
+# Third-Party Imports
+from django.test import override_settings
+
+# App Imports
+from api.nplusone import NPlusOneError
+from api.serializers import AssetSerializer
+from api.tests import APIBaseTestCase
+from api.views.assets import ASSET_PREFETCH_RELATED_FIELDS, ASSET_SELECT_RELATED_FIELDS
+from core.models import Asset
+
+
+class NPlusOneDetectorTest(APIBaseTestCase):
+    """Tests for the repeated serializer query detector"""
+
+    def test_repeated_queries_raise_in_tests(self):
+        with self.assertRaises(NPlusOneError) as error:
+            AssetSerializer(Asset.objects.all(), many=True).data
+        self.assertIn(
+            'AssetSerializer.asset_category made 2 identical', str(error.exception)
+        )
+
+    def test_related_rows_loaded_up_front_do_not_raise(self):
+        assets = Asset.objects.select_related(
+            *ASSET_SELECT_RELATED_FIELDS
+        ).prefetch_related(*ASSET_PREFETCH_RELATED_FIELDS)
+        data = AssetSerializer(assets, many=True).data
+        self.assertEqual(len(data), Asset.objects.count())
+
+    def test_single_instances_do_not_raise(self):
+        AssetSerializer(self.asset).data
+
+    @override_settings(NPLUSONE_MODE='log')
+    def test_repeated_queries_are_logged_with_the_field(self):
+        with patch('api.nplusone.logger') as logger:
+            AssetSerializer(Asset.objects.all(), many=True).data
+
+        fields = {
+            call[1]['extra']['nplusone']['field']: call[1]['extra']['nplusone']
+            for call in logger.warning.call_args_list
+        }
+        self.assertEqual(fields['AssetSerializer.asset_category']['queries'], 2)
+        self.assertEqual(
+            fields['AssetSerializer.asset_category']['serializer'], 'ListSerializer'
+        )
+
+    @override_settings(NPLUSONE_IGNORE=['AssetSerializer.asset_category'])
+    def test_ignored_fields_are_not_reported(self):
+        with self.assertRaises(NPlusOneError) as error:
+            AssetSerializer(Asset.objects.all(), many=True).data
+        self.assertNotIn('AssetSerializer.asset_category', str(error.exception))
+
+    @override_settings(NPLUSONE_MODE='')
+    def test_detection_is_off_by_default(self):
+        AssetSerializer(Asset.objects.all(), many=True).data
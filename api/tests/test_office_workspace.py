@@ -87,3 +87,28 @@ class OfficeWorkspaceAPITest(APIBaseTestCase):
         )
         self.assertEqual(response.data, {'detail': 'Deleted Successfully'})
         self.assertEqual(response.status_code, 204)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_workspaces_are_cached_until_their_block_changes(
+        self, mock_verify_id_token
+    ):
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        client.get(
+            self.office_workspace_url,
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        with self.assertNumQueries(3):
+            # the user lookup, the count and the page; no section, floor or block
+            response = client.get(
+                self.office_workspace_url,
+                HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+            )
+        self.assertEqual(response.data['results'][0]['block'], 'Epic')
+
+        self.office_block.name = 'Andela Epic'
+        self.office_block.save()
+        response = client.get(
+            self.office_workspace_url,
+            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+        )
+        self.assertEqual(response.data['results'][0]['block'], 'Andela Epic')
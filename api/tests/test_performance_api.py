@@ -0,0 +1,70 @@
+# Standard Library
+from unittest.mock import patch
+
+# Third-Party Imports
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+# App Imports
+from api.dashboard import PerformanceModule
+from api.perf import recorder
+from api.tests import APIBaseTestCase
+
+client = APIClient()
+
+
+@patch('api.authentication.auth.verify_id_token')
+class PerformanceAPITest(APIBaseTestCase):
+    """Tests for the sampled request performance endpoint"""
+
+    def setUp(self):
+        self.url = reverse('performance')
+        recorder.windows = {}
+        cache.clear()
+
+    def _get(self, url):
+        return client.get(url, HTTP_AUTHORIZATION="Token {}".format(self.token_user))
+
+    def _views(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        with override_settings(PERF_SAMPLE_RATE=0):
+            response = self._get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return {row['view']: row for row in response.data['views']}
+
+    def test_non_staff_user_cannot_view_performance(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        response = self._get(self.url)
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(PERF_SAMPLE_RATE=1)
+    def test_sampled_requests_are_recorded_per_view(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        for _ in range(2):
+            self._get(self.allocations_urls)
+
+        row = self._views(mock_verify_id_token)['GET allocations-list']
+        self.assertEqual(row['requests'], 2)
+        self.assertGreater(row['queries']['max'], 0)
+        self.assertGreater(row['sql_ms']['max'], 0)
+        self.assertGreater(row['serializer_ms']['max'], 0)
+        self.assertGreaterEqual(row['total_ms']['p95'], row['total_ms']['p50'])
+        self.assertGreater(row['response_bytes']['max'], 0)
+        self.assertEqual(sum(row['queries']['buckets'].values()), 2)
+
+    @override_settings(PERF_SAMPLE_RATE=0)
+    def test_unsampled_requests_are_not_recorded(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        self._get(self.allocations_urls)
+
+        self.assertNotIn('GET allocations-list', self._views(mock_verify_id_token))
+
+    @override_settings(PERF_SAMPLE_RATE=1)
+    def test_dashboard_module_lists_slowest_views(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.admin_user.email}
+        self._get(self.allocations_urls)
+
+        html = PerformanceModule(limit=5).render()
+        self.assertIn('GET allocations-list', html)
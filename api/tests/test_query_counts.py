@@ -0,0 +1,92 @@
+# Standard Library
+from unittest.mock import patch
+
+# Third-Party Imports
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+# App Imports
+from api.tests import APIBaseTestCase
+from api.urls import router
+from core.models import (
+    AllocationHistory,
+    Asset,
+    AssetCondition,
+    AssetIncidentReport,
+    AssetLog,
+    UserFeedback,
+)
+
+client = APIClient()
+
+
+class ListQueryCountTest(APIBaseTestCase):
+    """Every router list endpoint should cost the same number of queries
+    however many rows it returns."""
+
+    def _add_rows(self, prefix):
+        for i in range(3):
+            asset = Asset.objects.create(
+                asset_code="{}C{}".format(prefix, i),
+                serial_number="{}S{}".format(prefix, i),
+                model_number=self.assetmodel,
+                asset_location=self.centre,
+            )
+            AllocationHistory.objects.create(
+                asset=asset, current_owner=self.asset_assignee
+            )
+            AssetCondition.objects.create(asset=asset, notes="working")
+            AssetIncidentReport.objects.create(
+                asset=asset,
+                incident_type="Loss",
+                incident_location="CDB",
+                incident_description="Lost",
+                injuries_sustained="None",
+                loss_of_property="Laptop",
+                witnesses="None",
+                police_abstract_obtained="Yes",
+                submitted_by=self.user,
+            )
+            AssetLog.objects.create(
+                asset=asset, checked_by=self.security_user, log_type="Checkin"
+            )
+            UserFeedback.objects.create(
+                reported_by=self.user, message="Great", report_type="feature request"
+            )
+
+    def _list_query_counts(self):
+        counts = {}
+        for _, _, basename in router.registry:
+            for user in (self.admin_user, self.security_user):
+                cache.clear()
+                with patch('api.authentication.auth.verify_id_token') as verify:
+                    verify.return_value = {'email': user.email}
+                    with CaptureQueriesContext(connection) as queries:
+                        response = client.get(
+                            reverse('{}-list'.format(basename)),
+                            HTTP_AUTHORIZATION="Token {}".format(self.token_user),
+                        )
+                if response.status_code == 200:
+                    counts[basename, user.email] = len(queries)
+        return counts
+
+    def test_list_query_counts_do_not_grow_with_rows(self):
+        self._add_rows('QA')
+        counts = self._list_query_counts()
+        self._add_rows('QB')
+        counts_with_more_rows = self._list_query_counts()
+
+        self.assertIn(('allocations', self.admin_user.email), counts)
+        self.assertIn(('asset-logs', self.security_user.email), counts)
+        self.assertIn(('users', self.admin_user.email), counts)
+        self.assertIn(('manage-assets', self.admin_user.email), counts)
+        self.assertIn(('assets', self.security_user.email), counts)
+        for (basename, email), count in counts.items():
+            self.assertLessEqual(
+                counts_with_more_rows[basename, email],
+                count,
+                '{} issues queries per row for {}'.format(basename, email),
+            )
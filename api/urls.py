@@ -24,6 +24,7 @@ from api.views import (
     AssetSpecsViewSet,
     AssetStatusViewSet,
     AssetSubCategoryViewSet,
+    AssetTaxonomyView,
     AssetTypeViewSet,
     AssetViewSet,
     AvailableFilterValues,
@@ -34,6 +35,7 @@ from api.views import (
     OfficeFloorSectionViewSet,
     OfficeFloorViewSet,
     OfficeWorkspaceViewSet,
+    PerformanceView,
     SampleImportFile,
     SecurityUserEmailsViewSet,
     SecurityUserViewSet,
@@ -114,6 +116,8 @@ urlpatterns = [
         name='sample-import-file',
     ),
     path('filter-values/', AvailableFilterValues.as_view(), name='available-filters'),
+    path('asset-taxonomy/', AssetTaxonomyView.as_view(), name='asset-taxonomy'),
+    path('_perf/', PerformanceView.as_view(), name='performance'),
 ]
 if settings.DEBUG:
     urlpatterns.extend(
@@ -22,12 +22,14 @@ from .assets import (  # noqa: F401
     AssetSpecsViewSet,
     AssetStatusViewSet,
     AssetSubCategoryViewSet,
+    AssetTaxonomyView,
     AssetTypeViewSet,
     AssetViewSet,
     ManageAssetViewSet,
     SampleImportFile,
     SkippedAssets,
 )
+from .performance import MetricsView, PerformanceView  # noqa: F401
 from .users import (  # noqa: F401
     AvailableFilterValues,
     SecurityUserEmailsViewSet,
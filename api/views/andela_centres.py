@@ -9,6 +9,7 @@ from rest_framework.viewsets import ModelViewSet
 
 # App Imports
 from api.authentication import FirebaseTokenAuthentication
+from api.caching import cache_response
 from api.serializers import (
     AndelaCentreSerializer,
     CountrySerializer,
@@ -30,6 +31,14 @@ class CountryViewset(ModelViewSet):
     authentication_classes = [FirebaseTokenAuthentication]
     http_method_names = ['get', 'post', 'put', 'delete']
 
+    @cache_response(models.Country)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response(models.Country)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
 
 class AndelaCentreViewset(ModelViewSet):
     serializer_class = AndelaCentreSerializer
@@ -44,6 +53,14 @@ class AndelaCentreViewset(ModelViewSet):
         data = {"detail": "Deleted Successfully"}
         return Response(data=data, status=status.HTTP_204_NO_CONTENT)
 
+    @cache_response(models.AndelaCentre, models.Country)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response(models.AndelaCentre, models.Country)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
 
 class OfficeBlockViewSet(ModelViewSet):
     serializer_class = OfficeBlockSerializer
@@ -58,6 +75,10 @@ class OfficeBlockViewSet(ModelViewSet):
             return self.queryset.filter(location=user_location)
         return self.queryset.none()
 
+    @cache_response(models.OfficeBlock, per_centre=True)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
 
 class OfficeFloorViewSet(ModelViewSet):
     serializer_class = OfficeFloorSerializer
@@ -72,6 +93,10 @@ class OfficeFloorViewSet(ModelViewSet):
             return self.queryset.filter(block__location=user_location)
         return self.queryset.none()
 
+    @cache_response(models.OfficeFloor, per_centre=True)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
 
 class OfficeFloorSectionViewSet(ModelViewSet):
     serializer_class = OfficeFloorSectionSerializer
@@ -112,3 +137,11 @@ class DepartmentViewSet(ModelViewSet):
         self.perform_destroy(instance)
         data = {"detail": "Deleted Successfully"}
         return Response(data=data, status=status.HTTP_204_NO_CONTENT)
+
+    @cache_response(models.Department)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response(models.Department)
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
@@ -1,17 +1,32 @@
 # Standard Library
 import codecs
 import csv
+import json
 import logging
 import os
 import re
-from itertools import chain
+from itertools import chain, islice
 
 # Third-Party Imports
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import ValidationError
-from django.http import FileResponse
+from django.db.models import (
+    Case,
+    Count,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.http import FileResponse, StreamingHttpResponse
 from django_filters import rest_framework as filters
 from rest_framework import serializers, status
+from rest_framework.decorators import detail_route, list_route
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.filters import OrderingFilter
 from rest_framework.generics import get_object_or_404
@@ -25,7 +40,9 @@ from rest_framework.viewsets import ModelViewSet
 # App Imports
 from api.authentication import FirebaseTokenAuthentication
 from api.filters import AssetFilter
+from api.mixins import CachedListMixin, CachedResponseMixin, RelatedFieldsMixin
 from api.permissions import IsSecurityUser
+from api.renderers import CSVRenderer, Echo, NDJSONRenderer
 from api.serializers import (
     AllocationsSerializer,
     AssetAssigneeSerializer,
@@ -33,6 +50,7 @@ from api.serializers import (
     AssetConditionSerializer,
     AssetHealthSerializer,
     AssetIncidentReportSerializer,
+    AssetLogBatchSerializer,
     AssetLogSerializer,
     AssetMakeSerializer,
     AssetModelNumberSerializer,
@@ -41,27 +59,144 @@ from api.serializers import (
     AssetStatusSerializer,
     AssetSubCategorySerializer,
     AssetTypeSerializer,
+    BulkAllocationSerializer,
+    BulkAssetStatusSerializer,
 )
 from core import models
 from core.assets_saver_helper import save_asset
+from core.bulk_operations import (
+    allocate_assets,
+    BulkOperationError,
+    record_asset_logs,
+    transition_asset_statuses,
+)
+from core.cache import TAXONOMY
 from core.management.commands.import_assets import SKIPPED_ROWS
+from core.pagination import TimelinePagination
 from core.slack_bot import SlackIntegration
+from core.timeline import asset_timeline
 
 slack = SlackIntegration()
 logger = logging.getLogger(__name__)
 
+ASSET_SEARCH_MAX_TERMS = 5
+
+TIMELINE_SERIALIZERS = {
+    'status': AssetStatusSerializer,
+    'allocation': AllocationsSerializer,
+    'condition': AssetConditionSerializer,
+    'log': AssetLogSerializer,
+    'incident': AssetIncidentReportSerializer,
+}
+
+ASSIGNEE_RELATED_FIELDS = ('department', 'workspace', 'user')
+
+ASSET_SELECT_RELATED_FIELDS = (
+    'model_number__make_label__asset_type__asset_sub_category__asset_category',
+    'asset_location',
+    'specs',
+    *('assigned_to__' + field for field in ASSIGNEE_RELATED_FIELDS),
+)
+
+ALLOCATION_SELECT_RELATED_FIELDS = (
+    'asset',
+    *('current_owner__' + field for field in ASSIGNEE_RELATED_FIELDS),
+    *('previous_owner__' + field for field in ASSIGNEE_RELATED_FIELDS),
+)
+
+ASSET_PREFETCH_RELATED_FIELDS = (
+    Prefetch(
+        'allocationhistory_set',
+        queryset=models.AllocationHistory.objects.select_related(
+            *ALLOCATION_SELECT_RELATED_FIELDS
+        ),
+    ),
+)
+
 
-class ManageAssetViewSet(ModelViewSet):
+def annotate_assignee_asset_count(queryset):
+    """
+    Count the assets of each asset's assignee in the same query, for the
+    allocated_asset_count of assignees that are users.
+    """
+    assignee_assets = (
+        models.Asset.objects.filter(assigned_to=OuterRef('assigned_to'))
+        .order_by()
+        .values('assigned_to')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    return queryset.annotate(
+        assignee_asset_count=Subquery(assignee_assets, output_field=IntegerField())
+    )
+
+
+ASSET_EXPORT_FIELDS = (
+    ('uuid', 'uuid'),
+    ('asset_code', 'asset_code'),
+    ('serial_number', 'serial_number'),
+    (
+        'asset_category',
+        'model_number__make_label__asset_type__asset_sub_category'
+        '__asset_category__category_name',
+    ),
+    (
+        'asset_sub_category',
+        'model_number__make_label__asset_type__asset_sub_category__sub_category_name',
+    ),
+    ('asset_type', 'model_number__make_label__asset_type__asset_type'),
+    ('make_label', 'model_number__make_label__make_label'),
+    ('model_number', 'model_number__model_number'),
+    ('current_status', 'current_status'),
+    ('asset_location', 'asset_location__centre_name'),
+    ('purchase_date', 'purchase_date'),
+    ('verified', 'verified'),
+    ('notes', 'notes'),
+    ('created_at', 'created_at'),
+    ('last_modified', 'last_modified'),
+)
+# checked in the same order as AssetAssignee.email
+ASSET_EXPORT_ASSIGNEE_LOOKUPS = (
+    'assigned_to__department__name',
+    'assigned_to__workspace__name',
+    'assigned_to__user__email',
+)
+ASSET_EXPORT_COLUMNS = [column for column, _ in ASSET_EXPORT_FIELDS] + ['assigned_to']
+
+
+def _asset_export_rows(queryset):
+    """
+    Yield one flat dict per asset, reading rows from the database in chunks
+    so memory use does not grow with the size of the export.
+    """
+    lookups = [lookup for _, lookup in ASSET_EXPORT_FIELDS]
+    lookups += ASSET_EXPORT_ASSIGNEE_LOOKUPS
+    values = queryset.values_list(*lookups).iterator(
+        chunk_size=settings.EXPORT_CHUNK_SIZE
+    )
+    num_fields = len(ASSET_EXPORT_FIELDS)
+    for asset in values:
+        row = dict(zip(ASSET_EXPORT_COLUMNS, asset[:num_fields]))
+        row['assigned_to'] = next((a for a in asset[num_fields:] if a), None)
+        yield row
+
+
+class ManageAssetViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = AssetSerializer
     queryset = models.Asset.objects.all()
+    select_related_fields = ASSET_SELECT_RELATED_FIELDS
+    prefetch_related_fields = ASSET_PREFETCH_RELATED_FIELDS
     permission_classes = [IsAuthenticated, IsAdminUser]
     authentication_classes = (FirebaseTokenAuthentication,)
     http_method_names = ['get', 'post', 'put', 'delete']
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = AssetFilter
 
+    def filter_queryset(self, queryset):
+        return annotate_assignee_asset_count(super().filter_queryset(queryset))
+
     def get_object(self):
-        queryset = models.Asset.objects.all()
+        queryset = self.filter_queryset(models.Asset.objects.all())
         obj = get_object_or_404(queryset, uuid=self.kwargs['pk'])
         return obj
 
@@ -88,13 +223,46 @@ class ManageAssetViewSet(ModelViewSet):
             return self.queryset.filter(asset_location=location)
         return self.queryset.none()
 
+    @list_route(methods=['get'], renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request):
+        """
+        Stream the filtered assets as csv (default) or ndjson.
+        Accepts the same filters as the list endpoint.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = _asset_export_rows(queryset)
+        export_format = request.accepted_renderer.format
+        if export_format == NDJSONRenderer.format:
+            content = (json.dumps(row, cls=DjangoJSONEncoder) + '\n' for row in rows)
+        else:
+            writer = csv.writer(Echo())
+            content = chain(
+                [writer.writerow(ASSET_EXPORT_COLUMNS)],
+                (
+                    writer.writerow([row[c] for c in ASSET_EXPORT_COLUMNS])
+                    for row in rows
+                ),
+            )
+        response = StreamingHttpResponse(
+            content, content_type=request.accepted_renderer.media_type
+        )
+        response['Content-Disposition'] = 'attachment; filename="assets.{}"'.format(
+            export_format
+        )
+        return response
 
-class AssetViewSet(ModelViewSet):
+
+class AssetViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = AssetSerializer
+    select_related_fields = ASSET_SELECT_RELATED_FIELDS
+    prefetch_related_fields = ASSET_PREFETCH_RELATED_FIELDS
     permission_classes = [IsAuthenticated]
     authentication_classes = (FirebaseTokenAuthentication,)
     http_method_names = ['get']
 
+    def filter_queryset(self, queryset):
+        return annotate_assignee_asset_count(super().filter_queryset(queryset))
+
     def get_queryset(self):
         user = self.request.user
         query_filter = {}
@@ -111,10 +279,82 @@ class AssetViewSet(ModelViewSet):
     def get_object(self):
         user = self.request.user
         asset_assignee = models.AssetAssignee.objects.filter(user=user).first()
-        queryset = models.Asset.objects.filter(assigned_to=asset_assignee)
+        queryset = self.filter_queryset(
+            models.Asset.objects.filter(assigned_to=asset_assignee)
+        )
         obj = get_object_or_404(queryset, uuid=self.kwargs['pk'])
         return obj
 
+    def _get_visible_queryset(self):
+        user = self.request.user
+        if user.is_staff and not hasattr(user, "securityuser"):
+            if not user.location:
+                return models.Asset.objects.none()
+            return models.Asset.objects.filter(asset_location=user.location)
+        return self.get_queryset()
+
+    @list_route(methods=['get'])
+    def search(self, request):
+        """
+        Search assets by code, serial number, model number, make, type,
+        assignee or notes. Every whitespace separated term in `q` must match.
+        Exact code/serial matches rank first, then prefix matches.
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            raise serializers.ValidationError({'q': ['This field is required.']})
+        terms = query.lower().split()[:ASSET_SEARCH_MAX_TERMS]
+        queryset = self.filter_queryset(self._get_visible_queryset())
+        for term in terms:
+            queryset = queryset.filter(search_text__icontains=term)
+        queryset = queryset.annotate(
+            rank=Case(
+                When(
+                    Q(asset_code__iexact=query) | Q(serial_number__iexact=query),
+                    then=Value(0),
+                ),
+                When(
+                    Q(asset_code__istartswith=query)
+                    | Q(serial_number__istartswith=query),
+                    then=Value(1),
+                ),
+                default=Value(2),
+                output_field=IntegerField(),
+            )
+        ).order_by('rank', '-last_modified')
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    @detail_route(methods=['get'])
+    def timeline(self, request, pk=None):
+        """
+        The status, allocation, condition, check-in and incident records of
+        an asset merged newest first, a page at a time with `?cursor=`.
+        """
+        asset = get_object_or_404(self._get_visible_queryset(), uuid=pk)
+        paginator = TimelinePagination()
+        page_size = paginator.get_page_size(request)
+        entries = list(
+            islice(
+                asset_timeline(asset, paginator.decode_cursor(request), page_size + 1),
+                page_size + 1,
+            )
+        )
+        context = self.get_serializer_context()
+        results = [
+            dict(
+                {'type': kind},
+                **TIMELINE_SERIALIZERS[kind](record, context=context).data,
+            )
+            for _, kind, record in entries[:page_size]
+        ]
+        return paginator.get_paginated_response(request, entries, page_size, results)
+
 
 class AssetAssigneeViewSet(ModelViewSet):
     serializer_class = AssetAssigneeSerializer
@@ -146,9 +386,10 @@ class AssetAssigneeViewSet(ModelViewSet):
         return self.queryset.none()
 
 
-class AssetLogViewSet(ModelViewSet):
+class AssetLogViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = AssetLogSerializer
     queryset = models.AssetLog.objects.all()
+    select_related_fields = ('asset', 'checked_by')
     permission_classes = [IsSecurityUser]
     authentication_classes = (FirebaseTokenAuthentication,)
     http_method_names = ['get', 'post']
@@ -162,10 +403,24 @@ class AssetLogViewSet(ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(checked_by=self.request.user.securityuser)
 
+    @list_route(methods=['post'], url_path='batch')
+    def batch(self, request):
+        """
+        Record many check-in/check-out scans in one request. Replayed scans
+        are recognised by their idempotency key and reported as duplicates.
+        """
+        serializer = AssetLogBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = record_asset_logs(
+            serializer.validated_data['scans'], request.user.securityuser
+        )
+        return Response({'results': results})
+
 
-class AssetStatusViewSet(ModelViewSet):
+class AssetStatusViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = AssetStatusSerializer
     queryset = models.AssetStatus.objects.all()
+    select_related_fields = ('asset',)
     permission_classes = [IsAuthenticated]
     authentication_classes = [FirebaseTokenAuthentication]
     http_method_names = ['get', 'post']
@@ -176,10 +431,32 @@ class AssetStatusViewSet(ModelViewSet):
             return self.queryset.filter(asset__asset_location=user_location)
         return self.queryset.none()
 
+    @list_route(methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Move many assets, given by id or asset code, to one status. Nothing
+        is saved unless every asset is valid; errors are returned per asset,
+        in submission order.
+        """
+        serializer = BulkAssetStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            statuses = transition_asset_statuses(
+                serializer.validated_data['assets'],
+                serializer.validated_data['current_status'],
+            )
+        except BulkOperationError as e:
+            raise serializers.ValidationError({'assets': e.errors})
+        return Response(
+            {'results': AssetStatusSerializer(statuses, many=True).data},
+            status=status.HTTP_201_CREATED,
+        )
 
-class AllocationsViewSet(ModelViewSet):
+
+class AllocationsViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = AllocationsSerializer
     queryset = models.AllocationHistory.objects.all()
+    select_related_fields = ALLOCATION_SELECT_RELATED_FIELDS
     permission_classes = [IsAuthenticated]
     authentication_classes = (FirebaseTokenAuthentication,)
     http_method_names = ['get', 'post']
@@ -190,10 +467,28 @@ class AllocationsViewSet(ModelViewSet):
             return self.queryset.filter(asset__asset_location=user_location)
         return self.queryset.none()
 
+    @list_route(methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Allocate many assets in one request. Nothing is saved unless every
+        item is valid; errors are returned per item, in submission order.
+        """
+        serializer = BulkAllocationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            histories = allocate_assets(serializer.validated_data['allocations'])
+        except BulkOperationError as e:
+            raise serializers.ValidationError({'allocations': e.errors})
+        return Response(
+            {'results': AllocationsSerializer(histories, many=True).data},
+            status=status.HTTP_201_CREATED,
+        )
+
 
-class AssetCategoryViewSet(ModelViewSet):
+class AssetCategoryViewSet(CachedListMixin, ModelViewSet):
     serializer_class = AssetCategorySerializer
     queryset = models.AssetCategory.objects.all()
+    cache_namespace = TAXONOMY
     permission_classes = [IsAuthenticated]
     authentication_classes = (FirebaseTokenAuthentication,)
     filter_backends = (OrderingFilter,)
@@ -201,9 +496,10 @@ class AssetCategoryViewSet(ModelViewSet):
     http_method_names = ['get', 'post']
 
 
-class AssetSubCategoryViewSet(ModelViewSet):
+class AssetSubCategoryViewSet(CachedListMixin, ModelViewSet):
     serializer_class = AssetSubCategorySerializer
-    queryset = models.AssetSubCategory.objects.all()
+    queryset = models.AssetSubCategory.objects.select_related('asset_category')
+    cache_namespace = TAXONOMY
     permission_classes = [IsAuthenticated]
     authentication_classes = (FirebaseTokenAuthentication,)
     filter_backends = (OrderingFilter,)
@@ -211,9 +507,10 @@ class AssetSubCategoryViewSet(ModelViewSet):
     http_method_names = ['get', 'post']
 
 
-class AssetTypeViewSet(ModelViewSet):
+class AssetTypeViewSet(CachedListMixin, ModelViewSet):
     serializer_class = AssetTypeSerializer
-    queryset = models.AssetType.objects.all()
+    queryset = models.AssetType.objects.select_related('asset_sub_category')
+    cache_namespace = TAXONOMY
     permission_classes = [IsAuthenticated, IsAdminUser]
     authentication_classes = (FirebaseTokenAuthentication,)
     filter_backends = (OrderingFilter,)
@@ -221,9 +518,10 @@ class AssetTypeViewSet(ModelViewSet):
     http_method_names = ['get', 'post']
 
 
-class AssetModelNumberViewSet(ModelViewSet):
+class AssetModelNumberViewSet(CachedListMixin, ModelViewSet):
     serializer_class = AssetModelNumberSerializer
-    queryset = models.AssetModelNumber.objects.all()
+    queryset = models.AssetModelNumber.objects.select_related('make_label')
+    cache_namespace = TAXONOMY
     permission_classes = [IsAuthenticated]
     authentication_classes = [FirebaseTokenAuthentication]
     filter_backends = (OrderingFilter,)
@@ -231,9 +529,10 @@ class AssetModelNumberViewSet(ModelViewSet):
     http_method_names = ['get', 'post']
 
 
-class AssetMakeViewSet(ModelViewSet):
+class AssetMakeViewSet(CachedListMixin, ModelViewSet):
     serializer_class = AssetMakeSerializer
-    queryset = models.AssetMake.objects.all()
+    queryset = models.AssetMake.objects.select_related('asset_type')
+    cache_namespace = TAXONOMY
     permission_classes = [IsAuthenticated]
     authentication_classes = [FirebaseTokenAuthentication]
     filter_backends = (OrderingFilter,)
@@ -241,9 +540,62 @@ class AssetMakeViewSet(ModelViewSet):
     http_method_names = ['get', 'post']
 
 
-class AssetConditionViewSet(ModelViewSet):
+class AssetTaxonomyView(CachedResponseMixin, APIView):
+    """
+    The category > sub-category > type > make > model number cascade as a
+    single tree, built from one flat query per level.
+    """
+
+    permission_classes = [IsAuthenticated]
+    authentication_classes = [FirebaseTokenAuthentication]
+    cache_namespace = TAXONOMY
+
+    def get(self, request):
+        return self.get_cached_response(request, lambda: Response(self._build_tree()))
+
+    def _build_tree(self):
+        levels = (
+            (models.AssetCategory, ('id', 'category_name'), None, 'sub_categories'),
+            (
+                models.AssetSubCategory,
+                ('id', 'sub_category_name'),
+                'asset_category_id',
+                'asset_types',
+            ),
+            (
+                models.AssetType,
+                ('id', 'asset_type', 'has_specs'),
+                'asset_sub_category_id',
+                'asset_makes',
+            ),
+            (models.AssetMake, ('id', 'make_label'), 'asset_type_id', 'model_numbers'),
+            (models.AssetModelNumber, ('id', 'model_number'), 'make_label_id', None),
+        )
+        tree = []
+        parents = {}
+        for model, fields, parent_field, children_key in levels:
+            nodes = {}
+            values = fields if parent_field is None else fields + (parent_field,)
+            for row in model.objects.order_by(fields[1]).values(*values):
+                parent_id = row.pop(parent_field, None) if parent_field else None
+                if children_key:
+                    row[children_key] = []
+                if parent_field is None:
+                    tree.append(row)
+                elif parent_id in parents:
+                    parents[parent_id].append(row)
+                else:
+                    # orphaned rows (e.g. model numbers without a make) are skipped
+                    continue
+                nodes[row['id']] = row[children_key] if children_key else None
+            parents = nodes
+        return tree
+
+
+class AssetConditionViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = AssetConditionSerializer
     queryset = models.AssetCondition.objects.all()
+    select_related_fields = ('asset',)
     permission_classes = [IsAuthenticated]
     authentication_classes = (FirebaseTokenAuthentication,)
     http_method_names = ['get', 'post']
@@ -255,9 +607,10 @@ class AssetConditionViewSet(ModelViewSet):
         return self.queryset.none()
 
 
-class AssetIncidentReportViewSet(ModelViewSet):
+class AssetIncidentReportViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = AssetIncidentReportSerializer
     queryset = models.AssetIncidentReport.objects.all()
+    select_related_fields = ('asset', 'submitted_by')
     permission_classes = [IsAuthenticated]
     authentication_classes = [FirebaseTokenAuthentication]
     http_method_names = ['get', 'post']
@@ -297,13 +650,16 @@ class AssetSlackIncidentReportViewSet(ModelViewSet):
                 return Response(status=status.HTTP_200_OK)
 
 
-class AssetHealthCountViewSet(ModelViewSet):
+HEALTH_STATUSES = ('Allocated', 'Available', 'Damaged', 'Lost')
+
+
+class AssetHealthCountViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = AssetHealthSerializer
+    select_related_fields = ('model_number__make_label__asset_type',)
     permission_classes = [IsAuthenticated]
     authentication_classes = (FirebaseTokenAuthentication,)
     http_method_names = ['get']
     queryset = models.Asset.objects.all()
-    data = None
 
     def get_queryset(self):
         user_location = self.request.user.location
@@ -311,59 +667,40 @@ class AssetHealthCountViewSet(ModelViewSet):
             return self.queryset.filter(asset_location=user_location)
         return self.queryset.none()
 
-    def _get_assets_status_condition(self, asset_models):
-        asset_name, model_numbers = asset_models.popitem()
-
-        def generate_asset_condition(model_number):
-            statuses = {'Allocated': 0, 'Available': 0, 'Damaged': 0, 'Lost': 0}
-
-            def increment_asset_status(asset, model_number=model_number):
-                if (
-                    asset['asset_type'] == asset_name
-                    and asset['model_number'] == model_number
-                ):
-                    nonlocal statuses
-                    statuses[asset['count_by_status']] += 1
-                return statuses
-
-            list(map(increment_asset_status, self.data))
-            return {
-                'asset_type': asset_name,
-                'model_number': model_number,
-                'count_by_status': statuses,
-            }
-
-        return list(map(generate_asset_condition, model_numbers))
-
-    def _get_asset_list(self, asset):
-        asset_with_status = list(map(self._get_assets_status_condition, asset))
-        return list(chain.from_iterable(asset_with_status))
-
-    def _get_asset_type(self, asset):
-        return asset['asset_type']
-
-    def _get_model_numbers(self, asset_type):
-        asset_model_numbers = map(
-            lambda asset: asset['model_number'],
-            filter(lambda asset: asset['asset_type'] == asset_type, self.data),
-        )
-        return {asset_type: set(list(asset_model_numbers))}
-
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        is_admin = self.request.user.is_staff
-        if is_admin:
-            serializer = self.get_serializer(queryset, many=True)
-            self.data = serializer.data
-            asset_types = set(map(self._get_asset_type, self.data))
-            asset = map(self._get_model_numbers, asset_types)
-            asset_list = self._get_asset_list(asset)
-            return Response(asset_list)
-        return Response(
-            exception=True,
-            status=403,
-            data={'detail': ['You do not have authorization']},
+        """
+        Count the assets of the user's centre per asset type, model number
+        and status, from the inventory summary.
+        """
+        if not self.request.user.is_staff:
+            return Response(
+                exception=True,
+                status=403,
+                data={'detail': ['You do not have authorization']},
+            )
+        location = self.request.user.location
+        if not location:
+            return Response([])
+        rows = (
+            models.InventorySummary.objects.filter(
+                centre=location, model_number__isnull=False
+            )
+            .values('asset_type__asset_type', 'model_number__model_number', 'status')
+            .annotate(total=Sum('count'))
+            .filter(total__gt=0)
+            .order_by('asset_type__asset_type', 'model_number__model_number')
         )
+        counts = {}
+        for row in rows:
+            key = (row['asset_type__asset_type'], row['model_number__model_number'])
+            if key not in counts:
+                counts[key] = {
+                    'asset_type': key[0],
+                    'model_number': key[1],
+                    'count_by_status': {status: 0 for status in HEALTH_STATUSES},
+                }
+            counts[key]['count_by_status'][row['status']] = row['total']
+        return Response(list(counts.values()))
 
 
 class AssetSpecsViewSet(ModelViewSet):
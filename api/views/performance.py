@@ -0,0 +1,47 @@
+# Third-Party Imports
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views import View
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+# App Imports
+from api.authentication import FirebaseTokenAuthentication
+from api.perf import recorder
+from core import metrics
+
+
+class PerformanceView(APIView):
+    """
+    Per-view query counts, SQL, serializer and total times and response
+    sizes of the requests sampled by `PerformanceMiddleware`.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    authentication_classes = [FirebaseTokenAuthentication]
+
+    def get(self, request):
+        return Response(recorder.summary())
+
+
+class MetricsView(View):
+    """
+    Request, database, import, user sync, Slack and Firebase metrics of
+    every worker in the Prometheus text format. When METRICS_TOKEN is set it
+    must be sent as a bearer token; without one the endpoint only exists
+    with DEBUG on.
+    """
+
+    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def get(self, request):
+        if not settings.METRICS_TOKEN and not settings.DEBUG:
+            raise Http404
+        if settings.METRICS_TOKEN and not constant_time_compare(
+            request.META.get('HTTP_AUTHORIZATION', ''),
+            'Bearer {}'.format(settings.METRICS_TOKEN),
+        ):
+            return HttpResponse('Unauthorized', status=401)
+        return HttpResponse(metrics.exposition(), content_type=self.content_type)
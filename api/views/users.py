@@ -3,6 +3,7 @@ import logging
 
 # Third-Party Imports
 from django.contrib.auth.models import Group
+from django.db.models import Prefetch
 from django.db.utils import IntegrityError
 from django_filters import rest_framework as filters
 from rest_framework import serializers, status
@@ -14,6 +15,7 @@ from rest_framework.viewsets import ModelViewSet
 # App Imports
 from api.authentication import FirebaseTokenAuthentication
 from api.filters import UserFilter
+from api.mixins import RelatedFieldsMixin
 from api.permissions import IsApiUser
 from api.serializers import (
     SecurityUserEmailsSerializer,
@@ -22,14 +24,30 @@ from api.serializers import (
     UserGroupSerializer,
     UserSerializerWithAssets,
 )
+from api.views.assets import (
+    annotate_assignee_asset_count,
+    ASSET_PREFETCH_RELATED_FIELDS,
+    ASSET_SELECT_RELATED_FIELDS,
+)
 from core import models
 
 logger = logging.getLogger(__name__)
 
 
-class UserViewSet(ModelViewSet):
+class UserViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = UserSerializerWithAssets
     queryset = models.User.objects.all()
+    select_related_fields = ('assetassignee',)
+    prefetch_related_fields = (
+        Prefetch(
+            'assetassignee__asset_set',
+            queryset=annotate_assignee_asset_count(
+                models.Asset.objects.select_related(
+                    *ASSET_SELECT_RELATED_FIELDS
+                ).prefetch_related(*ASSET_PREFETCH_RELATED_FIELDS)
+            ),
+        ),
+    )
     permission_classes = (IsAuthenticated, IsAdminUser)
     authentication_classes = (FirebaseTokenAuthentication,)
     http_method_names = ['get', 'post']
@@ -56,9 +74,10 @@ class SecurityUserEmailsViewSet(ModelViewSet):
         return Response({'emails': list_of_emails}, status=status.HTTP_200_OK)
 
 
-class UserFeedbackViewSet(ModelViewSet):
+class UserFeedbackViewSet(RelatedFieldsMixin, ModelViewSet):
     serializer_class = UserFeedbackSerializer
     queryset = models.UserFeedback.objects.all()
+    select_related_fields = ('reported_by',)
     permission_classes = [IsAuthenticated]
     authentication_classes = (FirebaseTokenAuthentication,)
     http_method_names = ['get', 'post']
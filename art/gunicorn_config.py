@@ -0,0 +1,34 @@
+"""
+Gunicorn settings: `gunicorn -c art/gunicorn_config.py art.wsgi`.
+
+GUNICORN_WORKER_CLASS=gevent runs each worker as GUNICORN_WORKER_CONNECTIONS
+greenlets, so requests waiting on Firebase, Slack or AIS do not hold up the
+rest. Gunicorn monkey-patches the standard library in each gevent worker;
+psycopg2 is made cooperative here. Combine it with DB_POOL_SIZE so the
+greenlets share a bounded number of database connections.
+"""
+# Standard Library
+import os
+
+# Third-Party Imports
+from decouple import config
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings.dev')
+
+worker_class = config('GUNICORN_WORKER_CLASS', 'sync')
+worker_connections = config('GUNICORN_WORKER_CONNECTIONS', 100, cast=int)
+timeout = config('GUNICORN_TIMEOUT', 30, cast=int)
+
+
+def on_starting(server):
+    from core import metrics
+
+    # values written by the workers of a previous run are not ours to report
+    metrics.clear()
+
+
+def post_fork(server, worker):
+    if worker_class == 'gevent':
+        from core.db.green import patch_psycopg
+
+        patch_psycopg()
@@ -23,10 +23,12 @@ from django.views.generic import TemplateView
 
 # App Imports
 from api import urls
+from api.views import MetricsView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/v1/', include(urls)),
+    path('metrics', MetricsView.as_view(), name='metrics'),
     path('jet/', include('jet.urls', 'jet')),
     path('jet/dashboard/', include('jet.dashboard.urls', 'jet-dashboard')),
     path('', TemplateView.as_view(template_name='api/api-index.html'), name='api-home'),
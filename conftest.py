@@ -0,0 +1,10 @@
+# Third-Party Imports
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached responses must not leak between tests (the test DB rolls back)."""
+    cache.clear()
+    yield
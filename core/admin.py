@@ -132,6 +132,7 @@ class AssetAdmin(admin.ModelAdmin):
         'model_number__make_label__asset_type__asset_type',
         'purchase_date',
         'verified',
+        'last_log_type',
     )
     list_display = (
         'uuid',
@@ -198,6 +199,35 @@ class OfficeWorkspaceAdmin(admin.ModelAdmin):
     list_display = ('section', 'name')
 
 
+class SlowQueryAdmin(admin.ModelAdmin):
+    list_filter = ('database',)
+    list_display = (
+        'sql',
+        'source',
+        'calls',
+        'mean_ms',
+        'max_ms',
+        'total_ms',
+        'last_seen',
+    )
+    search_fields = ('sql', 'source')
+    readonly_fields = (
+        'database',
+        'sql',
+        'source',
+        'plan',
+        'calls',
+        'total_ms',
+        'max_ms',
+        'first_seen',
+        'last_seen',
+    )
+    exclude = ('fingerprint',)
+
+    def has_add_permission(self, request):
+        return False
+
+
 admin.site.register(models.AISUserSync, AISUserSyncAdmin)
 admin.site.register(models.Asset, AssetAdmin)
 admin.site.register(models.User, UserAdmin)
@@ -210,3 +240,4 @@ admin.site.register(models.OfficeFloor, OfficeFloorAdmin)
 admin.site.register(models.OfficeFloorSection, OfficeFloorSectionAdmin)
 admin.site.register(models.OfficeWorkspace, OfficeWorkspaceAdmin)
 admin.site.register(models.Department, DepartmentAdmin)
+admin.site.register(models.SlowQuery, SlowQueryAdmin)
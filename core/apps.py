@@ -1,6 +1,13 @@
 # Third-Party Imports
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
     name = 'core'
+
+    def ready(self):
+        from core import signals  # noqa: F401
+        from core.slow_queries import slow_query_log
+
+        connection_created.connect(slow_query_log.install)
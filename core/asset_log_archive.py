@@ -0,0 +1,246 @@
+# Standard Library
+import csv
+import gzip
+import os
+import re
+from datetime import date
+
+# Third-Party Imports
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+# App Imports
+from core.cache import invalidate_model
+from core.db.partitions import (
+    add_months,
+    create_monthly_partition,
+    DEFAULT_PARTITION_NAME,
+    drop_partition,
+    ensure_monthly_partitions,
+    is_partitioned,
+    month_bounds,
+    month_start,
+    monthly_partitions,
+)
+from core.models import Asset, AssetLog
+from core.models.asset import refresh_asset_last_log
+
+ARCHIVE_NAME = 'asset_logs_{:%Y_%m}.csv.gz'
+ARCHIVE_PATTERN = re.compile(r'^asset_logs_(\d{4})_(\d{2})\.csv\.gz$')
+RESTORE_BATCH_SIZE = 1000
+
+
+def _table():
+    return AssetLog._meta.db_table
+
+
+def _fields():
+    return AssetLog._meta.concrete_fields
+
+
+def archive_path(month):
+    return os.path.join(settings.ASSET_LOG_ARCHIVE_DIR, ARCHIVE_NAME.format(month))
+
+
+def archived_months():
+    """The months whose logs are archived, oldest first."""
+    if not os.path.isdir(settings.ASSET_LOG_ARCHIVE_DIR):
+        return []
+    months = []
+    for name in os.listdir(settings.ASSET_LOG_ARCHIVE_DIR):
+        match = ARCHIVE_PATTERN.match(name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def retention_cutoff(months=None):
+    """
+    The first month kept in the database when `months` months, by default
+    ASSET_LOG_RETENTION_MONTHS, including the current one are kept.
+    """
+    if months is None:
+        months = settings.ASSET_LOG_RETENTION_MONTHS
+    return add_months(month_start(timezone.now()), 1 - months)
+
+
+def _unpartitioned_months(before):
+    """The months before `before` with logs outside of a monthly partition."""
+    start, _ = month_bounds(before)
+    table = _table()
+    if not is_partitioned(table):
+        logs = AssetLog.objects.filter(created_at__lt=start)
+        return set(logs.dates('created_at', 'month'))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT date_trunc('month', created_at)::date FROM {} "
+            "WHERE created_at < %s".format(
+                connection.ops.quote_name(DEFAULT_PARTITION_NAME.format(table))
+            ),
+            [start],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def months_to_archive(before):
+    """
+    Return {month: partition name or None} of the months of logs before the
+    month `before`, None for those whose logs are not in a partition of
+    their own.
+    """
+    months = dict.fromkeys(_unpartitioned_months(before))
+    if is_partitioned(_table()):
+        months.update(
+            (month, name)
+            for month, name in monthly_partitions(_table()).items()
+            if month < before
+        )
+    return dict(sorted(months.items()))
+
+
+def _write_archive(month, write_rows):
+    path = archive_path(month)
+    os.makedirs(settings.ASSET_LOG_ARCHIVE_DIR, exist_ok=True)
+    partial = path + '.partial'
+    with gzip.open(partial, 'wt', newline='') as archive:
+        count = write_rows(archive)
+    # only complete archives carry the archive name
+    os.replace(partial, path)
+    return count
+
+
+def archive_month(month, partition=None):
+    """
+    Write the logs of `month` to its archive and remove them from the
+    database, dropping `partition` if they are in one. Returns the number of
+    logs archived.
+    """
+    quote = connection.ops.quote_name
+    columns = ', '.join(quote(field.column) for field in _fields())
+    start, end = month_bounds(month)
+
+    if partition is not None:
+
+        def write_rows(archive):
+            # the partitions of past months are not written to any more
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT count(*) FROM {}'.format(quote(partition)))
+                count = cursor.fetchone()[0]
+                cursor.copy_expert(
+                    'COPY (SELECT {} FROM {} ORDER BY {}) TO STDOUT '
+                    'WITH CSV HEADER'.format(columns, quote(partition), quote('id')),
+                    archive,
+                )
+            return count
+
+        count = _write_archive(month, write_rows)
+        drop_partition(_table(), partition)
+    else:
+        logs = AssetLog.objects.filter(created_at__gte=start, created_at__lt=end)
+
+        def write_rows(archive):
+            writer = csv.writer(archive)
+            writer.writerow(field.column for field in _fields())
+            count = 0
+            for row in (
+                logs.order_by('id')
+                .values_list(*(field.attname for field in _fields()))
+                .iterator()
+            ):
+                writer.writerow(row)
+                count += 1
+            return count
+
+        with transaction.atomic():
+            count = _write_archive(month, write_rows)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'DELETE FROM {table} WHERE {created_at} >= %s '
+                    'AND {created_at} < %s'.format(
+                        table=quote(_table()), created_at=quote('created_at')
+                    ),
+                    [
+                        connection.ops.adapt_datetimefield_value(value)
+                        for value in (start, end)
+                    ],
+                )
+    invalidate_model(AssetLog)
+    return count
+
+
+def read_archive(month):
+    """Yield the logs archived for `month` as unsaved AssetLogs."""
+    fields = {field.column: field for field in _fields()}
+    with gzip.open(archive_path(month), 'rt', newline='') as archive:
+        reader = csv.reader(archive)
+        columns = [fields[column] for column in next(reader)]
+        for row in reader:
+            yield AssetLog(
+                **{
+                    field.attname: None
+                    if value == '' and field.null
+                    else field.to_python(value)
+                    for field, value in zip(columns, row)
+                }
+            )
+
+
+def restore_month(month):
+    """
+    Load the archived logs of `month` back into the database, where they are
+    kept until they are archived again. Returns the number of logs loaded.
+    """
+    quote = connection.ops.quote_name
+    fields = _fields()
+    start, end = month_bounds(month)
+    if is_partitioned(_table()) and month not in monthly_partitions(_table()):
+        create_monthly_partition(_table(), 'created_at', month)
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        quote(_table()),
+        ', '.join(quote(field.column) for field in fields),
+        ', '.join(['%s'] * len(fields)),
+    )
+    with transaction.atomic():
+        # logs restored earlier are not loaded twice
+        loaded = set(
+            AssetLog.objects.filter(
+                created_at__gte=start, created_at__lt=end
+            ).values_list('id', flat=True)
+        )
+        count = 0
+        asset_ids = set()
+        batch = []
+        logs = (log for log in read_archive(month) if log.id not in loaded)
+        with connection.cursor() as cursor:
+            for log in logs:
+                # inserted as they were, so created_at is not set anew
+                batch.append(
+                    [
+                        field.get_db_prep_save(getattr(log, field.attname), connection)
+                        for field in fields
+                    ]
+                )
+                asset_ids.add(log.asset_id)
+                if len(batch) == RESTORE_BATCH_SIZE:
+                    cursor.executemany(sql, batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                cursor.executemany(sql, batch)
+                count += len(batch)
+        refresh_asset_last_log(Asset.objects.filter(id__in=asset_ids))
+    invalidate_model(AssetLog)
+    return count
+
+
+def prepare_partitions():
+    """
+    Create the log partitions of the next ASSET_LOG_PARTITIONS_AHEAD months
+    that are missing, if the log table is partitioned.
+    """
+    if not is_partitioned(_table()):
+        return []
+    return ensure_monthly_partitions(
+        _table(), 'created_at', settings.ASSET_LOG_PARTITIONS_AHEAD
+    )
@@ -1,4 +1,8 @@
+# Standard Library
+import time
+
 # App Imports
+from core import metrics
 from core.management.commands.import_assets import (
     create_object,
     read_csv_row_value,
@@ -8,6 +12,9 @@ from core.management.commands.import_assets import (
 
 
 def save_asset(data, skipped_file):
+    start = time.perf_counter()
+    skipped_before = len(SKIPPED_ROWS)
+    pos = -1
     for pos, row in enumerate(data):
         row_data = {"row": row, "row_count": pos, "required_for_import": True}
         category_value = read_csv_row_value("Category", row)
@@ -121,6 +128,11 @@ def save_asset(data, skipped_file):
                 asset.specs = asset_spec
                 asset.save()
 
+    skipped = len(SKIPPED_ROWS) - skipped_before
+    metrics.IMPORT_ROWS.inc(pos + 1 - skipped, result='imported')
+    metrics.IMPORT_ROWS.inc(skipped, result='skipped')
+    metrics.IMPORT_DURATION.observe(time.perf_counter() - start)
+
     write_skipped_records(SKIPPED_ROWS, skipped_file)
     if len(SKIPPED_ROWS) > 0:
         return False
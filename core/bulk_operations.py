@@ -0,0 +1,398 @@
+# Standard Library
+from collections import Counter, defaultdict
+
+# Third-Party Imports
+from django.db import connection, models, transaction
+from django.db.models import Case, OuterRef, Q, Subquery, Value, When
+from django.utils import timezone
+
+# App Imports
+from core import constants
+from core.cache import invalidate_model
+from core.inventory import inventory_key, record_inventory_changes
+from core.models import AllocationHistory, Asset, AssetAssignee, AssetLog, AssetStatus
+from core.models.asset import check_asset_limit, refresh_asset_last_log
+from core.slack_bot import SlackIntegration
+
+slack = SlackIntegration()
+
+ASSET_RELATED_FIELDS = ('model_number__make_label__asset_type',)
+ASSIGNEE_RELATED_FIELDS = ('department', 'workspace', 'user')
+
+
+class BulkOperationError(Exception):
+    """
+    Raised when a batch fails validation. `errors` holds one dict per
+    submitted item, empty for the items that were valid.
+    """
+
+    def __init__(self, errors):
+        super().__init__('The batch contains invalid items.')
+        self.errors = errors
+
+
+def _does_not_exist(pk):
+    return ['Invalid pk "{}" - object does not exist.'.format(pk)]
+
+
+def _case_by_asset(values, output_field):
+    """Build a CASE expression assigning a value per asset id in one UPDATE."""
+    return Case(
+        *[When(id=asset_id, then=Value(value)) for asset_id, value in values.items()],
+        output_field=output_field,
+    )
+
+
+def _asset_description(asset):
+    return "{} with serial number {} and asset code {}".format(
+        asset.model_number.make_label.asset_type.asset_type,
+        asset.serial_number,
+        asset.asset_code,
+    )
+
+
+def _notify_assignees(assets_by_assignee):
+    """Send each user one Slack message listing all the assets they received."""
+    for assignee, assets in assets_by_assignee.items():
+        if not assignee.user:
+            continue
+        message = "The following assets have been allocated to you:\n{}".format(
+            '\n'.join('• {}'.format(_asset_description(asset)) for asset in assets)
+        )
+        slack.send_message(message, user=assignee)
+
+
+def _latest_owners(asset_ids):
+    """
+    Map each asset id to the current owner of its latest allocation record,
+    which is None for unallocated assets, in two queries.
+    """
+    latest_allocation = AllocationHistory.objects.filter(asset=OuterRef('pk')).order_by(
+        '-created_at', '-id'
+    )
+    owner_ids = dict(
+        Asset.objects.filter(id__in=asset_ids)
+        .annotate(owner=Subquery(latest_allocation.values('current_owner')[:1]))
+        .values_list('id', 'owner')
+    )
+    owners = AssetAssignee.objects.select_related(*ASSIGNEE_RELATED_FIELDS).in_bulk(
+        {owner_id for owner_id in owner_ids.values() if owner_id}
+    )
+    return {asset_id: owners.get(owner_id) for asset_id, owner_id in owner_ids.items()}
+
+
+def _invalidate_caches(assets):
+    """Invalidate what the bulk writes to `assets` skipped the signals of."""
+    invalidate_model(AllocationHistory)
+    invalidate_model(AssetStatus)
+    invalidate_model(Asset, {asset.asset_location_id for asset in assets})
+
+
+def _count_new_statuses(assets):
+    """Move assets updated in bulk to the inventory summary rows of their status."""
+    changes = Counter()
+    for asset in assets:
+        changes[asset._inventory_key] -= 1
+        asset._inventory_key = inventory_key(asset)
+        changes[asset._inventory_key] += 1
+    record_inventory_changes(changes)
+
+
+def _check_asset_limits(model_numbers):
+    for model_number in model_numbers:
+        check_asset_limit(model_number)
+
+
+@transaction.atomic
+def allocate_assets(allocations):
+    """
+    Allocate many assets at once.
+
+    `allocations` is a list of {'asset': <asset id>, 'current_owner':
+    <assignee id>} dicts. The whole batch is validated before anything is
+    written and is then applied with bulk inserts and a single asset UPDATE,
+    giving the same records as saving each `AllocationHistory` in turn.
+    Slack notifications are sent once the transaction commits.
+
+    Returns the created `AllocationHistory` records in submission order.
+    Raises `BulkOperationError` if any item is invalid.
+    """
+    asset_ids = [item['asset'] for item in allocations]
+    assets = (
+        Asset.objects.select_for_update(of=('self',))
+        .select_related(*ASSET_RELATED_FIELDS)
+        .in_bulk(asset_ids)
+    )
+    assignees = AssetAssignee.objects.select_related(*ASSIGNEE_RELATED_FIELDS).in_bulk(
+        {item['current_owner'] for item in allocations}
+    )
+
+    errors = []
+    seen_assets = set()
+    for item in allocations:
+        item_errors = {}
+        asset = assets.get(item['asset'])
+        if asset is None:
+            item_errors['asset'] = _does_not_exist(item['asset'])
+        elif item['asset'] in seen_assets:
+            item_errors['asset'] = ['This asset appears more than once in the batch.']
+        elif asset.current_status != constants.AVAILABLE:
+            item_errors['asset'] = ['You can only allocate available assets']
+        seen_assets.add(item['asset'])
+        if item['current_owner'] not in assignees:
+            item_errors['current_owner'] = _does_not_exist(item['current_owner'])
+        errors.append(item_errors)
+    if any(errors):
+        raise BulkOperationError(errors)
+
+    previous_owners = _latest_owners(asset_ids)
+    histories = []
+    statuses = []
+    assets_by_assignee = defaultdict(list)
+    for item in allocations:
+        asset = assets[item['asset']]
+        assignee = assignees[item['current_owner']]
+        histories.append(
+            AllocationHistory(
+                asset=asset,
+                current_owner=assignee,
+                previous_owner=previous_owners[asset.id],
+            )
+        )
+        statuses.append(
+            AssetStatus(
+                asset=asset,
+                current_status=constants.ALLOCATED,
+                previous_status=asset.current_status,
+            )
+        )
+        asset.assigned_to = assignee
+        asset.current_status = constants.ALLOCATED
+        assets_by_assignee[assignee].append(asset)
+
+    AllocationHistory.objects.bulk_create(histories)
+    AssetStatus.objects.bulk_create(statuses)
+    Asset.objects.filter(id__in=asset_ids).update(
+        current_status=constants.ALLOCATED,
+        assigned_to=_case_by_asset(
+            {asset_id: asset.assigned_to.id for asset_id, asset in assets.items()},
+            models.IntegerField(),
+        ),
+        search_text=_case_by_asset(
+            {
+                asset_id: asset._build_search_text()
+                for asset_id, asset in assets.items()
+            },
+            models.TextField(),
+        ),
+        last_modified=timezone.now(),
+    )
+    _count_new_statuses(assets.values())
+    _invalidate_caches(assets.values())
+
+    model_numbers = {asset.model_number for asset in assets.values()}
+    transaction.on_commit(lambda: _check_asset_limits(model_numbers))
+    transaction.on_commit(lambda: _notify_assignees(assets_by_assignee))
+    return histories
+
+
+def _lock_assets_by_id_or_code(identifiers):
+    """
+    Lock the assets with the given ids (integers) and codes (strings), and
+    map each id and upper-cased code to the assets it matches.
+    """
+    asset_ids = [item for item in identifiers if isinstance(item, int)]
+    codes = [item for item in identifiers if isinstance(item, str)]
+    # codes are only unique as written, and codes written without save() may
+    # differ from another in case alone
+    assets = (
+        Asset.objects.select_for_update(of=('self',))
+        .select_related(*ASSET_RELATED_FIELDS)
+        .filter(
+            Q(id__in=asset_ids)
+            | Q(asset_code__in={*codes, *(code.upper() for code in codes)})
+        )
+    )
+    asset_codes = {code.upper() for code in codes}
+    found = defaultdict(list)
+    for asset in assets:
+        if asset.id in asset_ids:
+            found[asset.id].append(asset)
+        if asset.asset_code and asset.asset_code.upper() in asset_codes:
+            found[asset.asset_code.upper()].append(asset)
+    return found
+
+
+@transaction.atomic
+def transition_asset_statuses(identifiers, current_status):
+    """
+    Move many assets to `current_status` at once.
+
+    `identifiers` is a list of asset ids (integers) and asset codes
+    (strings). Every asset is resolved and validated before anything is
+    written. The new `AssetStatus` rows are bulk inserted and the assets
+    updated with a single UPDATE. Assets made Available are unassigned, and
+    those that had an owner get a de-allocation `AllocationHistory` record,
+    as saving each `AssetStatus` in turn would do. Stock levels are checked
+    once per model number after the transaction commits.
+
+    Returns the created `AssetStatus` records in submission order.
+    Raises `BulkOperationError` if any item is invalid.
+    """
+    assets = _lock_assets_by_id_or_code(identifiers)
+
+    errors = []
+    resolved = []
+    seen_assets = set()
+    for identifier in identifiers:
+        key = identifier if isinstance(identifier, int) else identifier.upper()
+        matches = assets.get(key, [])
+        asset = matches[0] if len(matches) == 1 else None
+        if not matches:
+            errors.append({'asset': _does_not_exist(identifier)})
+        elif asset is None:
+            errors.append(
+                {
+                    'asset': [
+                        'Asset code "{}" matches more than one asset; use their '
+                        'ids.'.format(identifier)
+                    ]
+                }
+            )
+        elif asset.id in seen_assets:
+            errors.append(
+                {'asset': ['This asset appears more than once in the batch.']}
+            )
+        elif asset.current_status == current_status:
+            errors.append({'asset': ['Asset is already {}.'.format(current_status)]})
+        else:
+            errors.append({})
+            seen_assets.add(asset.id)
+        resolved.append(asset)
+    if any(errors):
+        raise BulkOperationError(errors)
+
+    asset_ids = [asset.id for asset in resolved]
+    statuses = [
+        AssetStatus(
+            asset=asset,
+            current_status=current_status,
+            previous_status=asset.current_status,
+        )
+        for asset in resolved
+    ]
+    changes = {'current_status': current_status, 'last_modified': timezone.now()}
+    if current_status == constants.AVAILABLE:
+        previous_owners = _latest_owners(asset_ids)
+        AllocationHistory.objects.bulk_create(
+            AllocationHistory(asset=asset, previous_owner=previous_owners[asset.id])
+            for asset in resolved
+            if previous_owners[asset.id]
+        )
+        for asset in resolved:
+            asset.assigned_to = None
+        changes['assigned_to'] = None
+        changes['search_text'] = _case_by_asset(
+            {asset.id: asset._build_search_text() for asset in resolved},
+            models.TextField(),
+        )
+    for asset in resolved:
+        asset.current_status = current_status
+
+    AssetStatus.objects.bulk_create(statuses)
+    Asset.objects.filter(id__in=asset_ids).update(**changes)
+    _count_new_statuses(resolved)
+    _invalidate_caches(resolved)
+
+    model_numbers = {asset.model_number for asset in resolved}
+    transaction.on_commit(lambda: _check_asset_limits(model_numbers))
+    return statuses
+
+
+def _find_assets_by_code_or_serial(identifiers):
+    """Map each identifier to the asset with that code or serial number."""
+    identifiers = {identifier.upper() for identifier in identifiers}
+    assets = Asset.objects.filter(
+        Q(asset_code__in=identifiers) | Q(serial_number__in=identifiers)
+    ).only('id', 'asset_code', 'serial_number', 'asset_location')
+    found = {}
+    for asset in assets:
+        found.setdefault(asset.serial_number, asset)
+        found[asset.asset_code] = asset
+    return found
+
+
+def _lock_idempotency_keys(keys):
+    # the database does not enforce the keys' uniqueness, so uploads of the
+    # same keys wait for each other until the end of the transaction
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT pg_advisory_xact_lock(lock) FROM (SELECT DISTINCT '
+            'hashtext(key) AS lock FROM unnest(%s::text[]) AS key ORDER BY lock) '
+            'AS locks',
+            [sorted(keys)],
+        )
+
+
+def _create_asset_logs(scans, checked_by, assets, existing):
+    results = []
+    logs = []
+    for scan in scans:
+        key = scan['idempotency_key']
+        asset = assets.get(scan['asset'].upper())
+        if key in existing:
+            results.append({'idempotency_key': key, 'status': 'duplicate'})
+        elif asset is None:
+            results.append(
+                {
+                    'idempotency_key': key,
+                    'status': 'error',
+                    'errors': {'asset': _does_not_exist(scan['asset'])},
+                }
+            )
+        else:
+            existing[key] = None
+            results.append({'idempotency_key': key, 'status': 'created'})
+            logs.append(
+                AssetLog(
+                    asset=asset,
+                    checked_by=checked_by,
+                    log_type=scan['log_type'],
+                    client_timestamp=scan['client_timestamp'],
+                    idempotency_key=key,
+                )
+            )
+
+    AssetLog.objects.bulk_create(logs)
+    refresh_asset_last_log(Asset.objects.filter(id__in={log.asset_id for log in logs}))
+    invalidate_model(AssetLog)
+    invalidate_model(Asset, {log.asset.asset_location_id for log in logs})
+    return results
+
+
+def record_asset_logs(scans, checked_by):
+    """
+    Record a batch of gate scans for `checked_by`.
+
+    Each scan is {'asset': <asset code or serial number>, 'log_type',
+    'client_timestamp', 'idempotency_key'}. Assets are resolved with one
+    query and the new logs inserted with `bulk_create`. Scans whose
+    idempotency key was already recorded, by an earlier upload or earlier in
+    this batch, are skipped so offline queues can safely be replayed.
+    Unknown assets are reported without blocking the rest of the batch.
+
+    Returns one result per scan, in submission order, with a status of
+    'created', 'duplicate' or 'error'.
+    """
+    assets = _find_assets_by_code_or_serial(scan['asset'] for scan in scans)
+    with transaction.atomic():
+        keys = {scan['idempotency_key'] for scan in scans}
+        _lock_idempotency_keys(keys)
+        existing = dict(
+            AssetLog.objects.filter(idempotency_key__in=keys).values_list(
+                'idempotency_key', 'id'
+            )
+        )
+        return _create_asset_logs(scans, checked_by, assets, existing)
@@ -0,0 +1,119 @@
+# Standard Library
+import hashlib
+import threading
+from contextlib import contextmanager
+
+# Third-Party Imports
+from django.core.cache import cache
+from django.db import transaction
+
+TAXONOMY = 'taxonomy'
+
+VERSION_KEY = 'art:version:{}'
+
+# the field naming the centre of each model kept per centre
+CENTRE_FIELDS = {
+    'core.andelacentre': 'id',
+    'core.asset': 'asset_location_id',
+    'core.officeblock': 'location_id',
+    'core.securityuser': 'location_id',
+    'core.user': 'location_id',
+}
+
+_local = threading.local()
+
+
+def get_namespace_versions(namespaces):
+    """
+    Return the current version of each cache namespace. Cached entries embed
+    the versions in their key, so bumping one invalidates them all at once.
+    """
+    pinned = getattr(_local, 'versions', None)
+    if pinned is not None and all(namespace in pinned for namespace in namespaces):
+        return [pinned[namespace] for namespace in namespaces]
+
+    keys = [VERSION_KEY.format(namespace) for namespace in namespaces]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, 1, timeout=None)
+            found[key] = cache.get(key, 1)
+    versions = [found[key] for key in keys]
+    if pinned is not None:
+        pinned.update(zip(namespaces, versions))
+    return versions
+
+
+def get_namespace_version(namespace):
+    return get_namespace_versions([namespace])[0]
+
+
+@contextmanager
+def pinned_namespace_versions():
+    """
+    Look each namespace version up once in the block, rather than once per
+    key built, e.g. while a list of cached representations is rendered.
+    """
+    if getattr(_local, 'versions', None) is not None:
+        yield
+        return
+    _local.versions = {}
+    try:
+        yield
+    finally:
+        _local.versions = None
+
+
+def _incr_namespace_version(namespace):
+    key = VERSION_KEY.format(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, timeout=None)
+
+
+def bump_namespace_version(namespace):
+    """
+    Invalidate a namespace immediately and again once the current
+    transaction commits, so responses cached from pre-commit reads in the
+    meantime are not served as current.
+    """
+    _incr_namespace_version(namespace)
+    transaction.on_commit(lambda: _incr_namespace_version(namespace))
+
+
+def model_namespace(model, centre_id=None):
+    """
+    Name the namespace of a model's cached entries. Models listed in
+    CENTRE_FIELDS also have one namespace per centre, so writes in one
+    centre leave the entries of the others in place.
+    """
+    label = model._meta.label_lower
+    if centre_id is None or label not in CENTRE_FIELDS:
+        return 'model:{}'.format(label)
+    return 'model:{}:centre:{}'.format(label, centre_id)
+
+
+def invalidate_model(model, centre_ids=()):
+    """
+    Invalidate a model's cached entries, and those of the given centres.
+    Signals do this for saves and deletes; call it after writes that skip
+    them, such as `QuerySet.update()` and `bulk_create()`.
+    """
+    bump_namespace_version(model_namespace(model))
+    if model._meta.label_lower in CENTRE_FIELDS:
+        for centre_id in set(centre_ids) - {None}:
+            bump_namespace_version(model_namespace(model, centre_id))
+
+
+def make_key(namespace, *parts):
+    """
+    Build a cache key embedding the versions of a namespace, or of each
+    namespace in a list.
+    """
+    namespaces = [namespace] if isinstance(namespace, str) else list(namespace)
+    versions = get_namespace_versions(namespaces)
+    digest = hashlib.md5(':'.join(str(part) for part in parts).encode()).hexdigest()
+    return 'art:{}:{}:{}'.format(
+        '+'.join(namespaces), '.'.join(str(version) for version in versions), digest
+    )
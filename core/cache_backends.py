@@ -0,0 +1,296 @@
+# Standard Library
+import os
+import pickle
+import socket
+import threading
+from urllib.parse import urlparse
+
+# Third-Party Imports
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+
+
+class CacheServerError(Exception):
+    """An error reply from a Redis-protocol server."""
+
+
+def encode_command(*args):
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b'*%d\r\n' % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+    return b''.join(parts)
+
+
+def read_reply(reader):
+    """Read one RESP value from a binary file-like object."""
+    line = reader.readline()
+    if not line.endswith(b'\r\n'):
+        raise ConnectionError('Connection closed by the cache server.')
+    kind, rest = line[:1], line[1:-2]
+    if kind == b'+':
+        return rest.decode()
+    if kind == b'-':
+        raise CacheServerError(rest.decode())
+    if kind == b':':
+        return int(rest)
+    if kind == b'$':
+        length = int(rest)
+        if length < 0:
+            return None
+        return reader.read(length + 2)[:-2]
+    if kind == b'*':
+        length = int(rest)
+        if length < 0:
+            return None
+        return [read_reply(reader) for _ in range(length)]
+    raise CacheServerError('Unknown reply type {!r}.'.format(kind))
+
+
+def _dumps(value):
+    # integers are stored as text so that INCRBY can change them
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value).encode()
+    return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+def _loads(raw):
+    if raw is None:
+        return None
+    if raw.lstrip(b'-').isdigit():
+        return int(raw)
+    return pickle.loads(raw)
+
+
+class RedisCache(BaseCache):
+    """
+    Cache backend for a server speaking the Redis protocol, at a LOCATION
+    such as redis://:password@host:6379/0. Each thread keeps one connection.
+
+    `run_cache_server` starts a local stand-in speaking the same commands.
+    """
+
+    def __init__(self, server, params):
+        super().__init__(params)
+        url = urlparse(server or 'redis://127.0.0.1:6379/0')
+        self.address = (url.hostname or '127.0.0.1', url.port or 6379)
+        self.password = url.password
+        self.db = int(url.path.lstrip('/') or 0)
+        self._local = threading.local()
+
+    def _connect(self):
+        sock = socket.create_connection(self.address, timeout=5)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._local.connection = (os.getpid(), sock, sock.makefile('rb'))
+        if self.password:
+            self._command('AUTH', self.password)
+        if self.db:
+            self._command('SELECT', self.db)
+
+    def _disconnect(self):
+        connection = getattr(self._local, 'connection', None)
+        self._local.connection = None
+        if connection is not None:
+            connection[2].close()
+            connection[1].close()
+
+    def _command(self, *args):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or connection[0] != os.getpid():
+            # a connection inherited from the parent process is not ours
+            self._local.connection = None
+            self._connect()
+            connection = self._local.connection
+        try:
+            connection[1].sendall(encode_command(*args))
+            return read_reply(connection[2])
+        except OSError:
+            self._disconnect()
+            raise
+
+    def _key(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        return key
+
+    def _expiry(self, timeout):
+        """Return the SET arguments for a timeout, or None if already expired."""
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None:
+            return []
+        if timeout <= 0:
+            return None
+        return ['PX', int(timeout * 1000)]
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        expiry = self._expiry(timeout)
+        if expiry is None:
+            return False
+        key = self._key(key, version)
+        return self._command('SET', key, _dumps(value), 'NX', *expiry) == 'OK'
+
+    def get(self, key, default=None, version=None):
+        value = _loads(self._command('GET', self._key(key, version)))
+        return default if value is None else value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        expiry = self._expiry(timeout)
+        key = self._key(key, version)
+        if expiry is None:
+            self._command('DEL', key)
+        else:
+            self._command('SET', key, _dumps(value), *expiry)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        expiry = self._expiry(timeout)
+        key = self._key(key, version)
+        if expiry is None:
+            return self._command('DEL', key) == 1
+        if not expiry:
+            return (
+                self._command('PERSIST', key) == 1 or self._command('EXISTS', key) == 1
+            )
+        return self._command('PEXPIRE', key, expiry[1]) == 1
+
+    def delete(self, key, version=None):
+        self._command('DEL', self._key(key, version))
+
+    def delete_many(self, keys, version=None):
+        keys = [self._key(key, version) for key in keys]
+        if keys:
+            self._command('DEL', *keys)
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = self._command('MGET', *[self._key(key, version) for key in keys])
+        return {
+            key: _loads(value) for key, value in zip(keys, values) if value is not None
+        }
+
+    def has_key(self, key, version=None):
+        return self._command('EXISTS', self._key(key, version)) == 1
+
+    def incr(self, key, delta=1, version=None):
+        key = self._key(key, version)
+        if self._command('EXISTS', key) != 1:
+            raise ValueError("Key '%s' not found" % key)
+        try:
+            return self._command('INCRBY', key, delta)
+        except CacheServerError as error:
+            raise ValueError(str(error))
+
+    def clear(self):
+        self._command('FLUSHDB')
+
+    def close(self, **kwargs):
+        # called at the end of every request; the connection is kept for the next
+        pass
+
+
+class TieredCache(BaseCache):
+    """
+    A per-process LRU tier in front of the cache named by the SHARED option.
+
+    Entries are kept locally for at most LOCAL_TIMEOUT seconds, which bounds
+    how long another worker's writes can go unseen. Keys starting with one of
+    the SHARED_ONLY prefixes, such as the namespace versions, are always read
+    from the shared cache.
+    """
+
+    def __init__(self, name, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self.shared_alias = options['SHARED']
+        self.local_timeout = options.get('LOCAL_TIMEOUT', 5)
+        self.shared_only = tuple(options.get('SHARED_ONLY', ()))
+        self.local = LocMemCache(
+            'tiered-{}'.format(name),
+            {
+                'TIMEOUT': self.local_timeout,
+                'OPTIONS': {'MAX_ENTRIES': options.get('LOCAL_MAX_ENTRIES', 1000)},
+            },
+        )
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def _is_local(self, key):
+        return not key.startswith(self.shared_only)
+
+    def _local_timeout(self, timeout):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None:
+            return self.local_timeout
+        return min(timeout, self.local_timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version)
+        if added and self._is_local(key):
+            self.local.set(key, value, self._local_timeout(timeout), version)
+        return added
+
+    def get(self, key, default=None, version=None):
+        if not self._is_local(key):
+            return self.shared.get(key, default, version)
+        sentinel = object()
+        value = self.local.get(key, sentinel, version)
+        if value is sentinel:
+            value = self.shared.get(key, sentinel, version)
+            if value is sentinel:
+                return default
+            self.local.set(key, value, self.local_timeout, version)
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        found = self.local.get_many(
+            [key for key in keys if self._is_local(key)], version
+        )
+        missing = [key for key in keys if key not in found]
+        if missing:
+            fetched = self.shared.get_many(missing, version)
+            for key, value in fetched.items():
+                if self._is_local(key):
+                    self.local.set(key, value, self.local_timeout, version)
+            found.update(fetched)
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version)
+        if self._is_local(key):
+            self.local.set(key, value, self._local_timeout(timeout), version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self.local.delete(key, version)
+        return self.shared.touch(key, timeout, version)
+
+    def delete(self, key, version=None):
+        self.local.delete(key, version)
+        self.shared.delete(key, version)
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self.local.delete_many(keys, version)
+        self.shared.delete_many(keys, version)
+
+    def has_key(self, key, version=None):
+        # Django's cache API; `key in cache` cannot pass a version
+        if self.local.has_key(key, version):  # noqa: W601
+            return True
+        return self.shared.has_key(key, version)  # noqa: W601
+
+    def incr(self, key, delta=1, version=None):
+        self.local.delete(key, version)
+        return self.shared.incr(key, delta, version)
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
@@ -0,0 +1,147 @@
+# Standard Library
+import socketserver
+import threading
+import time
+
+# App Imports
+from core.cache_backends import CacheServerError, read_reply
+
+
+def _encode_reply(value):
+    if isinstance(value, CacheServerError):
+        return b'-ERR %s\r\n' % str(value).encode()
+    if value is None:
+        return b'$-1\r\n'
+    if isinstance(value, str):
+        return b'+%s\r\n' % value.encode()
+    if isinstance(value, int):
+        return b':%d\r\n' % value
+    if isinstance(value, bytes):
+        return b'$%d\r\n%s\r\n' % (len(value), value)
+    return b'*%d\r\n' % len(value) + b''.join(_encode_reply(item) for item in value)
+
+
+class CacheStore:
+    """
+    The Redis commands used by RedisCache, over per-database dicts of
+    {key: (value, expiry time or None)}.
+    """
+
+    def __init__(self):
+        self.databases = {}
+        self.lock = threading.Lock()
+        self.commands = {
+            'PING': self._ping_cmd,
+            'GET': self._get_cmd,
+            'MGET': self._mget_cmd,
+            'SET': self._set_cmd,
+            'DEL': self._del_cmd,
+            'EXISTS': self._exists_cmd,
+            'INCRBY': self._incrby_cmd,
+            'PEXPIRE': self._pexpire_cmd,
+            'PERSIST': self._persist_cmd,
+            'FLUSHDB': self._flushdb_cmd,
+        }
+
+    def _get(self, data, key):
+        entry = data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.time():
+            del data[key]
+            entry = None
+        return entry
+
+    def execute(self, db, command, args):
+        handler = self.commands.get(command)
+        if handler is None:
+            raise CacheServerError("unknown command '{}'".format(command))
+        data = self.databases.setdefault(db, {})
+        with self.lock:
+            return handler(data, args)
+
+    def _ping_cmd(self, data, args):
+        return 'PONG'
+
+    def _get_cmd(self, data, args):
+        entry = self._get(data, args[0])
+        return entry and entry[0]
+
+    def _mget_cmd(self, data, args):
+        return [(self._get(data, key) or (None,))[0] for key in args]
+
+    def _set_cmd(self, data, args):
+        key, value, options = args[0], args[1], [arg.upper() for arg in args[2:]]
+        if b'NX' in options and self._get(data, key) is not None:
+            return None
+        expiry = None
+        if b'PX' in options:
+            expiry = time.time() + int(options[options.index(b'PX') + 1]) / 1000
+        data[key] = (value, expiry)
+        return 'OK'
+
+    def _del_cmd(self, data, args):
+        return sum(data.pop(key, None) is not None for key in args)
+
+    def _exists_cmd(self, data, args):
+        return sum(self._get(data, key) is not None for key in args)
+
+    def _incrby_cmd(self, data, args):
+        entry = self._get(data, args[0]) or (b'0', None)
+        try:
+            value = int(entry[0]) + int(args[1])
+        except ValueError:
+            raise CacheServerError('value is not an integer or out of range')
+        data[args[0]] = (str(value).encode(), entry[1])
+        return value
+
+    def _pexpire_cmd(self, data, args):
+        entry = self._get(data, args[0])
+        if entry is None:
+            return 0
+        data[args[0]] = (entry[0], time.time() + int(args[1]) / 1000)
+        return 1
+
+    def _persist_cmd(self, data, args):
+        entry = self._get(data, args[0])
+        if entry is None or entry[1] is None:
+            return 0
+        data[args[0]] = (entry[0], None)
+        return 1
+
+    def _flushdb_cmd(self, data, args):
+        data.clear()
+        return 'OK'
+
+
+class CacheRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        db = 0
+        while True:
+            try:
+                request = read_reply(self.rfile)
+            except ConnectionError:
+                return
+            command, args = request[0].decode().upper(), request[1:]
+            try:
+                if command == 'SELECT':
+                    db, reply = int(args[0]), 'OK'
+                elif command == 'AUTH':
+                    reply = 'OK'
+                else:
+                    reply = self.server.store.execute(db, command, args)
+            except CacheServerError as error:
+                reply = error
+            self.wfile.write(_encode_reply(reply))
+
+
+class CacheServer(socketserver.ThreadingTCPServer):
+    """
+    A local stand-in for Redis, for development and tests, answering the
+    commands RedisCache sends. Values are kept in memory only.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address):
+        super().__init__(address, CacheRequestHandler)
+        self.store = CacheStore()
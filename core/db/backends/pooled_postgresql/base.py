@@ -0,0 +1,76 @@
+# Standard Library
+import os
+import threading
+
+# Third-Party Imports
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.creation import DatabaseCreation as BaseCreation
+
+# App Imports
+from core.db.pool import ConnectionPool, PoolTimeout
+
+_pools = {}
+_lock = threading.Lock()
+
+
+def _get_pool(key, connect, options):
+    with _lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(
+                connect,
+                size=options.get('SIZE', 10),
+                timeout=options.get('TIMEOUT', 10),
+                max_age=options.get('MAX_AGE', 600),
+                check_interval=options.get('CHECK_INTERVAL', 30),
+            )
+        return pool
+
+
+def close_pools():
+    """Close the idle connections of every pool in this process."""
+    with _lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+class DatabaseCreation(BaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # a database cannot be dropped while pooled connections are open to it
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL connections borrowed from a bounded pool per process and
+    database, configured by the POOL dict of the database settings (SIZE,
+    TIMEOUT, MAX_AGE and CHECK_INTERVAL), instead of opened for each thread.
+
+    Closing the connection, which Django does at the end of each request
+    when CONN_MAX_AGE is 0, returns it to the pool.
+    """
+
+    creation_class = DatabaseCreation
+
+    def get_new_connection(self, conn_params):
+        # processes forked from one with a pool get their own
+        key = (os.getpid(), self.alias, repr(sorted(conn_params.items())))
+        pool = _get_pool(
+            key,
+            lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+            self.settings_dict.get('POOL', {}),
+        )
+        try:
+            connection = pool.acquire()
+        except PoolTimeout as error:
+            raise base.Database.OperationalError(str(error))
+        self._pool = pool
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self._pool.release(self.connection)
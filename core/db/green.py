@@ -0,0 +1,27 @@
+"""
+Cooperative psycopg2 for gevent workers: while a query waits on the
+server, other greenlets run instead of the whole worker blocking.
+"""
+# Third-Party Imports
+from gevent.socket import wait_read, wait_write
+from psycopg2 import extensions, OperationalError
+
+
+def _wait_callback(connection, timeout=None):
+    while True:
+        state = connection.poll()
+        if state == extensions.POLL_OK:
+            return
+        if state == extensions.POLL_READ:
+            wait_read(connection.fileno(), timeout=timeout)
+        elif state == extensions.POLL_WRITE:
+            wait_write(connection.fileno(), timeout=timeout)
+        else:
+            raise OperationalError('Bad result from poll: {!r}'.format(state))
+
+
+def patch_psycopg():
+    """Make psycopg2 yield to other greenlets while waiting on the database."""
+    if not hasattr(extensions, 'set_wait_callback'):
+        raise ImportError('psycopg2 is too old to support coroutines.')
+    extensions.set_wait_callback(_wait_callback)
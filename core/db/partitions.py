@@ -0,0 +1,126 @@
+# Standard Library
+import re
+from datetime import date, datetime
+
+# Third-Party Imports
+from django.db import connection, transaction
+from django.utils import timezone
+
+PARTITION_NAME = '{}_p{:%Y_%m}'
+DEFAULT_PARTITION_NAME = '{}_default'
+
+
+def month_start(value):
+    """The first day of the month of a date or datetime."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bounds(month):
+    """The [start, end) datetimes of a month, in UTC."""
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    end = add_months(month, 1)
+    return start, datetime(end.year, end.month, 1, tzinfo=timezone.utc)
+
+
+def is_partitioned(table):
+    """Whether `table` is a PostgreSQL partitioned table."""
+    if connection.vendor != 'postgresql' or connection.pg_version < 110000:
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table '
+            'WHERE partrelid = to_regclass(%s))',
+            [table],
+        )
+        return cursor.fetchone()[0]
+
+
+def _partition_names(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = to_regclass(%s)',
+            [table],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def monthly_partitions(table):
+    """Return {month: partition name} of the monthly partitions of `table`."""
+    pattern = re.compile(r'^{}_p(\d{{4}})_(\d{{2}})$'.format(re.escape(table)))
+    partitions = {}
+    for name in _partition_names(table):
+        match = pattern.match(name)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = name
+    return partitions
+
+
+def create_monthly_partition(table, column, month):
+    """
+    Add the partition of `month` to `table`, partitioned by range of the
+    timestamp `column`, moving its rows out of the default partition.
+    """
+    quote = connection.ops.quote_name
+    name = PARTITION_NAME.format(table, month)
+    default = DEFAULT_PARTITION_NAME.format(table)
+    start, end = month_bounds(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        # attaching locks the parent exclusively anyway; taking that lock
+        # first keeps rows of the month from reaching the default partition
+        # once they have been moved
+        cursor.execute('LOCK TABLE {} IN ACCESS EXCLUSIVE MODE'.format(quote(table)))
+        cursor.execute(
+            'CREATE TABLE {} (LIKE {} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'.format(
+                quote(name), quote(table)
+            )
+        )
+        if default in _partition_names(table):
+            cursor.execute(
+                'WITH moved AS (DELETE FROM {default} WHERE {column} >= %s '
+                'AND {column} < %s RETURNING *) INSERT INTO {name} '
+                'SELECT * FROM moved'.format(
+                    default=quote(default), column=quote(column), name=quote(name)
+                ),
+                [start, end],
+            )
+        # matching indexes and foreign keys are created while attaching;
+        # PostgreSQL 11 only takes literals, not casts, as partition bounds
+        cursor.execute(
+            'ALTER TABLE {} ATTACH PARTITION {} FOR VALUES FROM (%s) TO (%s)'.format(
+                quote(table), quote(name)
+            ),
+            [start.isoformat(), end.isoformat()],
+        )
+    return name
+
+
+def ensure_monthly_partitions(table, column, months_ahead):
+    """
+    Create the partitions of `table` from the current month to `months_ahead`
+    months later that do not exist yet, and return their names.
+    """
+    existing = monthly_partitions(table)
+    this_month = month_start(timezone.now())
+    created = []
+    for months in range(months_ahead + 1):
+        month = add_months(this_month, months)
+        if month not in existing:
+            created.append(create_monthly_partition(table, column, month))
+    return created
+
+
+def drop_partition(table, name):
+    """Detach the partition `name` of `table` and drop it."""
+    quote = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            'ALTER TABLE {} DETACH PARTITION {}'.format(quote(table), quote(name))
+        )
+        cursor.execute('DROP TABLE {}'.format(quote(name)))
@@ -0,0 +1,107 @@
+# Standard Library
+import threading
+import time
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection is free within the pool's timeout."""
+
+
+class ConnectionPool:
+    """
+    A bounded pool of DB-API connections, shared by the threads (or, under
+    gevent, the greenlets) of one process.
+
+    At most `size` connections are checked out at once; callers wait up to
+    `timeout` seconds for one to be released. Connections are closed once
+    they are `max_age` seconds old, and checked with a `SELECT 1` before being
+    handed out when they have been idle for `check_interval` seconds.
+    """
+
+    def __init__(self, connect, size=10, timeout=10, max_age=600, check_interval=30):
+        self.connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.max_age = max_age
+        self.check_interval = check_interval
+        self.slots = threading.BoundedSemaphore(size)
+        self.lock = threading.Lock()
+        # (connection, released at), most recently released last
+        self.idle = []
+        self.created_at = {}
+        self.closed = False
+
+    def acquire(self):
+        if not self.slots.acquire(timeout=self.timeout):
+            raise PoolTimeout(
+                'No database connection was released within {}s; the pool '
+                'holds {}.'.format(self.timeout, self.size)
+            )
+        try:
+            return self._checkout()
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def _checkout(self):
+        while True:
+            with self.lock:
+                connection, released_at = self.idle.pop() if self.idle else (None, 0)
+            if connection is None:
+                connection = self.connect()
+                self.created_at[id(connection)] = time.monotonic()
+                return connection
+            if self._expired(connection):
+                self._discard(connection)
+            elif time.monotonic() - released_at >= self.check_interval and (
+                not self._is_usable(connection)
+            ):
+                self._discard(connection)
+            else:
+                return connection
+
+    def release(self, connection):
+        """Return a checked out connection, rolling back what it left open."""
+        try:
+            connection.rollback()
+        except Exception:
+            self._discard(connection)
+        else:
+            if self.closed or self._expired(connection):
+                self._discard(connection)
+            else:
+                with self.lock:
+                    self.idle.append((connection, time.monotonic()))
+        finally:
+            self.slots.release()
+
+    def close(self):
+        """Close the idle connections; checked out ones close when released."""
+        with self.lock:
+            self.closed = True
+            idle, self.idle = self.idle, []
+        for connection, released_at in idle:
+            self._discard(connection)
+
+    def _expired(self, connection):
+        created_at = self.created_at.get(id(connection), 0)
+        return time.monotonic() - created_at >= self.max_age
+
+    def _is_usable(self, connection):
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute('SELECT 1')
+            finally:
+                cursor.close()
+            connection.rollback()
+        except Exception:
+            return False
+        return True
+
+    def _discard(self, connection):
+        self.created_at.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -0,0 +1,163 @@
+# Standard Library
+import logging
+import random
+import threading
+import time
+
+# Third-Party Imports
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections, DatabaseError, DEFAULT_DB_ALIAS
+from django.utils.functional import empty, LazyObject
+
+logger = logging.getLogger(__name__)
+
+PINNED_KEY = 'art:replica:pinned:{}'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+API_PREFIX = '/api/'
+
+_local = threading.local()
+# {alias: (checked at, usable)}, per process
+_checks = {}
+_checks_lock = threading.Lock()
+
+
+def replica_lag(alias):
+    """Return how many seconds the replica `alias` is behind the primary."""
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        return 0
+    if connection.pg_version >= 100000:
+        received, replayed = 'pg_last_wal_receive_lsn()', 'pg_last_wal_replay_lsn()'
+    else:
+        received = 'pg_last_xlog_receive_location()'
+        replayed = 'pg_last_xlog_replay_location()'
+    with connection.cursor() as cursor:
+        # a replica that has replayed all it received is only idle, not behind
+        cursor.execute(
+            'SELECT CASE WHEN {} = {} THEN 0 ELSE EXTRACT(EPOCH FROM '
+            'now() - pg_last_xact_replay_timestamp()) END'.format(received, replayed)
+        )
+        return float(cursor.fetchone()[0] or 0)
+
+
+def is_usable(alias):
+    """
+    Whether the replica `alias` is at most REPLICA_MAX_LAG_SECONDS behind,
+    checked at most once every REPLICA_LAG_CHECK_INTERVAL seconds.
+    """
+    now = time.monotonic()
+    checked = _checks.get(alias)
+    if checked is not None and now - checked[0] < settings.REPLICA_LAG_CHECK_INTERVAL:
+        return checked[1]
+    try:
+        lag = replica_lag(alias)
+    except DatabaseError:
+        logger.warning('Could not check replica %s', alias, exc_info=True)
+        usable = False
+    else:
+        usable = lag <= settings.REPLICA_MAX_LAG_SECONDS
+        if not usable:
+            logger.warning('Replica %s is %.1f seconds behind', alias, lag)
+    with _checks_lock:
+        _checks[alias] = (now, usable)
+    return usable
+
+
+def _user_id(request):
+    # the user DRF authenticated, or the one Django's middleware already
+    # loaded; loading it here would query the database being chosen
+    user = request.__dict__.get('user')
+    if isinstance(user, LazyObject):
+        user = user._wrapped
+    return None if user is empty else getattr(user, 'pk', None)
+
+
+def _read_database(state):
+    if state['pinned'] is None:
+        user_id = _user_id(state['request'])
+        if user_id is not None:
+            state['pinned'] = cache.get(PINNED_KEY.format(user_id)) is not None
+    if state['pinned']:
+        return DEFAULT_DB_ALIAS
+    if state['replica'] is None:
+        usable = [alias for alias in settings.REPLICA_DATABASES if is_usable(alias)]
+        state['replica'] = random.choice(usable) if usable else DEFAULT_DB_ALIAS
+    return state['replica']
+
+
+class ReplicaRouter:
+    """
+    Send the reads of safe API requests to one of the REPLICA_DATABASES, and
+    everything else to the primary.
+
+    Users read from the primary for REPLICA_STICKY_SECONDS after one of their
+    requests wrote, so they see their own changes, and replicas lagging more
+    than REPLICA_MAX_LAG_SECONDS are skipped.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = getattr(_local, 'state', None)
+        if state is None:
+            return DEFAULT_DB_ALIAS
+        return _read_database(state)
+
+    def db_for_write(self, model, **hints):
+        # also for instances read from a replica
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replicas get their tables from the primary
+        if db in settings.REPLICA_DATABASES:
+            return False
+        return None
+
+
+class ReplicaMiddleware:
+    """
+    Mark safe API requests as readable from a replica for ReplicaRouter,
+    and pin users to the primary after their writes.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REPLICA_DATABASES:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.method not in SAFE_METHODS:
+            response = self.get_response(request)
+            user_id = _user_id(request)
+            if (
+                response.status_code < 400
+                and user_id is not None
+                and settings.REPLICA_STICKY_SECONDS > 0
+            ):
+                cache.set(
+                    PINNED_KEY.format(user_id), 1, settings.REPLICA_STICKY_SECONDS
+                )
+            return response
+
+        if not request.path.startswith(API_PREFIX):
+            return self.get_response(request)
+        state = {'request': request, 'pinned': None, 'replica': None}
+        _local.state = state
+        try:
+            response = self.get_response(request)
+        finally:
+            _local.state = None
+        if response.streaming:
+            response.streaming_content = self._stream(state, response.streaming_content)
+        return response
+
+    def _stream(self, state, content):
+        # streamed exports query while the response is being sent
+        _local.state = state
+        try:
+            yield from content
+        finally:
+            _local.state = None
@@ -0,0 +1,399 @@
+# Standard Library
+import random
+import uuid
+from collections import Counter
+from datetime import timedelta
+from itertools import islice
+
+# Third-Party Imports
+from django.utils import timezone
+
+# App Imports
+from core import constants
+from core.inventory import record_inventory_changes
+from core.models import (
+    AllocationHistory,
+    AndelaCentre,
+    Asset,
+    AssetAssignee,
+    AssetCategory,
+    AssetLog,
+    AssetMake,
+    AssetModelNumber,
+    AssetStatus,
+    AssetSubCategory,
+    AssetType,
+    Country,
+    OfficeBlock,
+    OfficeFloor,
+    OfficeFloorSection,
+    OfficeWorkspace,
+    SecurityUser,
+    User,
+)
+
+EMAIL_DOMAIN = 'inventory.test'
+
+# rows created per parent at each level of the office hierarchy
+HIERARCHY = {'blocks': 2, 'floors': 3, 'sections': 4, 'workspaces': 10}
+
+# rows created per parent at each level of the asset taxonomy
+TAXONOMY = {'categories': 2, 'sub_categories': 2, 'types': 3, 'makes': 3, 'models': 4}
+
+
+def _bulk_create(model, objects, batch_size):
+    """bulk_create from an iterable without holding all of it in memory."""
+    objects = iter(objects)
+    created = 0
+    while True:
+        batch = list(islice(objects, batch_size))
+        if not batch:
+            return created
+        model.objects.bulk_create(batch)
+        created += len(batch)
+
+
+def _status_history(rng, length, users):
+    """
+    Return [(status, owner index or None), ...] for one asset, oldest first.
+    Assets alternate between allocations and returns, and a few end up
+    damaged or lost.
+    """
+    history = [(constants.AVAILABLE, None)]
+    for _ in range(length - 1):
+        status, owner = history[-1]
+        if status == constants.AVAILABLE:
+            history.append((constants.ALLOCATED, rng.randrange(users)))
+        elif status == constants.ALLOCATED and rng.random() < 0.05:
+            history.append((rng.choice([constants.DAMAGED, constants.LOST]), owner))
+        else:
+            history.append((constants.AVAILABLE, None))
+    return history
+
+
+class InventoryGenerator:
+    """
+    Write a synthetic inventory with `bulk_create`: centres with their office
+    hierarchy, the asset taxonomy, users, assets and their status,
+    allocation and check-in histories.
+
+    Model save() hooks do not run, so the denormalised asset fields
+    (current status, assignee, check-in status and search text) are filled
+    in directly and agree with the generated histories, and the inventory
+    summary is incremented once per row. Each run uses its
+    own name prefix and can be repeated against the same database.
+    """
+
+    def __init__(
+        self,
+        assets,
+        users,
+        statuses,
+        logs,
+        centres=3,
+        hierarchy=None,
+        taxonomy=None,
+        batch_size=5000,
+        seed=0,
+        stdout=None,
+    ):
+        self.assets = assets
+        self.users = max(users, 1)
+        self.statuses_per_asset = max(statuses // max(assets, 1), 1)
+        self.logs_per_asset = logs // max(assets, 1)
+        self.centres = centres
+        self.hierarchy = dict(HIERARCHY, **(hierarchy or {}))
+        self.taxonomy = dict(TAXONOMY, **(taxonomy or {}))
+        self.batch_size = batch_size
+        self.seed = seed
+        self.stdout = stdout
+        self.prefix = uuid.uuid4().hex[:6].upper()
+        self.start = timezone.now() - timedelta(days=365)
+
+    def _log(self, message):
+        if self.stdout:
+            self.stdout.write(message)
+
+    def _name(self, *parts):
+        return ' '.join([self.prefix, *map(str, parts)])
+
+    def generate(self):
+        centres = self._create_centres()
+        self._create_offices(centres)
+        model_numbers = self._create_taxonomy()
+        assignee_ids = self._create_users(centres)
+        asset_ids = self._create_assets(centres, model_numbers, assignee_ids)
+        self._create_histories(asset_ids, assignee_ids)
+        self._create_logs(asset_ids, centres)
+        return {
+            'prefix': self.prefix,
+            'centres': [centre.id for centre in centres],
+            'assets': len(asset_ids),
+            'users': len(assignee_ids),
+        }
+
+    def _create_centres(self):
+        country, _ = Country.objects.get_or_create(name='Kenya')
+        AndelaCentre.objects.bulk_create(
+            AndelaCentre(centre_name=self._name('Centre', i), country=country)
+            for i in range(self.centres)
+        )
+        return list(AndelaCentre.objects.filter(centre_name__startswith=self.prefix))
+
+    def _create_offices(self, centres):
+        OfficeBlock.objects.bulk_create(
+            OfficeBlock(name=self._name('Block', i), location=centre)
+            for centre in centres
+            for i in range(self.hierarchy['blocks'])
+        )
+        blocks = OfficeBlock.objects.filter(name__startswith=self.prefix)
+        OfficeFloor.objects.bulk_create(
+            OfficeFloor(number=number, block=block)
+            for block in blocks
+            for number in range(self.hierarchy['floors'])
+        )
+        floors = OfficeFloor.objects.filter(block__in=blocks)
+        OfficeFloorSection.objects.bulk_create(
+            OfficeFloorSection(name=self._name('Section', i), floor=floor)
+            for floor in floors
+            for i in range(self.hierarchy['sections'])
+        )
+        sections = OfficeFloorSection.objects.filter(name__startswith=self.prefix)
+        _bulk_create(
+            OfficeWorkspace,
+            (
+                OfficeWorkspace(name=self._name('Desk', i), section=section)
+                for section in sections
+                for i in range(self.hierarchy['workspaces'])
+            ),
+            self.batch_size,
+        )
+        workspaces = OfficeWorkspace.objects.filter(name__startswith=self.prefix)
+        _bulk_create(
+            AssetAssignee,
+            (
+                AssetAssignee(workspace_id=workspace_id)
+                for workspace_id in workspaces.values_list('id', flat=True)
+            ),
+            self.batch_size,
+        )
+        self._log('Created {} workspaces.'.format(workspaces.count()))
+
+    def _create_taxonomy(self):
+        AssetCategory.objects.bulk_create(
+            AssetCategory(category_name=self._name('Category', i))
+            for i in range(self.taxonomy['categories'])
+        )
+        AssetSubCategory.objects.bulk_create(
+            AssetSubCategory(
+                sub_category_name=self._name('Sub Category', category.id, i),
+                asset_category=category,
+            )
+            for category in AssetCategory.objects.filter(
+                category_name__startswith=self.prefix
+            )
+            for i in range(self.taxonomy['sub_categories'])
+        )
+        AssetType.objects.bulk_create(
+            AssetType(
+                asset_type=self._name('Type', sub_category.id, i),
+                asset_sub_category=sub_category,
+            )
+            for sub_category in AssetSubCategory.objects.filter(
+                sub_category_name__startswith=self.prefix
+            )
+            for i in range(self.taxonomy['types'])
+        )
+        AssetMake.objects.bulk_create(
+            AssetMake(
+                make_label=self._name('Make', asset_type.id, i), asset_type=asset_type
+            )
+            for asset_type in AssetType.objects.filter(
+                asset_type__startswith=self.prefix
+            )
+            for i in range(self.taxonomy['makes'])
+        )
+        AssetModelNumber.objects.bulk_create(
+            AssetModelNumber(
+                model_number=self._name('MN', make.id, i).replace(' ', '-'),
+                make_label=make,
+            )
+            for make in AssetMake.objects.filter(make_label__startswith=self.prefix)
+            for i in range(self.taxonomy['models'])
+        )
+        model_numbers = list(
+            AssetModelNumber.objects.filter(
+                make_label__make_label__startswith=self.prefix
+            ).select_related('make_label__asset_type')
+        )
+        self._log('Created {} model numbers.'.format(len(model_numbers)))
+        return model_numbers
+
+    def _create_users(self, centres):
+        local_part = '{}.fellow'.format(self.prefix.lower())
+        email = local_part + '{}@' + EMAIL_DOMAIN
+        _bulk_create(
+            User,
+            (
+                User(
+                    email=email.format(i),
+                    first_name='Fellow',
+                    last_name=str(i),
+                    cohort=i % 30,
+                    location=centres[i % len(centres)],
+                )
+                for i in range(self.users)
+            ),
+            self.batch_size,
+        )
+        users = User.objects.filter(
+            email__startswith=local_part, email__endswith=EMAIL_DOMAIN
+        )
+        _bulk_create(
+            AssetAssignee,
+            (
+                AssetAssignee(user_id=user_id)
+                for user_id in users.values_list('id', flat=True)
+            ),
+            self.batch_size,
+        )
+        assignees = AssetAssignee.objects.filter(user__in=users).order_by('id')
+        assignee_ids = list(assignees.values_list('id', flat=True))
+        self._log('Created {} users.'.format(len(assignee_ids)))
+        return assignee_ids
+
+    def _asset_rng(self, index, purpose):
+        return random.Random('{}:{}:{}'.format(self.seed, index, purpose))
+
+    def _asset_history(self, index, assignee_count):
+        rng = self._asset_rng(index, 'history')
+        return _status_history(rng, self.statuses_per_asset, assignee_count)
+
+    def _create_assets(self, centres, model_numbers, assignee_ids):
+        assignee_emails = dict(
+            AssetAssignee.objects.filter(
+                user__email__endswith=EMAIL_DOMAIN,
+                user__email__startswith='{}.fellow'.format(self.prefix.lower()),
+            ).values_list('id', 'user__email')
+        )
+
+        counts = Counter()
+
+        def assets():
+            for index in range(self.assets):
+                model_number = self._asset_rng(index, 'model').choice(model_numbers)
+                status, owner = self._asset_history(index, len(assignee_ids))[-1]
+                assigned_to = assignee_ids[owner] if owner is not None else None
+                code = '{}-{}'.format(self.prefix, index)
+                serial = 'SN-{}-{}'.format(self.prefix, index)
+                terms = [
+                    code,
+                    serial,
+                    model_number.model_number,
+                    model_number.make_label.make_label,
+                    model_number.make_label.asset_type.asset_type,
+                    assignee_emails.get(assigned_to),
+                ]
+                centre = centres[index % len(centres)]
+                counts[centre.id, model_number.id, status] += 1
+                yield Asset(
+                    asset_code=code,
+                    serial_number=serial,
+                    model_number=model_number,
+                    asset_location=centre,
+                    current_status=status,
+                    assigned_to_id=assigned_to,
+                    search_text=' '.join(filter(None, terms)).lower(),
+                )
+
+        _bulk_create(Asset, assets(), self.batch_size)
+        record_inventory_changes(counts)
+        asset_ids = list(
+            Asset.objects.filter(asset_code__startswith=self.prefix)
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+        self._log('Created {} assets.'.format(len(asset_ids)))
+        return asset_ids
+
+    def _create_histories(self, asset_ids, assignee_ids):
+        def histories():
+            for index, asset_id in enumerate(asset_ids):
+                history = self._asset_history(index, len(assignee_ids))
+                previous_status = None
+                previous_owner = None
+                for status, owner in history:
+                    yield AssetStatus(
+                        asset_id=asset_id,
+                        current_status=status,
+                        previous_status=previous_status,
+                    )
+                    owner_id = assignee_ids[owner] if owner is not None else None
+                    if status in (constants.ALLOCATED, constants.AVAILABLE) and (
+                        owner_id != previous_owner
+                    ):
+                        yield AllocationHistory(
+                            asset_id=asset_id,
+                            current_owner_id=owner_id,
+                            previous_owner_id=previous_owner,
+                        )
+                        previous_owner = owner_id
+                    previous_status = status
+
+        statuses = allocations = 0
+        batch = []
+        for record in histories():
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                statuses, allocations = self._flush_histories(
+                    batch, statuses, allocations
+                )
+                batch = []
+        statuses, allocations = self._flush_histories(batch, statuses, allocations)
+        self._log(
+            'Created {} statuses and {} allocations.'.format(statuses, allocations)
+        )
+
+    def _flush_histories(self, batch, statuses, allocations):
+        status_records = [r for r in batch if isinstance(r, AssetStatus)]
+        allocation_records = [r for r in batch if isinstance(r, AllocationHistory)]
+        AssetStatus.objects.bulk_create(status_records)
+        AllocationHistory.objects.bulk_create(allocation_records)
+        return statuses + len(status_records), allocations + len(allocation_records)
+
+    def _create_logs(self, asset_ids, centres):
+        if not self.logs_per_asset:
+            return
+        guards = []
+        for index, centre in enumerate(centres):
+            guard = SecurityUser(
+                email='{}.guard{}@{}'.format(self.prefix.lower(), index, EMAIL_DOMAIN),
+                badge_number='{}-{}'.format(self.prefix, index),
+                first_name='Guard',
+                last_name=str(index),
+                location=centre,
+            )
+            guard.save()
+            guards.append(guard)
+
+        log_types = (constants.CHECKIN, constants.CHECKOUT)
+        spacing = timedelta(days=365) / (self.logs_per_asset + 1)
+
+        def logs():
+            for index, asset_id in enumerate(asset_ids):
+                guard = guards[index % len(guards)]
+                for number in range(self.logs_per_asset):
+                    yield AssetLog(
+                        asset_id=asset_id,
+                        checked_by=guard,
+                        log_type=log_types[number % 2],
+                        client_timestamp=self.start + spacing * (number + 1),
+                    )
+
+        created = _bulk_create(AssetLog, logs(), self.batch_size)
+        last_number = self.logs_per_asset - 1
+        Asset.objects.filter(asset_code__startswith=self.prefix).update(
+            last_log_type=log_types[last_number % 2],
+            last_logged_at=self.start + spacing * (last_number + 1),
+        )
+        self._log('Created {} check-in logs.'.format(created))
@@ -0,0 +1,140 @@
+# Standard Library
+from collections import Counter
+
+# Third-Party Imports
+from django.db import connection, IntegrityError, transaction
+from django.db.models import Count, F, Subquery, Sum
+
+# App Imports
+from core.models import Asset, AssetModelNumber, InventorySummary
+
+# the Asset fields that decide which summary row an asset is counted in
+KEY_FIELDS = ('asset_location_id', 'model_number_id', 'current_status')
+
+
+def inventory_key(asset):
+    """
+    Return the (centre id, model number id, status) an asset is counted
+    under, None if it has no status yet, or False if those fields were not
+    loaded.
+    """
+    values = asset.__dict__
+    if any(field not in values for field in KEY_FIELDS):
+        return False
+    if not values['current_status']:
+        return None
+    return tuple(values[field] for field in KEY_FIELDS)
+
+
+def _rows(key):
+    centre_id, model_number_id, status = key
+    return InventorySummary.objects.filter(
+        centre_id=centre_id, model_number_id=model_number_id, status=status
+    )
+
+
+def _increment(key, change):
+    # a single row, as rows without a centre or model number are not unique
+    first = Subquery(_rows(key).order_by().values('pk')[:1])
+    return InventorySummary.objects.filter(pk=first).update(count=F('count') + change)
+
+
+def _sort_key(key):
+    return tuple('' if value is None else str(value) for value in key)
+
+
+def record_inventory_changes(changes):
+    """
+    Apply {inventory key: change in count} to the summary with one atomic
+    increment per key, creating the rows of keys counted for the first time.
+    """
+    changes = {key: change for key, change in changes.items() if key and change}
+    # a fixed order, so concurrent transactions lock rows the same way
+    missing = [
+        key
+        for key in sorted(changes, key=_sort_key)
+        if not _increment(key, changes[key])
+    ]
+    if not missing:
+        return
+    asset_types = dict(
+        AssetModelNumber.objects.filter(id__in={key[1] for key in missing}).values_list(
+            'id', 'make_label__asset_type'
+        )
+    )
+    rows = [
+        InventorySummary(
+            centre_id=key[0],
+            asset_type_id=asset_types.get(key[1]),
+            model_number_id=key[1],
+            status=key[2],
+            count=changes[key],
+        )
+        for key in missing
+    ]
+    try:
+        with transaction.atomic():
+            InventorySummary.objects.bulk_create(rows)
+    except IntegrityError:
+        # some were created by another transaction in the meantime
+        for row in rows:
+            if not _increment(
+                (row.centre_id, row.model_number_id, row.status), row.count
+            ):
+                row.save()
+
+
+def rebuild_inventory_summary():
+    """
+    Recount the summary from the assets.
+
+    Returns the number of rows written and of (centre, model number,
+    status) counts that were wrong.
+    """
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            # writers wait for the recount, so none of their changes are lost
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'LOCK TABLE {} IN EXCLUSIVE MODE'.format(
+                        connection.ops.quote_name(InventorySummary._meta.db_table)
+                    )
+                )
+        recorded = Counter()
+        for row in (
+            InventorySummary.objects.values('centre', 'model_number', 'status')
+            .annotate(total=Sum('count'))
+            .order_by()
+        ):
+            recorded[row['centre'], row['model_number'], row['status']] = row['total']
+        counts = (
+            Asset.objects.exclude(current_status='')
+            .values(
+                'asset_location',
+                'model_number',
+                'model_number__make_label__asset_type',
+                'current_status',
+            )
+            .annotate(total=Count('id'))
+            .order_by()
+        )
+        rows = [
+            InventorySummary(
+                centre_id=row['asset_location'],
+                asset_type_id=row['model_number__make_label__asset_type'],
+                model_number_id=row['model_number'],
+                status=row['current_status'],
+                count=row['total'],
+            )
+            for row in counts
+        ]
+        actual = Counter(
+            {
+                (row.centre_id, row.model_number_id, row.status): row.count
+                for row in rows
+            }
+        )
+        wrong = sum(recorded[key] != actual[key] for key in set(recorded) | set(actual))
+        InventorySummary.objects.all().delete()
+        InventorySummary.objects.bulk_create(rows)
+    return len(rows), wrong
@@ -0,0 +1,89 @@
+# Standard Library
+from datetime import datetime
+
+# Third-Party Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# App Imports
+from core.asset_log_archive import (
+    archive_month,
+    archive_path,
+    archived_months,
+    months_to_archive,
+    prepare_partitions,
+    restore_month,
+    retention_cutoff,
+)
+from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
+
+
+def _month(value):
+    try:
+        return datetime.strptime(value, '%Y-%m').date()
+    except ValueError:
+        raise CommandError('Months are given as YYYY-MM, not {}.'.format(value))
+
+
+class Command(BaseCommand):
+    help = (
+        'Move the asset logs older than ASSET_LOG_RETENTION_MONTHS to gzipped '
+        'CSV files, one per month, and create the coming monthly partitions.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months',
+            type=int,
+            help='Months of logs kept, including the current one. '
+            'Defaults to ASSET_LOG_RETENTION_MONTHS.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='List the months that would be archived.',
+        )
+        parser.add_argument(
+            '--list', action='store_true', help='List the archived months.'
+        )
+        parser.add_argument(
+            '--restore',
+            metavar='YYYY-MM',
+            help='Load the archived logs of a month back into the database.',
+        )
+
+    def get_version(self):
+        """
+        Return version (semver) of archive_asset_logs command
+        """
+        return f"archive_asset_logs v{COMMAND_VERSION}, Django v{DJANGO_VERSION}"
+
+    def handle(self, *args, **options):
+        if options['list']:
+            for month in archived_months():
+                self.stdout.write('{:%Y-%m} {}'.format(month, archive_path(month)))
+            return
+        if options['restore']:
+            month = _month(options['restore'])
+            if month not in archived_months():
+                raise CommandError('No logs are archived for {:%Y-%m}.'.format(month))
+            count = restore_month(month)
+            self.stdout.write('{} logs of {:%Y-%m} restored.'.format(count, month))
+            return
+
+        if options['months'] is not None and options['months'] < 1:
+            raise CommandError('At least one month of logs is kept.')
+        months = months_to_archive(retention_cutoff(options['months']))
+        if options['dry_run']:
+            for month in months:
+                self.stdout.write('{:%Y-%m} would be archived.'.format(month))
+            return
+
+        for name in prepare_partitions():
+            self.stdout.write('Partition {} created.'.format(name))
+        for month, partition in months.items():
+            count = archive_month(month, partition)
+            self.stdout.write(
+                '{} logs of {:%Y-%m} archived to {}.'.format(
+                    count, month, archive_path(month)
+                )
+            )
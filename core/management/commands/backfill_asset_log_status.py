@@ -0,0 +1,37 @@
+# Third-Party Imports
+from django.core.management.base import BaseCommand
+
+# App Imports
+from core.cache import invalidate_model
+from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
+from core.models import AndelaCentre, Asset
+from core.models.asset import refresh_asset_last_log
+
+
+class Command(BaseCommand):
+    help = 'Recompute the check-in status stored on assets from their logs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Number of assets updated per statement.',
+        )
+
+    def get_version(self):
+        """
+        Return version (semver) of backfill_asset_log_status command
+        """
+        return f"backfill_asset_log_status v{COMMAND_VERSION}, Django v{DJANGO_VERSION}"
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        asset_ids = list(Asset.objects.order_by('id').values_list('id', flat=True))
+        updated = 0
+        for start in range(0, len(asset_ids), chunk_size):
+            end = start + chunk_size
+            chunk = Asset.objects.filter(id__in=asset_ids[start:end])
+            updated += refresh_asset_last_log(chunk)
+        invalidate_model(Asset, AndelaCentre.objects.values_list('id', flat=True))
+        self.stdout.write('{} assets updated.'.format(updated))
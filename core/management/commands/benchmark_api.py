@@ -0,0 +1,387 @@
+# Standard Library
+import json
+import math
+import time
+import tracemalloc
+from unittest.mock import patch
+
+# Third-Party Imports
+import django
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+# App Imports
+from api.urls import router
+from core import constants
+from core.bulk_operations import allocate_assets
+from core.fake_inventory import EMAIL_DOMAIN, InventoryGenerator
+from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
+from core.models import (
+    AllocationHistory,
+    AndelaCentre,
+    Asset,
+    AssetAssignee,
+    AssetLog,
+    AssetStatus,
+    SecurityUser,
+    User,
+)
+
+ADMIN_EMAIL = 'benchmark.admin@{}'.format(EMAIL_DOMAIN)
+GUARD_EMAIL = 'benchmark.guard@{}'.format(EMAIL_DOMAIN)
+
+# generated assets allocated to the benchmark admin, for the endpoints
+# listing the caller's own assets
+ADMIN_ASSETS = 20
+
+# query string sent with endpoints that reject a bare GET
+ENDPOINT_PARAMS = {'assets-search': {'q': 'mn'}}
+
+DATASET_MODELS = (User, Asset, AssetStatus, AllocationHistory, AssetLog)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+def _first_pk(data):
+    """Return the uuid or id of the first item of a list response."""
+    if isinstance(data, dict):
+        data = data.get('results')
+    if not isinstance(data, list) or not data or not isinstance(data[0], dict):
+        return None
+    return data[0].get('uuid') or data[0].get('id')
+
+
+class Command(BaseCommand):
+    help = (
+        'Call every GET endpoint of the API and record its query count, '
+        'p50/p95 latency and peak memory as JSON.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--seed',
+            action='store_true',
+            help='Generate a synthetic inventory before benchmarking.',
+        )
+        parser.add_argument(
+            '--allow-writes',
+            action='store_true',
+            help='Benchmark without --seed on a database with DEBUG off. The '
+            'benchmark users are written to it and the cache is cleared.',
+        )
+        parser.add_argument(
+            '--prefix',
+            help='Prefix of an inventory generated earlier, whose available '
+            'assets are allocated to the benchmark admin. Defaults to the '
+            'prefix of the inventory generated with --seed.',
+        )
+        parser.add_argument('--assets', type=int, default=100_000)
+        parser.add_argument('--users', type=int, default=20000)
+        parser.add_argument('--statuses', type=int, default=1_000_000)
+        parser.add_argument('--logs', type=int, default=1_000_000)
+        parser.add_argument(
+            '--scale',
+            type=float,
+            default=1.0,
+            help='Multiply the seeded dataset sizes, e.g. 0.01 for a quick run.',
+        )
+        parser.add_argument(
+            '--centre',
+            type=int,
+            help='Id of the centre the benchmark users belong to. Defaults to '
+            'the centre with the most assets.',
+        )
+        parser.add_argument(
+            '--iterations', type=int, default=20, help='Timed requests per endpoint.'
+        )
+        parser.add_argument(
+            '--endpoint',
+            action='append',
+            dest='endpoints',
+            help='Only benchmark this URL name, e.g. assets-list. Repeatable.',
+        )
+        parser.add_argument(
+            '--output', default='benchmark.json', help='File to write results to.'
+        )
+        parser.add_argument(
+            '--compare',
+            help='Results file from another branch. Exits with an error if any '
+            'endpoint now makes more queries.',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.2,
+            help='p95 latency increase, as a fraction, reported as a slowdown '
+            'when comparing.',
+        )
+
+    def get_version(self):
+        """
+        Return version (semver) of benchmark_api command
+        """
+        return f"benchmark_api v{COMMAND_VERSION}, Django v{DJANGO_VERSION}"
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1.')
+        if not (options['seed'] or options['allow_writes'] or settings.DEBUG):
+            raise CommandError(
+                'benchmark_api writes benchmark users and assets and clears the '
+                'cache. Run it with --seed or --allow-writes.'
+            )
+        baseline = None
+        if options['compare']:
+            # read before the results are written, which may be to this file
+            with open(options['compare']) as baseline_file:
+                baseline = json.load(baseline_file)
+        if options['seed']:
+            self._seed(options)
+
+        centre = self._centre(options['centre'])
+        users = self._benchmark_users(centre, options['prefix'])
+        host = next(
+            (host.lstrip('.') for host in settings.ALLOWED_HOSTS if host != '*'),
+            'localhost',
+        )
+        self.client = APIClient(HTTP_HOST=host)
+
+        results = []
+        with patch('api.authentication.auth.verify_id_token') as verify:
+            verify.side_effect = lambda email: {'email': email}
+            for name, detail_name in self._endpoints(options['endpoints']):
+                result = self._benchmark(name, None, users, options['iterations'])
+                results.append(result)
+                if detail_name and result.get('pk'):
+                    results.append(
+                        self._benchmark(
+                            detail_name, result['pk'], users, options['iterations']
+                        )
+                    )
+
+        report = {
+            'created_at': timezone.now().isoformat(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'iterations': options['iterations'],
+            'dataset': {
+                model._meta.db_table: model.objects.count() for model in DATASET_MODELS
+            },
+            'endpoints': [
+                {key: value for key, value in result.items() if key != 'pk'}
+                for result in results
+            ],
+        }
+        with open(options['output'], 'w') as output:
+            json.dump(report, output, indent=2)
+        self._print(report['endpoints'])
+        self.stdout.write('Results written to {}.'.format(options['output']))
+
+        if baseline is not None:
+            self._compare(report, baseline, options['tolerance'])
+
+    def _seed(self, options):
+        scale = options['scale']
+        summary = InventoryGenerator(
+            assets=int(options['assets'] * scale),
+            users=int(options['users'] * scale),
+            statuses=int(options['statuses'] * scale),
+            logs=int(options['logs'] * scale),
+            stdout=self.stdout,
+        ).generate()
+        if options['centre'] is None:
+            options['centre'] = summary['centres'][0]
+        if options['prefix'] is None:
+            options['prefix'] = summary['prefix']
+
+    def _centre(self, centre_id):
+        centres = AndelaCentre.objects.all()
+        if centre_id is not None:
+            centres = centres.filter(id=centre_id)
+        centre = centres.annotate(assets=Count('asset')).order_by('-assets').first()
+        if centre is None:
+            raise CommandError('There is no centre to benchmark. Run with --seed.')
+        return centre
+
+    def _benchmark_users(self, centre, prefix):
+        """
+        Return an admin and a security user at `centre`. The admin is written
+        with bulk_create so no Firebase account is created for it, and is
+        allocated available assets of the inventory generated with `prefix`.
+        """
+        admin = User.objects.filter(email=ADMIN_EMAIL).first()
+        if admin is None:
+            User.objects.bulk_create(
+                [
+                    User(
+                        email=ADMIN_EMAIL,
+                        first_name='Benchmark',
+                        last_name='Admin',
+                        cohort=0,
+                        is_staff=True,
+                        is_superuser=True,
+                    )
+                ]
+            )
+            admin = User.objects.get(email=ADMIN_EMAIL)
+            AssetAssignee.objects.get_or_create(user=admin)
+        guard = SecurityUser.objects.filter(email=GUARD_EMAIL).first()
+        if guard is None:
+            guard = SecurityUser(
+                email=GUARD_EMAIL,
+                badge_number='BENCHMARK',
+                first_name='Benchmark',
+                last_name='Guard',
+            )
+        admin.location = guard.location = centre
+        User.objects.filter(id=admin.id).update(location=centre)
+        guard.save()
+
+        assignee = AssetAssignee.objects.get(user=admin)
+        missing = ADMIN_ASSETS - Asset.objects.filter(assigned_to=assignee).count()
+        if missing > 0 and prefix:
+            asset_ids = list(
+                Asset.objects.filter(
+                    asset_code__startswith='{}-'.format(prefix),
+                    asset_location=centre,
+                    current_status=constants.AVAILABLE,
+                )
+                .order_by('id')
+                .values_list('id', flat=True)[:missing]
+            )
+            if asset_ids:
+                allocate_assets(
+                    [
+                        {'asset': asset_id, 'current_owner': assignee.id}
+                        for asset_id in asset_ids
+                    ]
+                )
+        return (admin, guard)
+
+    def _endpoints(self, only):
+        """Yield (url name, detail url name) for every router GET route."""
+        names = [
+            url.name
+            for url in router.urls
+            if 'get' in getattr(url.callback, 'actions', {})
+            and not url.name.endswith('-detail')
+        ]
+        for name in names:
+            if only and name not in only:
+                continue
+            basename, _, action = name.rpartition('-')
+            detail_name = '{}-detail'.format(basename) if action == 'list' else None
+            if only and detail_name not in only:
+                detail_name = None
+            yield name, detail_name
+
+    def _get(self, url, params, user):
+        response = self.client.get(
+            url, params, HTTP_AUTHORIZATION='Token {}'.format(user.email)
+        )
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+    def _benchmark(self, name, pk, users, iterations):
+        """
+        Measure one endpoint as the first of `users` allowed to call it. The
+        query count and peak memory come from a cold request, with the cache
+        cleared, and the latency from `iterations` further requests.
+        """
+        url = reverse(name, kwargs={'pk': pk} if pk else None)
+        params = ENDPOINT_PARAMS.get(name, {})
+        for user in users:
+            cache.clear()
+            tracemalloc.start()
+            with CaptureQueriesContext(connection) as queries:
+                response = self._get(url, params, user)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            if response.status_code not in (401, 403):
+                break
+
+        result = {
+            'endpoint': name,
+            'url': url,
+            'user': user.email,
+            'status': response.status_code,
+            'queries': len(queries),
+            'peak_memory_kb': round(peak_memory / 1024, 1),
+        }
+        if response.status_code != 200:
+            return result
+        if not response.streaming:
+            result['pk'] = _first_pk(response.data)
+
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            self._get(url, params, user)
+            timings.append((time.perf_counter() - start) * 1000)
+        result['p50_ms'] = round(percentile(timings, 0.5), 2)
+        result['p95_ms'] = round(percentile(timings, 0.95), 2)
+        return result
+
+    def _print(self, results):
+        row = '{:<36} {:>6} {:>8} {:>10} {:>10} {:>12}'
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                row.format(
+                    'Endpoint', 'Status', 'Queries', 'p50 ms', 'p95 ms', 'Peak KB'
+                )
+            )
+        )
+        for result in results:
+            self.stdout.write(
+                row.format(
+                    result['endpoint'],
+                    result['status'],
+                    result['queries'],
+                    result.get('p50_ms', '-'),
+                    result.get('p95_ms', '-'),
+                    result['peak_memory_kb'],
+                )
+            )
+
+    def _compare(self, report, baseline, tolerance):
+        baseline = {result['endpoint']: result for result in baseline['endpoints']}
+        more_queries = []
+        for result in report['endpoints']:
+            before = baseline.get(result['endpoint'])
+            if before is None:
+                continue
+            if result['queries'] > before['queries']:
+                more_queries.append(result['endpoint'])
+                self.stdout.write(
+                    self.style.ERROR(
+                        '{}: {} queries, was {}'.format(
+                            result['endpoint'], result['queries'], before['queries']
+                        )
+                    )
+                )
+            if 'p95_ms' in result and 'p95_ms' in before:
+                if result['p95_ms'] > before['p95_ms'] * (1 + tolerance):
+                    self.stdout.write(
+                        self.style.WARNING(
+                            '{}: p95 {}ms, was {}ms'.format(
+                                result['endpoint'], result['p95_ms'], before['p95_ms']
+                            )
+                        )
+                    )
+        if more_queries:
+            raise CommandError(
+                'Query counts went up for: {}'.format(', '.join(more_queries))
+            )
+        self.stdout.write(self.style.SUCCESS('No query count regressions.'))
@@ -0,0 +1,65 @@
+# Third-Party Imports
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count
+
+# App Imports
+from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
+from core.models import AllocationHistory, Asset, AssetLog, AssetStatus
+
+HISTORY_MODELS = (AssetStatus, AllocationHistory, AssetLog)
+
+
+class Command(BaseCommand):
+    help = (
+        'Print the query plans of the "latest record per asset" lookups made '
+        'by the history tables.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--asset',
+            type=int,
+            help='Id of the asset to look up. Defaults to the asset with the '
+            'most status records.',
+        )
+        parser.add_argument(
+            '--analyze',
+            action='store_true',
+            help='Run the queries and report actual timings (PostgreSQL only).',
+        )
+
+    def get_version(self):
+        """
+        Return version (semver) of explain_latest_lookups command
+        """
+        return f"explain_latest_lookups v{COMMAND_VERSION}, Django v{DJANGO_VERSION}"
+
+    def handle(self, *args, **options):
+        asset_id = options['asset'] or self._busiest_asset_id()
+        if asset_id is None:
+            self.stdout.write('There are no assets to look up.')
+            return
+        explain_options = {}
+        if options['analyze'] and connection.vendor == 'postgresql':
+            explain_options = {'analyze': True, 'buffers': True}
+
+        for model in HISTORY_MODELS:
+            queryset = model.objects.filter(asset_id=asset_id).order_by('-created_at')
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    '{} ({} rows)'.format(
+                        model._meta.verbose_name.title(), model.objects.count()
+                    )
+                )
+            )
+            self.stdout.write(queryset[:1].explain(**explain_options))
+            self.stdout.write('')
+
+    def _busiest_asset_id(self):
+        return (
+            Asset.objects.annotate(records=Count('assetstatus'))
+            .order_by('-records')
+            .values_list('id', flat=True)
+            .first()
+        )
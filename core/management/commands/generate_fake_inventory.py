@@ -0,0 +1,115 @@
+# Standard Library
+import time
+
+# Third-Party Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# App Imports
+from core.fake_inventory import HIERARCHY, InventoryGenerator, TAXONOMY
+from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
+
+HIERARCHY_OPTIONS = {
+    'blocks': 'blocks_per_centre',
+    'floors': 'floors_per_block',
+    'sections': 'sections_per_floor',
+    'workspaces': 'workspaces_per_section',
+}
+
+TAXONOMY_OPTIONS = {
+    'categories': 'categories',
+    'sub_categories': 'sub_categories_per_category',
+    'types': 'types_per_sub_category',
+    'makes': 'makes_per_type',
+    'models': 'models_per_make',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk-create a synthetic inventory (centres, offices, asset taxonomy, '
+        'users, assets and their histories) for benchmarking and load testing.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--assets', type=int, default=100_000)
+        parser.add_argument('--users', type=int, default=20000)
+        parser.add_argument(
+            '--statuses',
+            type=int,
+            default=1_000_000,
+            help='Total status records, spread evenly across the assets.',
+        )
+        parser.add_argument(
+            '--logs',
+            type=int,
+            default=1_000_000,
+            help='Total check-in/check-out logs, spread evenly across the assets.',
+        )
+        parser.add_argument('--centres', type=int, default=3)
+        for key, option in HIERARCHY_OPTIONS.items():
+            parser.add_argument(
+                '--{}'.format(option.replace('_', '-')),
+                type=int,
+                default=HIERARCHY[key],
+            )
+        for key, option in TAXONOMY_OPTIONS.items():
+            parser.add_argument(
+                '--{}'.format(option.replace('_', '-')), type=int, default=TAXONOMY[key]
+            )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows built in memory before each insert.',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed. The same seed gives the same histories.',
+        )
+
+    def get_version(self):
+        """
+        Return version (semver) of generate_fake_inventory command
+        """
+        return f"generate_fake_inventory v{COMMAND_VERSION}, Django v{DJANGO_VERSION}"
+
+    def handle(self, *args, **options):
+        minimums = {'centres': 1, 'users': 1, 'batch_size': 1}
+        minimums.update({option: 1 for option in TAXONOMY_OPTIONS.values()})
+        for option, minimum in minimums.items():
+            if options[option] < minimum:
+                raise CommandError(
+                    '--{} must be at least {}.'.format(
+                        option.replace('_', '-'), minimum
+                    )
+                )
+        for option in ('assets', 'statuses', 'logs', *HIERARCHY_OPTIONS.values()):
+            if options[option] < 0:
+                raise CommandError(
+                    '--{} cannot be negative.'.format(option.replace('_', '-'))
+                )
+
+        start = time.perf_counter()
+        summary = InventoryGenerator(
+            assets=options['assets'],
+            users=options['users'],
+            statuses=options['statuses'],
+            logs=options['logs'],
+            centres=options['centres'],
+            hierarchy={
+                key: options[option] for key, option in HIERARCHY_OPTIONS.items()
+            },
+            taxonomy={key: options[option] for key, option in TAXONOMY_OPTIONS.items()},
+            batch_size=options['batch_size'],
+            seed=options['seed'],
+            stdout=self.stdout,
+        ).generate()
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Generated inventory {} in {:.1f}s.'.format(
+                    summary['prefix'], time.perf_counter() - start
+                )
+            )
+        )
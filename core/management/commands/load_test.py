@@ -0,0 +1,143 @@
+# Standard Library
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+# Third-Party Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# App Imports
+from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
+from core.management.commands.benchmark_api import percentile
+
+# endpoints whose time is mostly spent verifying the caller's Firebase token
+AUTH_HEAVY_PATHS = (
+    '/api/v1/assets/',
+    '/api/v1/asset-categories/',
+    '/api/v1/asset-taxonomy/',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Send concurrent requests to a running server and report throughput '
+        'and latency per concurrency level, e.g. to compare sync and gevent '
+        'workers.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', required=True, help='e.g. http://127.0.0.1:8000')
+        parser.add_argument(
+            '--compare-url',
+            help='A second server, e.g. the same code with other workers. The '
+            'throughput gain of --url over it is reported.',
+        )
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            help='Path requested, in turn with the others. Repeatable. Defaults '
+            'to {}.'.format(', '.join(AUTH_HEAVY_PATHS)),
+        )
+        parser.add_argument('--token', default='', help='Firebase ID token sent.')
+        parser.add_argument(
+            '--concurrency',
+            default='1,10,50',
+            help='Comma-separated numbers of requests in flight at once.',
+        )
+        parser.add_argument(
+            '--requests', type=int, default=200, help='Requests per concurrency level.'
+        )
+        parser.add_argument(
+            '--timeout', type=float, default=30, help='Seconds before a request fails.'
+        )
+
+    def get_version(self):
+        """
+        Return version (semver) of load_test command
+        """
+        return f"load_test v{COMMAND_VERSION}, Django v{DJANGO_VERSION}"
+
+    def handle(self, *args, **options):
+        try:
+            levels = [int(level) for level in options['concurrency'].split(',')]
+        except ValueError:
+            raise CommandError('--concurrency must be comma-separated integers.')
+        if options['requests'] < 1 or min(levels) < 1:
+            raise CommandError('--requests and --concurrency must be at least 1.')
+        paths = options['paths'] or AUTH_HEAVY_PATHS
+
+        servers = [options['url']] + (
+            [options['compare_url']] if options['compare_url'] else []
+        )
+        results = {server: {} for server in servers}
+        for level in levels:
+            for server in servers:
+                results[server][level] = self._run(server, paths, level, options)
+                self._print(server, level, results[server][level])
+        if options['compare_url']:
+            for level in levels:
+                gain = (
+                    results[options['url']][level]['throughput']
+                    / results[options['compare_url']][level]['throughput']
+                )
+                self.stdout.write(
+                    'concurrency {:>4}: {:.2f}x the throughput of {}'.format(
+                        level, gain, options['compare_url']
+                    )
+                )
+
+    def _request(self, url, token, timeout):
+        request = Request(url, headers={'Authorization': 'Token {}'.format(token)})
+        start = time.perf_counter()
+        try:
+            with urlopen(request, timeout=timeout) as response:
+                response.read()
+                ok = response.status < 400
+        except (HTTPError, URLError, OSError):
+            ok = False
+        return time.perf_counter() - start, ok
+
+    def _run(self, server, paths, level, options):
+        urls = [
+            server.rstrip('/') + paths[index % len(paths)]
+            for index in range(options['requests'])
+        ]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=level) as executor:
+            outcomes = list(
+                executor.map(
+                    lambda url: self._request(
+                        url, options['token'], options['timeout']
+                    ),
+                    urls,
+                )
+            )
+        elapsed = time.perf_counter() - start
+        # failed requests, often quick errors or slow timeouts, say nothing
+        # about the server's throughput or latency
+        latencies = [duration * 1000 for duration, ok in outcomes if ok]
+        if not latencies:
+            raise CommandError(
+                'No request to {} succeeded at concurrency {}.'.format(server, level)
+            )
+        return {
+            'throughput': len(latencies) / elapsed,
+            'p50_ms': percentile(latencies, 0.5),
+            'p95_ms': percentile(latencies, 0.95),
+            'errors': sum(not ok for duration, ok in outcomes),
+        }
+
+    def _print(self, server, level, result):
+        self.stdout.write(
+            '{} concurrency {:>4}: {:8.1f} req/s  p50 {:7.1f} ms  p95 {:7.1f} ms  '
+            '{} errors'.format(
+                server,
+                level,
+                result['throughput'],
+                result['p50_ms'],
+                result['p95_ms'],
+                result['errors'],
+            )
+        )
@@ -0,0 +1,21 @@
+# Third-Party Imports
+from django.core.management.base import BaseCommand
+
+# App Imports
+from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
+from core.models import Asset
+from core.models.asset import refresh_asset_search_text
+
+
+class Command(BaseCommand):
+    help = 'Recompute the text matched by the asset search endpoint.'
+
+    def get_version(self):
+        """
+        Return version (semver) of rebuild_asset_search command
+        """
+        return f"rebuild_asset_search v{COMMAND_VERSION}, Django v{DJANGO_VERSION}"
+
+    def handle(self, *args, **options):
+        updated = refresh_asset_search_text(Asset.objects.all())
+        self.stdout.write('{} assets updated.'.format(updated))
@@ -0,0 +1,24 @@
+# Third-Party Imports
+from django.core.management.base import BaseCommand
+
+# App Imports
+from core.inventory import rebuild_inventory_summary
+from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the inventory summary from the assets.'
+
+    def get_version(self):
+        """
+        Return version (semver) of reconcile_inventory command
+        """
+        return f"reconcile_inventory v{COMMAND_VERSION}, Django v{DJANGO_VERSION}"
+
+    def handle(self, *args, **options):
+        rows, wrong = rebuild_inventory_summary()
+        self.stdout.write(
+            '{} inventory summary rows written, {} counts corrected.'.format(
+                rows, wrong
+            )
+        )
@@ -0,0 +1,35 @@
+# Third-Party Imports
+from django.core.management.base import BaseCommand
+
+# App Imports
+from core.cache_server import CacheServer
+from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
+
+
+class Command(BaseCommand):
+    help = (
+        'Run an in-memory stand-in for Redis, for CACHE_BACKEND=redis in '
+        'development and tests.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=6379)
+
+    def get_version(self):
+        """
+        Return version (semver) of run_cache_server command
+        """
+        return f"run_cache_server v{COMMAND_VERSION}, Django v{DJANGO_VERSION}"
+
+    def handle(self, *args, **options):
+        server = CacheServer((options['host'], options['port']))
+        self.stdout.write(
+            'Cache server listening on redis://{}:{}/0'.format(*server.server_address)
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
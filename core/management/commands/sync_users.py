@@ -13,6 +13,7 @@ from django.core.validators import validate_email
 from django.utils.dateparse import parse_datetime
 
 # App Imports
+from core import metrics
 from core.management.commands import COMMAND_VERSION, DJANGO_VERSION
 from core.models import AISUserSync, AndelaCentre
 from core.slack_bot import SlackIntegration
@@ -223,6 +224,12 @@ class Command(BaseCommand):
         duration = time.time() - start_time
         running_time = timedelta(seconds=duration)
 
+        metrics.USER_SYNC_DURATION.observe(
+            duration, result='success' if SYNC_SUCCESS else 'failure'
+        )
+        metrics.USER_SYNC_RECORDS.inc(new_records, change='created')
+        metrics.USER_SYNC_RECORDS.inc(updated_records, change='updated')
+
         sync_record.running_time = running_time
         sync_record.successful = SYNC_SUCCESS
         sync_record.running = False
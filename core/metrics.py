@@ -0,0 +1,247 @@
+# Standard Library
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Third-Party Imports
+from django.conf import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+SYNC_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1800)
+
+_metrics = []
+_lock = threading.Lock()
+_state = {'pid': None, 'flushed_at': 0}
+
+
+class Metric:
+    type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        _metrics.append(self)
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                '{} takes the labels {}'.format(self.name, ', '.join(self.labelnames))
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _update(self, labels, update):
+        key = self._key(labels)
+        with _lock:
+            if _state['pid'] != os.getpid():
+                # forked from a process that already had values
+                for metric in _metrics:
+                    metric.values = {}
+                _state['pid'] = os.getpid()
+            self.values[key] = update(self.values.get(key))
+        if time.time() - _state['flushed_at'] >= settings.METRICS_FLUSH_INTERVAL:
+            flush()
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        self._update(labels, lambda value: (value or 0) + amount)
+
+
+class Histogram(Metric):
+    """Values are [count per bucket..., count above the last bucket, sum]."""
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, amount, **labels):
+        def update(value):
+            value = value or [0] * (len(self.buckets) + 2)
+            value[bisect_left(self.buckets, amount)] += 1
+            value[-1] += amount
+            return value
+
+        self._update(labels, update)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the seconds spent in the block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+
+def _path(pid):
+    return os.path.join(settings.METRICS_DIR, '{}.json'.format(pid))
+
+
+def flush():
+    """
+    Write this process's values to METRICS_DIR, replacing its previous
+    file, so that any process can report the totals of every worker.
+    """
+    with _lock:
+        _state['flushed_at'] = time.time()
+        if _state['pid'] != os.getpid():
+            return
+        values = {
+            metric.name: [[list(key), value] for key, value in metric.values.items()]
+            for metric in _metrics
+            if metric.values
+        }
+    os.makedirs(settings.METRICS_DIR, exist_ok=True)
+    path = _path(os.getpid())
+    temporary_path = '{}.{}.tmp'.format(path, threading.get_ident())
+    with open(temporary_path, 'w') as output:
+        json.dump(values, output)
+    os.replace(temporary_path, path)
+
+
+def clear():
+    """
+    Remove the values of every process. Run when the server starts so that
+    files left by earlier deployments are not counted.
+    """
+    for path in glob.glob(os.path.join(settings.METRICS_DIR, '*.json')):
+        os.remove(path)
+
+
+def _collect():
+    totals = {}
+    for path in glob.glob(os.path.join(settings.METRICS_DIR, '*.json')):
+        try:
+            with open(path) as values_file:
+                values = json.load(values_file)
+        except (OSError, ValueError):
+            continue
+        for name, samples in values.items():
+            metric_totals = totals.setdefault(name, {})
+            for key, value in samples:
+                key = tuple(key)
+                if key not in metric_totals:
+                    metric_totals[key] = value
+                elif isinstance(value, list):
+                    metric_totals[key] = [
+                        a + b for a, b in zip(metric_totals[key], value)
+                    ]
+                else:
+                    metric_totals[key] += value
+    return totals
+
+
+def _labels(metric, key, **extra):
+    pairs = list(zip(metric.labelnames, key)) + list(extra.items())
+    if not pairs:
+        return ''
+    return '{{{}}}'.format(
+        ','.join(
+            '{}="{}"'.format(
+                name,
+                value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n'),
+            )
+            for name, value in pairs
+        )
+    )
+
+
+def _format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def exposition():
+    """Render the totals of every process in the Prometheus text format."""
+    flush()
+    totals = _collect()
+    lines = []
+    for metric in _metrics:
+        lines.append('# HELP {} {}'.format(metric.name, metric.documentation))
+        lines.append('# TYPE {} {}'.format(metric.name, metric.type))
+        for key, value in sorted(totals.get(metric.name, {}).items()):
+            if metric.type == 'counter':
+                lines.append(
+                    '{}{} {}'.format(
+                        metric.name, _labels(metric, key), _format_number(value)
+                    )
+                )
+                continue
+            cumulative = 0
+            for bound, count in zip(metric.buckets + ('+Inf',), value[:-1]):
+                cumulative += count
+                lines.append(
+                    '{}_bucket{} {}'.format(
+                        metric.name, _labels(metric, key, le=str(bound)), cumulative
+                    )
+                )
+            lines.append(
+                '{}_sum{} {}'.format(
+                    metric.name, _labels(metric, key), _format_number(value[-1])
+                )
+            )
+            lines.append(
+                '{}_count{} {}'.format(metric.name, _labels(metric, key), cumulative)
+            )
+    return '\n'.join(lines) + '\n'
+
+
+atexit.register(flush)
+
+REQUEST_DURATION = Histogram(
+    'art_http_request_duration_seconds',
+    'Time taken to serve a request, by route.',
+    ['method', 'route'],
+)
+RESPONSES = Counter(
+    'art_http_responses_total',
+    'Responses sent, by route and status code.',
+    ['method', 'route', 'status'],
+)
+REQUEST_QUERIES = Histogram(
+    'art_http_request_db_queries',
+    'Database queries made while serving a request, by route.',
+    ['method', 'route'],
+    buckets=QUERY_BUCKETS,
+)
+IMPORT_ROWS = Counter(
+    'art_asset_import_rows_total',
+    'Rows of asset import files processed, by whether they were imported.',
+    ['result'],
+)
+IMPORT_DURATION = Histogram(
+    'art_asset_import_duration_seconds', 'Time taken to import an asset file.'
+)
+USER_SYNC_DURATION = Histogram(
+    'art_user_sync_duration_seconds',
+    'Time taken by AIS user syncs, by whether they succeeded.',
+    ['result'],
+    buckets=SYNC_BUCKETS,
+)
+USER_SYNC_RECORDS = Counter(
+    'art_user_sync_records_total',
+    'Users created or updated by AIS user syncs.',
+    ['change'],
+)
+SLACK_DURATION = Histogram(
+    'art_slack_request_duration_seconds', 'Time taken by Slack API calls.', ['method']
+)
+SLACK_FAILURES = Counter(
+    'art_slack_request_failures_total', 'Slack API calls that failed.', ['method']
+)
+FIREBASE_VERIFY_DURATION = Histogram(
+    'art_firebase_verify_duration_seconds',
+    'Time taken to verify Firebase ID tokens, by whether they were valid.',
+    ['result'],
+)
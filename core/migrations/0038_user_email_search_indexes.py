@@ -0,0 +1,47 @@
+from django.db import migrations
+
+# `icontains`/`istartswith` compile to UPPER("col"::text) LIKE UPPER(%s) on
+# PostgreSQL, so the indexes are built on the same expression.
+POSTGRESQL_INDEXES = (
+    ('core_user_email_trgm', 'gin (UPPER(email::text) gin_trgm_ops)'),
+    ('core_user_first_name_trgm', 'gin (UPPER(first_name::text) gin_trgm_ops)'),
+    ('core_user_last_name_trgm', 'gin (UPPER(last_name::text) gin_trgm_ops)'),
+    ('core_user_email_prefix', 'btree (UPPER(email::text) text_pattern_ops)'),
+)
+
+# SQLite's LIKE is case insensitive and can only use an index for prefix
+# matches when the index uses the NOCASE collation.
+SQLITE_INDEXES = (('core_user_email_nocase', '(email COLLATE NOCASE)'),)
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for name, definition in POSTGRESQL_INDEXES:
+            schema_editor.execute(
+                'CREATE INDEX {} ON core_user USING {}'.format(name, definition)
+            )
+    elif vendor == 'sqlite':
+        for name, definition in SQLITE_INDEXES:
+            schema_editor.execute(
+                'CREATE INDEX {} ON core_user {}'.format(name, definition)
+            )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    indexes = {'postgresql': POSTGRESQL_INDEXES, 'sqlite': SQLITE_INDEXES}
+    for name, _ in indexes.get(vendor, ()):
+        schema_editor.execute('DROP INDEX IF EXISTS {}'.format(name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0037_remove_andelacentre_country_old'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,60 @@
+from django.db import migrations, models
+
+ASSIGNEE_LOOKUPS = (
+    'assigned_to__department__name',
+    'assigned_to__workspace__name',
+    'assigned_to__user__email',
+)
+
+
+def populate_search_text(apps, schema_editor):
+    asset_model = apps.get_model('core', 'Asset')
+    assets = asset_model.objects.values_list(
+        'id',
+        'asset_code',
+        'serial_number',
+        'model_number__model_number',
+        'model_number__make_label__make_label',
+        'model_number__make_label__asset_type__asset_type',
+        *ASSIGNEE_LOOKUPS,
+        'notes',
+    )
+    for asset_id, *values in assets.iterator():
+        codes_and_models, assignees, notes = values[:5], values[5:8], values[8]
+        assignee = next((assignee for assignee in assignees if assignee), None)
+        terms = [*codes_and_models, assignee, notes]
+        search_text = ' '.join(
+            term.strip() for term in terms if term and term.strip()
+        ).lower()
+        asset_model.objects.filter(id=asset_id).update(search_text=search_text)
+
+
+def create_search_index(apps, schema_editor):
+    # reuses the pg_trgm extension enabled in 0038
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE INDEX core_asset_search_text_trgm ON core_asset '
+            'USING gin (UPPER(search_text::text) gin_trgm_ops)'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS core_asset_search_text_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0038_user_email_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(populate_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_last_log(apps, schema_editor):
+    asset_model = apps.get_model('core', 'Asset')
+    asset_log_model = apps.get_model('core', 'AssetLog')
+    latest_log = asset_log_model.objects.filter(asset=OuterRef('pk')).order_by(
+        '-created_at', '-id'
+    )
+    asset_model.objects.update(
+        last_log_type=Subquery(latest_log.values('log_type')[:1]),
+        last_logged_at=Subquery(latest_log.values('created_at')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0039_asset_search_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='last_log_type',
+            field=models.CharField(
+                blank=True,
+                choices=[('Checkin', 'Checkin'), ('Checkout', 'Checkout')],
+                editable=False,
+                max_length=10,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name='asset',
+            name='last_logged_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(
+                fields=['asset_location', 'last_log_type'],
+                name='core_asset_location_log_idx',
+            ),
+        ),
+        migrations.RunPython(populate_last_log, migrations.RunPython.noop),
+    ]
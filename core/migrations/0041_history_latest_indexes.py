@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0040_asset_last_log'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assetlog',
+            index=models.Index(
+                fields=['asset', '-created_at'], name='core_assetlog_latest_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='assetstatus',
+            index=models.Index(
+                fields=['asset', '-created_at'], name='core_assetstatus_latest_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='allocationhistory',
+            index=models.Index(
+                fields=['asset', '-created_at'], name='core_allocation_latest_idx'
+            ),
+        ),
+    ]
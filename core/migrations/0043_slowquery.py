@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0042_assetlog_batch_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlowQuery',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=40, unique=True)),
+                ('database', models.CharField(max_length=100)),
+                ('sql', models.TextField()),
+                ('source', models.TextField(blank=True)),
+                ('plan', models.TextField(blank=True)),
+                ('calls', models.PositiveIntegerField(default=1)),
+                ('total_ms', models.FloatField()),
+                ('max_ms', models.FloatField()),
+                ('first_seen', models.DateTimeField(auto_now_add=True)),
+                ('last_seen', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Slow Query',
+                'verbose_name_plural': 'Slow Queries',
+                'ordering': ['-total_ms'],
+            },
+        ),
+    ]
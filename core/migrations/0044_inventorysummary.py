@@ -0,0 +1,59 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def summarise_inventory(apps, schema_editor):
+    Asset = apps.get_model('core', 'Asset')
+    InventorySummary = apps.get_model('core', 'InventorySummary')
+    counts = (
+        Asset.objects.exclude(current_status='')
+        .values(
+            'asset_location',
+            'model_number',
+            'model_number__make_label__asset_type',
+            'current_status',
+        )
+        .annotate(count=models.Count('id'))
+        .order_by()
+    )
+    InventorySummary.objects.bulk_create(
+        InventorySummary(
+            centre_id=row['asset_location'],
+            asset_type_id=row['model_number__make_label__asset_type'],
+            model_number_id=row['model_number'],
+            status=row['current_status'],
+            count=row['count'],
+        )
+        for row in counts
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0043_slowquery'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventorySummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('Available', 'Available'), ('Allocated', 'Allocated'), ('Lost', 'Lost'), ('Damaged', 'Damaged')], max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('asset_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='core.AssetType')),
+                ('centre', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='core.AndelaCentre')),
+                ('model_number', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='core.AssetModelNumber')),
+            ],
+            options={
+                'verbose_name': 'Inventory Summary',
+                'verbose_name_plural': 'Inventory Summaries',
+                'ordering': ['centre_id', 'model_number_id', 'status'],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='inventorysummary',
+            unique_together={('centre', 'model_number', 'status')},
+        ),
+        migrations.RunPython(summarise_inventory, migrations.RunPython.noop),
+    ]
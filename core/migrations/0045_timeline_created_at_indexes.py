@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0044_inventorysummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assetincidentreport',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='assetcondition',
+            index=models.Index(
+                fields=['asset', '-created_at'], name='core_condition_latest_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='assetincidentreport',
+            index=models.Index(
+                fields=['asset', '-created_at'], name='core_incident_latest_idx'
+            ),
+        ),
+    ]
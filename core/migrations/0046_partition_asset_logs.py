@@ -0,0 +1,132 @@
+from datetime import date
+
+from django.db import migrations, models
+from django.utils import timezone
+
+TABLE = 'core_assetlog'
+# months after the current one partitioned up front; archive_asset_logs
+# keeps adding them
+MONTHS_AHEAD = 3
+
+
+def _add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _table_definition(cursor, table):
+    """
+    The (name, definition) of the constraints of `table`, other than
+    its primary key, and the (name, definition) of its other indexes.
+    """
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass AND contype != 'p' ORDER BY conname",
+        [table],
+    )
+    constraints = cursor.fetchall()
+    cursor.execute(
+        'SELECT idx.relname, pg_get_indexdef(pg_index.indexrelid) '
+        'FROM pg_index JOIN pg_class idx ON idx.oid = pg_index.indexrelid '
+        'WHERE pg_index.indrelid = %s::regclass AND NOT EXISTS '
+        '(SELECT 1 FROM pg_constraint WHERE conindid = pg_index.indexrelid) '
+        'ORDER BY idx.relname',
+        [table],
+    )
+    return constraints, cursor.fetchall()
+
+
+def _replace_table(cursor, partitioned):
+    """
+    Copy core_assetlog into a new table, partitioned by month of created_at
+    or not, and swap the new table in with the same constraints and indexes.
+    """
+    constraints, indexes = _table_definition(cursor, TABLE)
+    cursor.execute('ALTER TABLE {0} RENAME TO {0}_old'.format(TABLE))
+    if partitioned:
+        cursor.execute(
+            'CREATE TABLE {0} (LIKE {0}_old INCLUDING DEFAULTS) '
+            'PARTITION BY RANGE (created_at)'.format(TABLE)
+        )
+        cursor.execute('SELECT min(created_at) FROM {}_old'.format(TABLE))
+        oldest = cursor.fetchone()[0]
+        this_month = timezone.now().date().replace(day=1)
+        month = oldest.date().replace(day=1) if oldest else this_month
+        while month <= _add_months(this_month, MONTHS_AHEAD):
+            cursor.execute(
+                'CREATE TABLE {0}_p{1:%Y_%m} PARTITION OF {0} '
+                'FOR VALUES FROM (%s) TO (%s)'.format(TABLE, month),
+                [month.isoformat(), _add_months(month, 1).isoformat()],
+            )
+            month = _add_months(month, 1)
+        # catches rows of months not partitioned yet
+        cursor.execute('CREATE TABLE {0}_default PARTITION OF {0} DEFAULT'.format(TABLE))
+    else:
+        cursor.execute('CREATE TABLE {0} (LIKE {0}_old INCLUDING DEFAULTS)'.format(TABLE))
+    cursor.execute(
+        "SELECT pg_get_serial_sequence('{}_old', 'id')".format(TABLE)
+    )
+    cursor.execute(
+        'ALTER SEQUENCE {} OWNED BY {}.id'.format(cursor.fetchone()[0], TABLE)
+    )
+    cursor.execute('INSERT INTO {0} SELECT * FROM {0}_old'.format(TABLE))
+    cursor.execute('DROP TABLE {}_old'.format(TABLE))
+
+    # the primary key of a partitioned table must hold its partition key, so
+    # ids are only unique with their created_at; they still come from one
+    # sequence
+    cursor.execute(
+        'ALTER TABLE {0} ADD CONSTRAINT {0}_pkey PRIMARY KEY ({1})'.format(
+            TABLE, 'id, created_at' if partitioned else 'id'
+        )
+    )
+    for name, definition in constraints:
+        cursor.execute(
+            'ALTER TABLE {} ADD CONSTRAINT {} {}'.format(TABLE, name, definition)
+        )
+    for name, definition in indexes:
+        # the indexes of partitioned tables are defined ON ONLY the parent
+        cursor.execute(definition.replace(' ON ONLY ', ' ON ', 1))
+
+
+def _supports_partitions(connection):
+    # default partitions and keys on partitioned tables need PostgreSQL 11
+    return connection.vendor == 'postgresql' and connection.pg_version >= 110000
+
+
+def partition_asset_logs(apps, schema_editor):
+    if _supports_partitions(schema_editor.connection):
+        with schema_editor.connection.cursor() as cursor:
+            _replace_table(cursor, partitioned=True)
+
+
+def unpartition_asset_logs(apps, schema_editor):
+    if _supports_partitions(schema_editor.connection):
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table '
+                'WHERE partrelid = %s::regclass)',
+                [TABLE],
+            )
+            if cursor.fetchone()[0]:
+                _replace_table(cursor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0045_timeline_created_at_indexes'),
+    ]
+
+    operations = [
+        # partitioned tables cannot have unique keys without created_at;
+        # record_asset_logs keeps the keys unique on every database
+        migrations.AlterField(
+            model_name='assetlog',
+            name='idempotency_key',
+            field=models.CharField(
+                blank=True, db_index=True, max_length=64, null=True
+            ),
+        ),
+        migrations.RunPython(partition_asset_logs, unpartition_asset_logs),
+    ]
@@ -22,4 +22,6 @@ from .centre import (  # noqa: F401
     OfficeFloorSection,
     OfficeWorkspace,
 )
+from .inventory import InventorySummary  # noqa: F401
+from .query import SlowQuery  # noqa: F401
 from .user import AISUserSync, APIUser, SecurityUser, User, UserFeedback  # noqa: F401
@@ -6,6 +6,8 @@ import uuid
 # Third-Party Imports
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 # App Imports
 from core import constants
@@ -13,12 +15,15 @@ from core.managers import CaseInsensitiveManager
 from core.slack_bot import SlackIntegration
 from core.validator import validate_date
 
+from .inventory import InventorySummary
 from .user import SecurityUser
 
 slack = SlackIntegration()
 
 logger = logging.getLogger(__name__)
 
+LAST_LOG_FIELDS = ('last_log_type', 'last_logged_at')
+
 
 class AssetCategory(models.Model):
     """ Stores all asset categories """
@@ -217,6 +222,16 @@ class Asset(models.Model):
         AssetSpecs, blank=True, null=True, on_delete=models.PROTECT
     )
     verified = models.BooleanField(default=True)
+    search_text = models.TextField(editable=False, blank=True, default='')
+    # denormalised from the latest AssetLog, written only by AssetLog
+    last_log_type = models.CharField(
+        max_length=10,
+        choices=constants.ASSET_LOG_CHOICES,
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    last_logged_at = models.DateTimeField(null=True, blank=True, editable=False)
     objects = CaseInsensitiveManager()
 
     def clean(self):
@@ -242,6 +257,14 @@ class Asset(models.Model):
         are provided and an existing status is given
         """
         self.full_clean()
+        self.search_text = self._build_search_text()
+        if not self._state.adding and not kwargs.get('update_fields'):
+            # never overwrite the check-in fields with a stale instance
+            kwargs['update_fields'] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in LAST_LOG_FIELDS
+            ]
         try:
             super().save(*args, **kwargs)
         except Exception as e:
@@ -249,6 +272,23 @@ class Asset(models.Model):
         else:
             self._save_initial_asset_status()
 
+    def _build_search_text(self):
+        """
+        Lowercased terms matched by the asset search endpoint: codes, model,
+        make, type, assignee and notes.
+        """
+        terms = [self.asset_code, self.serial_number]
+        model_number = self.model_number
+        if model_number:
+            terms.append(model_number.model_number)
+            if model_number.make_label:
+                terms.append(model_number.make_label.make_label)
+                terms.append(model_number.make_label.asset_type.asset_type)
+        if self.assigned_to:
+            terms.append(self.assigned_to.email)
+        terms.append(self.notes)
+        return ' '.join(term.strip() for term in terms if term and term.strip()).lower()
+
     def _save_initial_asset_status(self):
         existing_status = AssetStatus.objects.filter(asset=self)
         if not existing_status:
@@ -261,9 +301,43 @@ class Asset(models.Model):
             self.asset_code, self.serial_number, self.model_number
         )
 
+    @property
+    def checkin_status(self):
+        if self.last_log_type == constants.CHECKIN:
+            return "checked_in"
+        if self.last_log_type == constants.CHECKOUT:
+            return "checked_out"
+        return None
+
     class Meta:
         ordering = ['-id']
         unique_together = ("asset_code", "serial_number")
+        indexes = [
+            models.Index(
+                fields=['asset_location', 'last_log_type'],
+                name='core_asset_location_log_idx',
+            )
+        ]
+
+
+def refresh_asset_search_text(queryset):
+    """
+    Recompute `search_text` for assets changed without `Asset.save`,
+    e.g. by queryset updates or renamed models, makes and assignees.
+    """
+    queryset = queryset.select_related(
+        'model_number__make_label__asset_type',
+        'assigned_to__department',
+        'assigned_to__workspace',
+        'assigned_to__user',
+    )
+    updated = 0
+    for asset in queryset.iterator():
+        search_text = asset._build_search_text()
+        if search_text != asset.search_text:
+            Asset.objects.filter(id=asset.id).update(search_text=search_text)
+            updated += 1
+    return updated
 
 
 class AssetAssignee(models.Model):
@@ -316,13 +390,32 @@ class AssetAssignee(models.Model):
 
 
 class AssetLog(models.Model):
-    """Stores checkin/Checkout asset logs"""
+    """
+    Stores checkin/Checkout asset logs
+
+    On PostgreSQL 11 and later the table is partitioned by month of
+    created_at (migration 0046), which makes its primary key (id,
+    created_at) in the database. Ids still come from a single sequence, so
+    they stay unique.
+    """
 
     asset = models.ForeignKey(Asset, on_delete=models.PROTECT)
     checked_by = models.ForeignKey(SecurityUser, blank=True, on_delete=models.PROTECT)
     log_type = models.CharField(max_length=10, choices=constants.ASSET_LOG_CHOICES)
     created_at = models.DateTimeField(auto_now_add=True, editable=False)
     last_modified = models.DateTimeField(auto_now=True, editable=False)
+    # set by scanners that queue logs offline and upload them in batches
+    client_timestamp = models.DateTimeField(null=True, blank=True)
+    # unique, but checked by record_asset_logs: the unique keys of a
+    # partitioned table have to include created_at
+    idempotency_key = models.CharField(
+        max_length=64, null=True, blank=True, db_index=True
+    )
+
+    @property
+    def logged_at(self):
+        """When the scan happened: the client's time if given, else ours."""
+        return self.client_timestamp or self.created_at
 
     def clean(self):
         if not self.log_type:
@@ -331,10 +424,68 @@ class AssetLog(models.Model):
     def save(self, *args, **kwargs):
         self.full_clean()
         super().save(*args, **kwargs)
+        self._set_last_log_for_asset()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        refresh_asset_last_log(Asset.objects.filter(id=self.asset_id))
+        return result
+
+    def _set_last_log_for_asset(self):
+        """
+        Record this log on its asset in a single UPDATE, unless the asset
+        already holds a newer log.
+        """
+        updated = (
+            Asset.objects.filter(id=self.asset_id)
+            .filter(
+                Q(last_logged_at__isnull=True) | Q(last_logged_at__lte=self.logged_at)
+            )
+            .update(last_log_type=self.log_type, last_logged_at=self.logged_at)
+        )
+        if updated:
+            self.asset.last_log_type = self.log_type
+            self.asset.last_logged_at = self.logged_at
 
     class Meta:
         verbose_name = "Asset Log"
         ordering = ['-id']
+        indexes = [
+            models.Index(
+                fields=['asset', '-created_at'], name='core_assetlog_latest_idx'
+            )
+        ]
+
+
+def refresh_asset_last_log(queryset):
+    """
+    Recompute the check-in fields of the given assets from their AssetLog
+    history with one UPDATE.
+    """
+    latest_log = (
+        AssetLog.objects.filter(asset=OuterRef('pk'))
+        .annotate(logged_at=Coalesce('client_timestamp', 'created_at'))
+        .order_by('-logged_at', '-id')
+    )
+    return queryset.update(
+        last_log_type=Subquery(latest_log.values('log_type')[:1]),
+        last_logged_at=Subquery(latest_log.values('logged_at')[:1]),
+    )
+
+
+def check_asset_limit(model_number):
+    """Check the assets have not exceeded the limit"""
+    available_assets = (
+        InventorySummary.objects.filter(
+            status=constants.AVAILABLE, model_number=model_number
+        ).aggregate(total=Sum('count'))['total']
+        or 0
+    )
+    if available_assets <= int(os.environ.get('ASSET_LIMIT', 0)):
+        message = "Warning!! The number of available {} ".format(
+            model_number
+        ) + " is {}".format(available_assets)
+        slack.send_message(message)
 
 
 class AssetStatus(models.Model):
@@ -356,6 +507,11 @@ class AssetStatus(models.Model):
     class Meta:
         verbose_name_plural = 'Asset Statuses'
         ordering = ['-id']
+        indexes = [
+            models.Index(
+                fields=['asset', '-created_at'], name='core_assetstatus_latest_idx'
+            )
+        ]
 
     def save(self, *args, **kwargs):
         try:
@@ -383,16 +539,7 @@ class AssetStatus(models.Model):
         current_asset.save()
 
     def _check_asset_limit(self):
-        """Check the assets have not exceeded the limit"""
-        model_number = self.asset.model_number
-        available_assets = Asset.objects.filter(
-            current_status='Available', model_number=model_number
-        ).count()
-        if available_assets <= int(os.environ.get('ASSET_LIMIT', 0)):
-            message = "Warning!! The number of available {} ".format(
-                model_number
-            ) + " is {}".format(available_assets)
-            slack.send_message(message)
+        check_asset_limit(self.asset.model_number)
 
     def _new_allocation_history_when_asset_is_made_available(self):
         try:
@@ -432,6 +579,11 @@ class AllocationHistory(models.Model):
     class Meta:
         verbose_name_plural = "Allocation History"
         ordering = ['-id']
+        indexes = [
+            models.Index(
+                fields=['asset', '-created_at'], name='core_allocation_latest_idx'
+            )
+        ]
 
     def clean(self):
         if self.asset.current_status != constants.AVAILABLE:
@@ -502,6 +654,11 @@ class AssetCondition(models.Model):
     class Meta:
         verbose_name_plural = 'Asset Condition'
         ordering = ['-id']
+        indexes = [
+            models.Index(
+                fields=['asset', '-created_at'], name='core_condition_latest_idx'
+            )
+        ]
 
     def save(self, *args, **kwargs):
         try:
@@ -528,9 +685,16 @@ class AssetIncidentReport(models.Model):
     witnesses = models.TextField(null=True, blank=True)
     police_abstract_obtained = models.CharField(max_length=255)
     submitted_by = models.ForeignKey('User', null=True, on_delete=models.PROTECT)
+    # null for reports filed before it was recorded
+    created_at = models.DateTimeField(auto_now_add=True, null=True, editable=False)
 
     def __str__(self):
         return f"{self.incident_type}: {self.asset}"
 
     class Meta:
         ordering = ['-id']
+        indexes = [
+            models.Index(
+                fields=['asset', '-created_at'], name='core_incident_latest_idx'
+            )
+        ]
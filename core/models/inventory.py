@@ -0,0 +1,36 @@
+# Third-Party Imports
+from django.db import models
+
+# App Imports
+from core import constants
+
+
+class InventorySummary(models.Model):
+    """
+    Stores the number of assets per centre, model number and status, kept
+    up to date by `core.inventory` as assets change
+    """
+
+    centre = models.ForeignKey(
+        'AndelaCentre', null=True, blank=True, on_delete=models.CASCADE
+    )
+    # the asset type of the model number, copied for grouping
+    asset_type = models.ForeignKey(
+        'AssetType', null=True, blank=True, on_delete=models.CASCADE
+    )
+    model_number = models.ForeignKey(
+        'AssetModelNumber', null=True, blank=True, on_delete=models.CASCADE
+    )
+    status = models.CharField(max_length=50, choices=constants.ASSET_STATUSES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Inventory Summary'
+        verbose_name_plural = 'Inventory Summaries'
+        ordering = ['centre_id', 'model_number_id', 'status']
+        unique_together = ('centre', 'model_number', 'status')
+
+    def __str__(self):
+        return '{}, {}, {}: {}'.format(
+            self.centre_id, self.model_number_id, self.status, self.count
+        )
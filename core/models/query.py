@@ -0,0 +1,29 @@
+# Third-Party Imports
+from django.db import models
+
+
+class SlowQuery(models.Model):
+    """ Stores a query that ran slower than SLOW_QUERY_MS, and its plan """
+
+    fingerprint = models.CharField(max_length=40, unique=True)
+    database = models.CharField(max_length=100)
+    sql = models.TextField()
+    source = models.TextField(blank=True)
+    plan = models.TextField(blank=True)
+    calls = models.PositiveIntegerField(default=1)
+    total_ms = models.FloatField()
+    max_ms = models.FloatField()
+    first_seen = models.DateTimeField(auto_now_add=True, editable=False)
+    last_seen = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'Slow Query'
+        verbose_name_plural = 'Slow Queries'
+        ordering = ['-total_ms']
+
+    @property
+    def mean_ms(self):
+        return round(self.total_ms / self.calls, 2)
+
+    def __str__(self):
+        return '{} ms x {}: {}'.format(self.mean_ms, self.calls, self.sql[:80])
@@ -1,5 +1,16 @@
+# Standard Library
+import binascii
+from base64 import b64decode, b64encode
+
 # Third-Party Imports
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+# App Imports
+from core.timeline import UNDATED
 
 
 def _positive_int(integer_string, strict=False, cutoff=None):
@@ -34,3 +45,66 @@ class PageNumberPagination(PageNumberPagination):
                 pass
 
         return self.page_size
+
+
+class TimelinePagination:
+    """
+    Cursor pagination for an asset's timeline. The cursor is the key of the
+    last entry of the previous page, so pages stay stable as records are added.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 500
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            created_at, index, record_id = (
+                b64decode(encoded.encode('ascii'), altchars=b'-_')
+                .decode('ascii')
+                .split('|')
+            )
+            if created_at:
+                created_at = parse_datetime(created_at)
+                if created_at is None:
+                    raise ValueError(created_at)
+            else:
+                created_at = UNDATED
+            return created_at, int(index), int(record_id)
+        except (TypeError, ValueError, binascii.Error):
+            raise NotFound('Invalid cursor')
+
+    def encode_cursor(self, key):
+        created_at, index, record_id = key
+        position = '{}|{}|{}'.format(
+            '' if created_at == UNDATED else created_at.isoformat(), index, record_id
+        )
+        return b64encode(position.encode('ascii'), altchars=b'-_').decode('ascii')
+
+    def get_paginated_response(self, request, entries, page_size, results):
+        """
+        `entries` are the timeline entries read for the page, one more than
+        `page_size` when there is a next page.
+        """
+        next_link = None
+        if len(entries) > page_size:
+            next_link = replace_query_param(
+                request.build_absolute_uri(),
+                self.cursor_query_param,
+                self.encode_cursor(entries[page_size - 1][0]),
+            )
+        return Response({'next': next_link, 'results': results})
@@ -0,0 +1,109 @@
+# Third-Party Imports
+from django.apps import apps
+from django.db.models.signals import post_delete, post_init, post_save
+
+# App Imports
+from core import models
+from core.cache import bump_namespace_version, CENTRE_FIELDS, invalidate_model, TAXONOMY
+from core.inventory import inventory_key, record_inventory_changes
+
+TAXONOMY_MODELS = (
+    models.AssetCategory,
+    models.AssetSubCategory,
+    models.AssetType,
+    models.AssetMake,
+    models.AssetModelNumber,
+)
+
+
+def invalidate_taxonomy_cache(sender, **kwargs):
+    bump_namespace_version(TAXONOMY)
+
+
+for taxonomy_model in TAXONOMY_MODELS:
+    post_save.connect(invalidate_taxonomy_cache, sender=taxonomy_model)
+    post_delete.connect(invalidate_taxonomy_cache, sender=taxonomy_model)
+
+
+def remember_centre(sender, instance, **kwargs):
+    """Note the centre a row was loaded with, to invalidate it if it moves."""
+    instance._loaded_centre_id = instance.__dict__.get(
+        CENTRE_FIELDS[sender._meta.label_lower]
+    )
+
+
+def invalidate_model_cache(sender, instance, **kwargs):
+    field = CENTRE_FIELDS.get(sender._meta.label_lower)
+    if field is None:
+        invalidate_model(sender)
+        return
+    centre_id = instance.__dict__.get(field)
+    invalidate_model(
+        sender, {centre_id, getattr(instance, '_loaded_centre_id', centre_id)}
+    )
+    instance._loaded_centre_id = centre_id
+
+
+for core_model in apps.get_app_config('core').get_models():
+    if core_model in (models.SlowQuery, models.InventorySummary):
+        continue
+    post_save.connect(invalidate_model_cache, sender=core_model)
+    post_delete.connect(invalidate_model_cache, sender=core_model)
+    if core_model._meta.label_lower in CENTRE_FIELDS:
+        post_init.connect(remember_centre, sender=core_model)
+
+
+def invalidate_logged_asset_cache(sender, instance, **kwargs):
+    """Logs update the check-in fields of their asset without saving it."""
+    invalidate_model(models.Asset, {instance.asset.asset_location_id})
+
+
+post_save.connect(invalidate_logged_asset_cache, sender=models.AssetLog)
+post_delete.connect(invalidate_logged_asset_cache, sender=models.AssetLog)
+
+
+def remember_inventory_key(sender, instance, **kwargs):
+    """Note the inventory summary row an asset was loaded in."""
+    instance._inventory_key = inventory_key(instance)
+
+
+def count_saved_asset(sender, instance, created, **kwargs):
+    before = None if created else getattr(instance, '_inventory_key', False)
+    after = inventory_key(instance)
+    instance._inventory_key = after
+    # False when the asset was loaded without those fields; the
+    # reconcile_inventory command corrects the summary
+    if before is not False and after is not False and before != after:
+        record_inventory_changes({before: -1, after: 1})
+
+
+def uncount_deleted_asset(sender, instance, **kwargs):
+    key = getattr(instance, '_inventory_key', False)
+    if key:
+        record_inventory_changes({key: -1})
+
+
+post_init.connect(remember_inventory_key, sender=models.Asset)
+post_save.connect(count_saved_asset, sender=models.Asset)
+post_delete.connect(uncount_deleted_asset, sender=models.Asset)
+
+
+def copy_asset_type_of_model_number(sender, instance, created, **kwargs):
+    if created:
+        return
+    asset_type_id = instance.make_label.asset_type_id if instance.make_label else None
+    models.InventorySummary.objects.filter(model_number=instance).exclude(
+        asset_type_id=asset_type_id
+    ).update(asset_type_id=asset_type_id)
+
+
+def copy_asset_type_of_make(sender, instance, created, **kwargs):
+    if created:
+        return
+    models.InventorySummary.objects.filter(model_number__make_label=instance).exclude(
+        asset_type_id=instance.asset_type_id
+    ).update(asset_type_id=instance.asset_type_id)
+
+
+post_save.connect(copy_asset_type_of_model_number, sender=models.AssetModelNumber)
+post_save.connect(copy_asset_type_of_make, sender=models.AssetMake)
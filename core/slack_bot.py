@@ -2,12 +2,16 @@
 import json
 import logging
 import os
+import time
 
 # Third-Party Imports
 from rest_framework import status
 from rest_framework.response import Response
 from slackclient import SlackClient
 
+# App Imports
+from core.metrics import SLACK_DURATION, SLACK_FAILURES
+
 
 class SlackIntegration(object):
     """Slack Integration class"""
@@ -20,10 +24,24 @@ class SlackIntegration(object):
         if slack_token:
             self.slack_client = SlackClient(slack_token)
 
+    def _api_call(self, method, **kwargs):
+        """Call the Slack API, recording its latency and failures"""
+        start = time.perf_counter()
+        try:
+            response = self.slack_client.api_call(method, **kwargs)
+        except Exception:
+            SLACK_FAILURES.inc(method=method)
+            raise
+        finally:
+            SLACK_DURATION.observe(time.perf_counter() - start, method=method)
+        if not response.get('ok'):
+            SLACK_FAILURES.inc(method=method)
+        return response
+
     def get_user_slack_id(self, user):
         """Get the slack user ID using the user email"""
         user_email = user.email
-        response = self.slack_client.api_call("users.list")
+        response = self._api_call("users.list")
         users = response.get("members")
         if users:
             user_id = [
@@ -46,7 +64,7 @@ class SlackIntegration(object):
                 slack_id = channel
             else:
                 slack_id = os.getenv('OPS_CHANNEL') or '#art-test'
-            self.slack_client.api_call(
+            self._api_call(
                 "chat.postMessage",
                 channel=slack_id,
                 text=message,
@@ -58,7 +76,7 @@ class SlackIntegration(object):
     def get_user_slack_email(self, user_id):
         """Get the slack user ID using the user email"""
 
-        response = self.slack_client.api_call("users.list")
+        response = self._api_call("users.list")
         users = response.get("members")
         if users:
             user = [
@@ -76,7 +94,7 @@ class SlackIntegration(object):
         if incidence_report.get('payload') is None:
             channel_id = incidence_report.get('channel_id')
             user_id = incidence_report.get('user_id')
-            self.slack_client.api_call(
+            self._api_call(
                 "chat.postEphemeral",
                 username='Art-incidence-report',
                 channel=channel_id,
@@ -123,7 +141,7 @@ class SlackIntegration(object):
                         assigned_to__user__email=self.user_email
                     )
                     if len(assets) == 0:
-                        no_asset = self.slack_client.api_call(
+                        no_asset = self._api_call(
                             'chat.postEphemeral',
                             username='Art-incidence-report',
                             channel=payload['channel']['id'],
@@ -135,7 +153,7 @@ class SlackIntegration(object):
                         if no_asset:
                             return Response(status=status.HTTP_200_OK)
 
-                    self.slack_client.api_call(
+                    self._api_call(
                         'dialog.open',
                         trigger_id=payload['trigger_id'],
                         dialog={
@@ -208,7 +226,7 @@ class SlackIntegration(object):
             report.save()
             if report:
                 smile = ":simple_smile::simple_smile::simple_smile:"
-                self.slack_client.api_call(
+                self._api_call(
                     "chat.postEphemeral",
                     username='Art-incidence-report',
                     channel=payload['channel']['id'],
@@ -0,0 +1,200 @@
+# Standard Library
+import hashlib
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+
+# Third-Party Imports
+from django.conf import settings
+from django.db import connections, DatabaseError, IntegrityError, transaction
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+# App Imports
+from core.models import SlowQuery
+
+logger = logging.getLogger(__name__)
+
+# apps whose frames name the source of a query
+SOURCE_APPS = ('api', 'core')
+# instrumentation whose frames are left out of the source
+SKIPPED_MODULES = ('api.perf', 'api.nplusone', __name__)
+# innermost source frames kept
+SOURCE_DEPTH = 4
+QUEUE_SIZE = 1000
+
+_local = threading.local()
+
+
+def _frame_name(frame):
+    instance = frame.f_locals.get('self')
+    module = type(instance).__module__ if instance is not None else None
+    if module and module.split('.')[0] in SOURCE_APPS:
+        if module in SKIPPED_MODULES:
+            return None
+        return '{}.{}'.format(type(instance).__name__, frame.f_code.co_name)
+    module = frame.f_globals.get('__name__', '')
+    if module.split('.')[0] in SOURCE_APPS and module not in SKIPPED_MODULES:
+        return '{}.{}'.format(module, frame.f_code.co_name)
+    return None
+
+
+def _source():
+    """
+    Name the innermost views, serializers, model methods and functions of
+    this project on the stack, outermost first.
+    """
+    names = []
+    frame = sys._getframe(2)
+    while frame is not None and len(names) < SOURCE_DEPTH:
+        name = _frame_name(frame)
+        if name and (not names or names[-1] != name):
+            names.append(name)
+        frame = frame.f_back
+    return ' > '.join(reversed(names))
+
+
+def _fingerprint(database, sql):
+    return hashlib.sha1('{}\n{}'.format(database, sql).encode()).hexdigest()
+
+
+def _explain(query):
+    """Return the plan of a captured SELECT, without running it."""
+    if query['many'] or not query['sql'].lstrip().upper().startswith('SELECT'):
+        return ''
+    connection = connections[query['database']]
+    options = {'analyze': False} if connection.vendor == 'postgresql' else {}
+    try:
+        with transaction.atomic(using=query['database']):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    '{} {}'.format(
+                        connection.ops.explain_query_prefix(**options), query['sql']
+                    ),
+                    query['params'],
+                )
+                return '\n'.join(
+                    ' '.join(str(column) for column in row) for row in cursor.fetchall()
+                )
+    except DatabaseError:
+        logger.warning('Could not explain slow query', exc_info=True)
+        return ''
+
+
+class SlowQueryLog:
+    """
+    Time every query and hand those slower than SLOW_QUERY_MS to a background
+    thread, which explains them and keeps the SLOW_QUERY_LIMIT most recently
+    seen in the SlowQuery table.
+
+    Queries under the threshold only pay for two clock reads.
+    """
+
+    def __init__(self):
+        self.queue = queue.Queue(QUEUE_SIZE)
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        threshold = settings.SLOW_QUERY_MS
+        if threshold <= 0 or getattr(_local, 'storing', False):
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = (time.perf_counter() - start) * 1000
+            if duration >= threshold:
+                self.submit(
+                    {
+                        'database': context['connection'].alias,
+                        'sql': sql,
+                        'params': None if many else params,
+                        'many': many,
+                        'duration': duration,
+                        'source': _source(),
+                    }
+                )
+
+    def install(self, connection, **kwargs):
+        """`connection_created` receiver adding the timer to new connections."""
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+    def submit(self, query):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                # not yet started, or started before this process was forked
+                self.thread = threading.Thread(
+                    target=self._run, name='slow-queries-{}'.format(os.getpid())
+                )
+                self.thread.daemon = True
+                self.thread.start()
+        try:
+            self.queue.put_nowait(query)
+        except queue.Full:
+            logger.warning('Slow query queue full, dropping %s', query['sql'][:200])
+
+    def _run(self):
+        while True:
+            query = self.queue.get()
+            try:
+                self.store(query)
+            except Exception:
+                logger.exception('Could not store slow query')
+            finally:
+                connections.close_all()
+
+    def store(self, query):
+        """Record one captured query, explaining it the first time it is seen."""
+        _local.storing = True
+        try:
+            self._store(query)
+        finally:
+            _local.storing = False
+
+    def _store(self, query):
+        fingerprint = _fingerprint(query['database'], query['sql'])
+        duration = query['duration']
+        existing = SlowQuery.objects.filter(fingerprint=fingerprint)
+        plan = ''
+        if settings.SLOW_QUERY_EXPLAIN and not existing.exclude(plan='').exists():
+            plan = _explain(query)
+        changes = {'plan': plan} if plan else {}
+        updated = existing.update(
+            calls=F('calls') + 1,
+            total_ms=F('total_ms') + duration,
+            max_ms=Greatest('max_ms', Value(duration), output_field=FloatField()),
+            source=query['source'],
+            last_seen=timezone.now(),
+            **changes
+        )
+        if updated:
+            return
+        try:
+            with transaction.atomic():
+                SlowQuery.objects.create(
+                    fingerprint=fingerprint,
+                    database=query['database'],
+                    sql=query['sql'],
+                    source=query['source'],
+                    plan=plan,
+                    total_ms=duration,
+                    max_ms=duration,
+                    last_seen=timezone.now(),
+                )
+        except IntegrityError:
+            # stored by another process in the meantime
+            return
+        limit = settings.SLOW_QUERY_LIMIT
+        stale = SlowQuery.objects.order_by('-last_seen', '-pk').values_list(
+            'pk', flat=True
+        )[limit:]
+        SlowQuery.objects.filter(pk__in=list(stale)).delete()
+
+
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,251 @@
+# Standard Library
+import shutil
+import tempfile
+from datetime import date, datetime
+from io import StringIO
+from unittest.mock import patch
+
+# Third-Party Imports
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import override_settings
+from django.utils import timezone
+
+# App Imports
+from core.asset_log_archive import archived_months, read_archive
+from core.db.partitions import (
+    create_monthly_partition,
+    DEFAULT_PARTITION_NAME,
+    is_partitioned,
+    monthly_partitions,
+)
+from core.models import Asset, AssetLog
+from core.tests import CoreBaseTestCase
+
+NOW = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+
+
+@patch('django.utils.timezone.now', lambda: NOW)
+class AssetLogArchiveTestCase(CoreBaseTestCase):
+    def setUp(self):
+        self.archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.archive_dir)
+        settings = override_settings(
+            ASSET_LOG_ARCHIVE_DIR=self.archive_dir, ASSET_LOG_RETENTION_MONTHS=12
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.old_logs = [
+            self._log('Checkin', datetime(2025, 3, 4, 8, tzinfo=timezone.utc)),
+            self._log('Checkout', datetime(2025, 3, 4, 17, tzinfo=timezone.utc)),
+            self._log('Checkin', datetime(2025, 10, 31, 23, tzinfo=timezone.utc)),
+        ]
+        self.recent_log = self._log(
+            'Checkout', datetime(2025, 11, 1, tzinfo=timezone.utc)
+        )
+        if connection.vendor == 'postgresql':
+            # partitions may be added below, which PostgreSQL refuses while
+            # the foreign keys of the rows written above are still to be
+            # checked
+            with connection.cursor() as cursor:
+                cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+    def _log(self, log_type, created_at, **fields):
+        log = AssetLog.objects.create(
+            asset=self.test_asset,
+            checked_by=self.security_user,
+            log_type=log_type,
+            **fields,
+        )
+        AssetLog.objects.filter(id=log.id).update(created_at=created_at)
+        return AssetLog.objects.get(id=log.id)
+
+    def _values(self, logs):
+        return [
+            (log.id, log.asset_id, log.log_type, log.created_at, log.idempotency_key)
+            for log in logs
+        ]
+
+    def _archive(self, *args):
+        out = StringIO()
+        call_command('archive_asset_logs', *args, stdout=out)
+        return out.getvalue()
+
+    def test_logs_older_than_the_retention_window_are_archived(self):
+        out = self._archive()
+
+        self.assertEqual(
+            list(AssetLog.objects.values_list('id', flat=True)), [self.recent_log.id]
+        )
+        self.assertEqual(archived_months(), [date(2025, 3, 1), date(2025, 10, 1)])
+        self.assertIn('2 logs of 2025-03 archived', out)
+        self.assertIn('1 logs of 2025-10 archived', out)
+        archived = list(read_archive(date(2025, 3, 1))) + list(
+            read_archive(date(2025, 10, 1))
+        )
+        self.assertEqual(self._values(archived), self._values(self.old_logs))
+
+    def test_archiving_keeps_the_checkin_status_of_assets(self):
+        self._archive('--months', '1')
+
+        self.assertFalse(AssetLog.objects.exists())
+        self.assertEqual(
+            Asset.objects.get(id=self.test_asset.id).checkin_status, 'checked_out'
+        )
+
+    def test_dry_run_lists_the_months_without_archiving(self):
+        out = self._archive('--dry-run')
+
+        self.assertEqual(
+            out, '2025-03 would be archived.\n2025-10 would be archived.\n'
+        )
+        self.assertEqual(AssetLog.objects.count(), 4)
+        self.assertEqual(archived_months(), [])
+
+    def test_archived_months_can_be_restored(self):
+        keyed = self._log(
+            'Checkin',
+            datetime(2025, 3, 5, tzinfo=timezone.utc),
+            idempotency_key='scanner-1:42',
+        )
+        self._archive()
+
+        out = self._archive('--restore', '2025-03')
+        self.assertIn('3 logs of 2025-03 restored', out)
+        self.assertIn(
+            '0 logs of 2025-03 restored', self._archive('--restore', '2025-03')
+        )
+
+        restored = AssetLog.objects.filter(created_at__lt=self.recent_log.created_at)
+        self.assertEqual(
+            self._values(restored.order_by('id')),
+            self._values(self.old_logs[:2] + [keyed]),
+        )
+
+    def test_months_are_checked(self):
+        with self.assertRaisesMessage(CommandError, 'YYYY-MM'):
+            self._archive('--restore', 'March')
+        with self.assertRaisesMessage(CommandError, 'No logs are archived'):
+            self._archive('--restore', '2025-03')
+        with self.assertRaisesMessage(CommandError, 'At least one month'):
+            self._archive('--months', '0')
+
+
+@patch('django.utils.timezone.now', lambda: NOW)
+class PartitionedAssetLogTestCase(CoreBaseTestCase):
+    """The partitioned log table that migration 0046 makes on PostgreSQL 11+."""
+
+    def setUp(self):
+        self.table = AssetLog._meta.db_table
+        if not is_partitioned(self.table):
+            self.skipTest('Needs the partitioned log table of PostgreSQL 11+.')
+        self.archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.archive_dir)
+        settings = override_settings(
+            ASSET_LOG_ARCHIVE_DIR=self.archive_dir, ASSET_LOG_RETENTION_MONTHS=12
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.march_logs = [
+            self._log('Checkin', datetime(2025, 3, 4, 8, tzinfo=timezone.utc)),
+            self._log('Checkout', datetime(2025, 3, 31, 23, tzinfo=timezone.utc)),
+        ]
+        self.april_log = self._log('Checkin', datetime(2025, 4, 1, tzinfo=timezone.utc))
+        # the tables are altered below, which PostgreSQL refuses while the
+        # foreign keys of the rows written above are still to be checked
+        self._execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+    def _log(self, log_type, created_at):
+        log = AssetLog.objects.create(
+            asset=self.test_asset, checked_by=self.security_user, log_type=log_type
+        )
+        AssetLog.objects.filter(id=log.id).update(created_at=created_at)
+        return AssetLog.objects.get(id=log.id)
+
+    def _execute(self, sql, params=None):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall() if cursor.description else None
+
+    def _ids_in(self, partition):
+        return [
+            row[0]
+            for row in self._execute(
+                'SELECT id FROM {} ORDER BY id'.format(
+                    connection.ops.quote_name(partition)
+                )
+            )
+        ]
+
+    def _values(self, logs):
+        return [(log.id, log.asset_id, log.log_type, log.created_at) for log in logs]
+
+    def _migrate(self, target):
+        MigrationExecutor(connection).migrate([('core', target)])
+
+    def test_primary_key_holds_the_partition_key(self):
+        definition = self._execute(
+            "SELECT pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'p'",
+            [self.table],
+        )
+        self.assertEqual(definition, [('PRIMARY KEY (id, created_at)',)])
+
+    def test_migration_can_be_reversed_and_reapplied(self):
+        logs = list(AssetLog.objects.order_by('id'))
+
+        self._migrate('0045_timeline_created_at_indexes')
+        self.assertFalse(is_partitioned(self.table))
+        self.assertEqual(
+            self._values(AssetLog.objects.order_by('id')), self._values(logs)
+        )
+
+        self._migrate('0046_partition_asset_logs')
+        self.assertTrue(is_partitioned(self.table))
+        self.assertEqual(
+            self._values(AssetLog.objects.order_by('id')), self._values(logs)
+        )
+        # partitioned from the month of the oldest log
+        self.assertEqual(
+            self._ids_in(monthly_partitions(self.table)[date(2025, 3, 1)]),
+            [log.id for log in self.march_logs],
+        )
+
+    def test_new_partitions_take_their_rows_from_the_default_one(self):
+        default = DEFAULT_PARTITION_NAME.format(self.table)
+        self.assertIn(self.april_log.id, self._ids_in(default))
+
+        name = create_monthly_partition(self.table, 'created_at', date(2025, 3, 1))
+
+        self.assertEqual(monthly_partitions(self.table)[date(2025, 3, 1)], name)
+        self.assertEqual(self._ids_in(name), [log.id for log in self.march_logs])
+        self.assertNotIn(self.march_logs[0].id, self._ids_in(default))
+        self.assertIn(self.april_log.id, self._ids_in(default))
+        # new logs of the month are written to its partition
+        log = self._log('Checkout', datetime(2025, 3, 10, tzinfo=timezone.utc))
+        self.assertIn(log.id, self._ids_in(name))
+
+    def test_partitions_are_copied_to_archives_and_dropped(self):
+        create_monthly_partition(self.table, 'created_at', date(2025, 3, 1))
+
+        out = StringIO()
+        call_command('archive_asset_logs', stdout=out)
+
+        self.assertIn('2 logs of 2025-03 archived', out.getvalue())
+        self.assertIn('1 logs of 2025-04 archived', out.getvalue())
+        self.assertNotIn(date(2025, 3, 1), monthly_partitions(self.table))
+        self.assertFalse(AssetLog.objects.filter(created_at__year=2025).exists())
+        self.assertEqual(
+            self._values(read_archive(date(2025, 3, 1))), self._values(self.march_logs)
+        )
+
+        call_command('archive_asset_logs', '--restore', '2025-03', stdout=StringIO())
+        self.assertIn(date(2025, 3, 1), monthly_partitions(self.table))
+        self.assertEqual(
+            self._values(AssetLog.objects.filter(created_at__year=2025).order_by('id')),
+            self._values(self.march_logs),
+        )
@@ -6,7 +6,8 @@ from django.db.models.deletion import ProtectedError
 # App Imports
 from core.tests import CoreBaseTestCase
 
-from ..models import Asset, AssetModelNumber
+from ..models import AllocationHistory, Asset, AssetLog, AssetModelNumber
+from ..models.asset import refresh_asset_last_log, refresh_asset_search_text
 
 User = get_user_model()
 
@@ -90,3 +91,78 @@ class AssetTypeModelTest(CoreBaseTestCase):
 
     def test_that_the_default_verification_status_on_asset_is_true(self):
         self.assertTrue(self.test_asset.verified)
+
+    def test_search_text_includes_codes_model_make_type_and_assignee(self):
+        asset = Asset.objects.create(
+            asset_code="IC0060",
+            serial_number="SN0066",
+            model_number=self.test_assetmodel,
+        )
+        AllocationHistory.objects.create(asset=asset, current_owner=self.asset_assignee)
+        asset.refresh_from_db()
+        for term in (
+            "ic0060",
+            "sn0066",
+            self.test_assetmodel.model_number.lower(),
+            self.asset_make.make_label.lower(),
+            self.asset_type.asset_type.lower(),
+            self.user.email.lower(),
+        ):
+            self.assertIn(term, asset.search_text)
+
+    def test_refresh_asset_search_text_after_queryset_update(self):
+        Asset.objects.filter(id=self.test_asset.id).update(
+            assigned_to=self.asset_assignee2
+        )
+        updated = refresh_asset_search_text(Asset.objects.filter(id=self.test_asset.id))
+        self.assertEqual(updated, 1)
+        self.assertIn(
+            self.user2.email, Asset.objects.get(id=self.test_asset.id).search_text
+        )
+
+    def test_asset_log_sets_checkin_status_on_asset(self):
+        asset = Asset.objects.get(id=self.test_asset.id)
+        self.assertIsNone(asset.checkin_status)
+        AssetLog.objects.create(
+            checked_by=self.security_user, asset=asset, log_type="Checkin"
+        )
+        self.assertEqual(asset.checkin_status, "checked_in")
+        log = AssetLog.objects.create(
+            checked_by=self.security_user, asset=asset, log_type="Checkout"
+        )
+        asset = Asset.objects.get(id=self.test_asset.id)
+        self.assertEqual(asset.checkin_status, "checked_out")
+        self.assertEqual(asset.last_logged_at, log.created_at)
+
+        log.delete()
+        self.assertEqual(
+            Asset.objects.get(id=self.test_asset.id).checkin_status, "checked_in"
+        )
+
+    def test_stale_asset_save_keeps_checkin_status(self):
+        stale_asset = Asset.objects.get(id=self.test_asset.id)
+        AssetLog.objects.create(
+            checked_by=self.security_user,
+            asset=Asset.objects.get(id=self.test_asset.id),
+            log_type="Checkout",
+        )
+        stale_asset.notes = "Screen cracked"
+        stale_asset.save()
+        asset = Asset.objects.get(id=self.test_asset.id)
+        self.assertEqual(asset.notes, "Screen cracked")
+        self.assertEqual(asset.checkin_status, "checked_out")
+
+    def test_refresh_asset_last_log_after_queryset_update(self):
+        AssetLog.objects.create(
+            checked_by=self.security_user,
+            asset=Asset.objects.get(id=self.test_asset.id),
+            log_type="Checkin",
+        )
+        Asset.objects.filter(id=self.test_asset.id).update(
+            last_log_type=None, last_logged_at=None
+        )
+        updated = refresh_asset_last_log(Asset.objects.filter(id=self.test_asset.id))
+        self.assertEqual(updated, 1)
+        self.assertEqual(
+            Asset.objects.get(id=self.test_asset.id).checkin_status, "checked_in"
+        )
@@ -1,6 +1,7 @@
 # Third-Party Imports
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import connection
 
 # App Imports
 from core.models import AllocationHistory, Asset, AssetStatus
@@ -76,3 +77,21 @@ class AssetStatusModelTest(CoreBaseTestCase):
         self.assertIsNone(self.test_asset.assigned_to)
         self.assertIsNone(new_history.current_owner)
         self.assertIn(str(new_history.previous_owner), 'test@site.com')
+
+    def test_latest_status_lookup_uses_asset_created_at_index(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, AssetStatus._meta.db_table
+            )
+            # PostgreSQL would prefer a sequential scan on a table this small
+            if connection.vendor == 'postgresql':
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        index = constraints['core_assetstatus_latest_idx']
+        self.assertEqual(index['columns'], ['asset_id', 'created_at'])
+        self.assertEqual(index['orders'], ['ASC', 'DESC'])
+
+        queryset = AssetStatus.objects.filter(asset=self.test_asset).order_by(
+            '-created_at'
+        )
+        plan = queryset[:1].explain()
+        self.assertIn('core_assetstatus_latest_idx', plan)
@@ -0,0 +1,86 @@
+# Standard Library
+import io
+import json
+import os
+import tempfile
+
+# Third-Party Imports
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+# App Imports
+from core.models import AllocationHistory, Asset, AssetLog, AssetStatus
+from core.tests import CoreBaseTestCase
+
+
+class BenchmarkCommandTestCase(CoreBaseTestCase):
+    def setUp(self):
+        handle, self.output = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        self.addCleanup(os.remove, self.output)
+
+    def _benchmark(self, *args):
+        call_command(
+            'benchmark_api',
+            '--endpoint=assets-list',
+            '--endpoint=assets-detail',
+            '--endpoint=asset-logs-list',
+            '--iterations=2',
+            '--output={}'.format(self.output),
+            *args,
+            stdout=io.StringIO(),
+        )
+        with open(self.output) as output:
+            return json.load(output)
+
+    def test_seeds_inventory_and_writes_results(self):
+        report = self._benchmark(
+            '--seed', '--assets=6', '--users=4', '--statuses=30', '--logs=12'
+        )
+
+        seeded = Asset.objects.filter(asset_code__contains='-')
+        self.assertEqual(seeded.count(), 6)
+        allocated = seeded.filter(assigned_to__user__email__startswith='benchmark')
+        # allocating assets to the benchmark admin records their new status
+        self.assertEqual(
+            AssetStatus.objects.filter(asset__in=seeded).count(), 30 + allocated.count()
+        )
+        self.assertEqual(AssetLog.objects.filter(asset__in=seeded).count(), 12)
+        self.assertEqual(
+            [result['endpoint'] for result in report['endpoints']],
+            ['assets-list', 'assets-detail', 'asset-logs-list'],
+        )
+        for result in report['endpoints']:
+            self.assertEqual(result['status'], 200)
+            self.assertGreater(result['queries'], 0)
+            self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+            self.assertIn('peak_memory_kb', result)
+
+    def test_compare_fails_when_query_counts_go_up(self):
+        report = self._benchmark(
+            '--seed', '--assets=2', '--users=2', '--statuses=4', '--logs=0'
+        )
+        report['endpoints'][0]['queries'] -= 1
+        with open(self.output, 'w') as baseline:
+            json.dump(report, baseline)
+
+        with self.assertRaisesMessage(CommandError, 'assets-list'):
+            self._benchmark('--allow-writes', '--compare={}'.format(self.output))
+
+    def test_refuses_to_write_without_seed_or_allow_writes(self):
+        with self.assertRaisesMessage(CommandError, '--allow-writes'):
+            self._benchmark()
+        self.assertFalse(Asset.objects.filter(asset_code__contains='-').exists())
+
+    def test_admin_is_allocated_generated_assets_only(self):
+        self._benchmark('--seed', '--assets=6', '--users=2', '--statuses=6', '--logs=0')
+
+        allocated = Asset.objects.filter(
+            assigned_to__user__email__startswith='benchmark'
+        )
+        self.assertTrue(allocated.exists())
+        self.assertFalse(allocated.exclude(asset_code__contains='-').exists())
+        self.assertEqual(
+            AllocationHistory.objects.filter(asset__in=allocated).count(),
+            allocated.count(),
+        )
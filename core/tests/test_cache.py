@@ -0,0 +1,68 @@
+# App Imports
+from core.cache import get_namespace_version, model_namespace
+from core.models import AndelaCentre, Asset, AssetLog, Department
+from core.tests import CoreBaseTestCase
+
+
+class ModelCacheInvalidationTestCase(CoreBaseTestCase):
+    def setUp(self):
+        country = self.country
+        self.nairobi = AndelaCentre.objects.create(
+            centre_name='Nairobi', country=country
+        )
+        self.lagos = AndelaCentre.objects.create(centre_name='Lagos', country=country)
+
+    def _versions(self, model, *centres):
+        return [get_namespace_version(model_namespace(model))] + [
+            get_namespace_version(model_namespace(model, centre.id))
+            for centre in centres
+        ]
+
+    def test_writes_invalidate_their_model(self):
+        before = get_namespace_version(model_namespace(Department))
+        department = Department.objects.create(name='Procurement')
+        self.assertGreater(get_namespace_version(model_namespace(Department)), before)
+
+        before = get_namespace_version(model_namespace(Department))
+        department.delete()
+        self.assertGreater(get_namespace_version(model_namespace(Department)), before)
+
+    def test_models_without_a_centre_have_one_namespace(self):
+        self.assertEqual(
+            model_namespace(Department, self.nairobi.id), model_namespace(Department)
+        )
+
+    def test_writes_only_invalidate_their_centre(self):
+        asset = Asset.objects.get(pk=self.test_asset.pk)
+        asset.asset_location = self.nairobi
+        asset.save()
+        before = self._versions(Asset, self.nairobi, self.lagos)
+
+        asset.notes = 'Cracked screen'
+        asset.save()
+
+        model, nairobi, lagos = self._versions(Asset, self.nairobi, self.lagos)
+        self.assertGreater(model, before[0])
+        self.assertGreater(nairobi, before[1])
+        self.assertEqual(lagos, before[2])
+
+    def test_moving_a_row_invalidates_both_centres(self):
+        asset = Asset.objects.get(pk=self.test_asset.pk)
+        asset.asset_location = self.nairobi
+        asset.save()
+        asset = Asset.objects.get(pk=self.test_asset.pk)
+        before = self._versions(Asset, self.nairobi, self.lagos)
+
+        asset.asset_location = self.lagos
+        asset.save()
+
+        model, nairobi, lagos = self._versions(Asset, self.nairobi, self.lagos)
+        self.assertGreater(nairobi, before[1])
+        self.assertGreater(lagos, before[2])
+
+    def test_asset_logs_invalidate_their_asset(self):
+        before = get_namespace_version(model_namespace(Asset))
+        AssetLog.objects.create(
+            checked_by=self.security_user, asset=self.test_asset, log_type='Checkin'
+        )
+        self.assertGreater(get_namespace_version(model_namespace(Asset)), before)
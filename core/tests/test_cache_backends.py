@@ -0,0 +1,113 @@
+# Standard Library
+import threading
+import time
+
+# Third-Party Imports
+from django.core.cache import caches
+from django.test import override_settings, SimpleTestCase
+
+# App Imports
+from core.cache_server import CacheServer
+
+
+class CacheBackendsTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = CacheServer(('127.0.0.1', 0))
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        location = 'redis://127.0.0.1:{}/1'.format(cls.server.server_address[1])
+        cls.settings = override_settings(
+            CACHES={
+                'default': {
+                    'BACKEND': 'core.cache_backends.TieredCache',
+                    'LOCATION': 'test',
+                    'OPTIONS': {
+                        'SHARED': 'shared',
+                        'SHARED_ONLY': ['art:version:'],
+                        'LOCAL_TIMEOUT': 60,
+                    },
+                },
+                'shared': {
+                    'BACKEND': 'core.cache_backends.RedisCache',
+                    'LOCATION': location,
+                },
+            }
+        )
+        cls.settings.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings.disable()
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.shared = caches['shared']
+        self.tiered = caches['default']
+        self.tiered.clear()
+
+    def test_values_round_trip_through_the_server(self):
+        self.shared.set('answer', 42)
+        self.shared.set('centre', {'name': 'Nairobi', 'floors': [1, 2]})
+
+        self.assertEqual(self.shared.get('answer'), 42)
+        self.assertEqual(
+            self.shared.get('centre'), {'name': 'Nairobi', 'floors': [1, 2]}
+        )
+        self.assertEqual(
+            self.shared.get_many(['answer', 'missing', 'centre']),
+            {'answer': 42, 'centre': {'name': 'Nairobi', 'floors': [1, 2]}},
+        )
+        self.assertIsNone(self.shared.get('missing'))
+
+    def test_add_only_sets_missing_keys(self):
+        self.assertTrue(self.shared.add('key', 'first'))
+        self.assertFalse(self.shared.add('key', 'second'))
+        self.assertEqual(self.shared.get('key'), 'first')
+
+    def test_incr_needs_an_existing_integer(self):
+        with self.assertRaises(ValueError):
+            self.shared.incr('version')
+        self.shared.set('version', 1)
+        self.assertEqual(self.shared.incr('version'), 2)
+        self.shared.set('name', 'Nairobi')
+        with self.assertRaises(ValueError):
+            self.shared.incr('name')
+
+    def test_entries_expire(self):
+        self.shared.set('short', 'lived', timeout=0.05)
+        self.shared.set('gone', 'already', timeout=0)
+        time.sleep(0.1)
+        self.assertIsNone(self.shared.get('short'))
+        self.assertNotIn('gone', self.shared)
+
+    def test_touch_without_timeout_keeps_entries(self):
+        self.shared.set('forever', 'kept', timeout=None)
+        self.assertTrue(self.shared.touch('forever', timeout=None))
+        self.assertFalse(self.shared.touch('missing', timeout=None))
+
+    def test_local_tier_serves_repeat_reads(self):
+        self.tiered.set('taxonomy', ['laptops'])
+        self.shared.set('taxonomy', ['changed by another worker'])
+
+        self.assertEqual(self.tiered.get('taxonomy'), ['laptops'])
+        self.tiered.delete('taxonomy')
+        self.assertIsNone(self.tiered.get('taxonomy'))
+
+    def test_local_tier_is_filled_from_the_shared_cache(self):
+        self.shared.set('centre', 'Nairobi')
+
+        self.assertEqual(
+            self.tiered.get_many(['centre', 'missing']), {'centre': 'Nairobi'}
+        )
+        self.shared.delete('centre')
+        self.assertEqual(self.tiered.get('centre'), 'Nairobi')
+
+    def test_shared_only_keys_are_always_read_from_the_shared_cache(self):
+        self.tiered.set('art:version:taxonomy', 1)
+        self.shared.incr('art:version:taxonomy')
+
+        self.assertEqual(self.tiered.get('art:version:taxonomy'), 2)
+        self.assertEqual(self.tiered.incr('art:version:taxonomy'), 3)
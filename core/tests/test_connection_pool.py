@@ -0,0 +1,130 @@
+# Standard Library
+import sqlite3
+import threading
+from unittest.mock import MagicMock, patch
+
+# Third-Party Imports
+from django.db import connections, OperationalError
+from django.db.backends.postgresql import base
+from django.test import SimpleTestCase
+
+# App Imports
+from core.db.backends.pooled_postgresql.base import close_pools, DatabaseWrapper
+from core.db.pool import ConnectionPool, PoolTimeout
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    def setUp(self):
+        self.opened = []
+        self.pool = ConnectionPool(self._connect, size=2, timeout=0.1)
+        self.addCleanup(self.pool.close)
+
+    def _connect(self):
+        connection = sqlite3.connect(':memory:', check_same_thread=False)
+        self.opened.append(connection)
+        return connection
+
+    def test_released_connections_are_reused(self):
+        connection = self.pool.acquire()
+        self.pool.release(connection)
+
+        self.assertIs(self.pool.acquire(), connection)
+        self.assertEqual(len(self.opened), 1)
+
+    def test_callers_wait_for_a_free_connection(self):
+        first = self.pool.acquire()
+        self.pool.acquire()
+        threading.Timer(0.02, self.pool.release, [first]).start()
+
+        with patch.object(self.pool, 'timeout', 5):
+            self.assertIs(self.pool.acquire(), first)
+
+    def test_acquire_times_out_when_the_pool_is_exhausted(self):
+        self.pool.acquire()
+        self.pool.acquire()
+        with self.assertRaises(PoolTimeout):
+            self.pool.acquire()
+
+    def test_open_transactions_are_rolled_back_on_release(self):
+        connection = self.pool.acquire()
+        connection.execute('CREATE TABLE scans (id INTEGER)')
+        connection.commit()
+        connection.execute('INSERT INTO scans VALUES (1)')
+        self.pool.release(connection)
+
+        connection = self.pool.acquire()
+        self.assertEqual(
+            connection.execute('SELECT COUNT(*) FROM scans').fetchone(), (0,)
+        )
+
+    def test_broken_idle_connections_are_replaced(self):
+        self.pool.check_interval = 0
+        connection = self.pool.acquire()
+        self.pool.release(connection)
+        connection.close()
+
+        replacement = self.pool.acquire()
+        self.assertIsNot(replacement, connection)
+        self.assertEqual(replacement.execute('SELECT 1').fetchone(), (1,))
+
+    def test_old_connections_are_closed(self):
+        self.pool.max_age = 0
+        connection = self.pool.acquire()
+        self.pool.release(connection)
+
+        self.assertEqual(self.pool.idle, [])
+        with self.assertRaises(sqlite3.ProgrammingError):
+            connection.execute('SELECT 1')
+
+
+class PooledDatabaseWrapperTestCase(SimpleTestCase):
+    def setUp(self):
+        self.settings_dict = dict(
+            connections['default'].settings_dict,
+            ENGINE='core.db.backends.pooled_postgresql',
+            NAME='art',
+            POOL={'SIZE': 1, 'TIMEOUT': 0.1},
+        )
+        # stands in for psycopg2.connect
+        connect = patch.object(
+            base.DatabaseWrapper,
+            'get_new_connection',
+            side_effect=lambda conn_params: MagicMock(),
+        )
+        self.connect = connect.start()
+        self.addCleanup(connect.stop)
+        self.addCleanup(close_pools)
+
+    def _wrapper(self):
+        wrapper = DatabaseWrapper(self.settings_dict, 'pooled')
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def test_closed_connections_are_reused(self):
+        wrapper = self._wrapper()
+        wrapper.ensure_connection()
+        connection = wrapper.connection
+        wrapper.close()
+
+        self.assertIsNone(wrapper.connection)
+        connection.close.assert_not_called()
+        connection.rollback.assert_called_once_with()
+        wrapper.ensure_connection()
+        self.assertIs(wrapper.connection, connection)
+        self.assertEqual(self.connect.call_count, 1)
+
+    def test_connections_are_shared_between_wrappers(self):
+        first = self._wrapper()
+        first.ensure_connection()
+        connection = first.connection
+        first.close()
+
+        second = self._wrapper()
+        second.ensure_connection()
+        self.assertIs(second.connection, connection)
+
+    def test_exhausted_pool_raises_operational_error(self):
+        self._wrapper().ensure_connection()
+
+        with self.assertRaisesMessage(OperationalError, 'the pool holds 1'):
+            self._wrapper().ensure_connection()
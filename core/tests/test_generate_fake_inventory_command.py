@@ -0,0 +1,85 @@
+# Standard Library
+import io
+
+# Third-Party Imports
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+# App Imports
+from core.models import (
+    AllocationHistory,
+    AndelaCentre,
+    Asset,
+    AssetLog,
+    AssetModelNumber,
+    AssetStatus,
+    OfficeWorkspace,
+)
+from core.tests import CoreBaseTestCase
+
+
+class GenerateFakeInventoryCommandTestCase(CoreBaseTestCase):
+    def _generate(self, *args):
+        out = io.StringIO()
+        call_command('generate_fake_inventory', *args, stdout=out)
+        return out.getvalue()
+
+    def test_generates_configured_sizes(self):
+        output = self._generate(
+            '--assets=10',
+            '--users=5',
+            '--statuses=40',
+            '--logs=30',
+            '--centres=2',
+            '--blocks-per-centre=1',
+            '--floors-per-block=2',
+            '--sections-per-floor=1',
+            '--workspaces-per-section=3',
+            '--categories=1',
+            '--sub-categories-per-category=1',
+            '--types-per-sub-category=2',
+            '--makes-per-type=1',
+            '--models-per-make=2',
+            '--batch-size=7',
+        )
+        prefix = output.strip().split()[-3]
+
+        self.assertEqual(
+            AndelaCentre.objects.filter(centre_name__startswith=prefix).count(), 2
+        )
+        self.assertEqual(
+            OfficeWorkspace.objects.filter(name__startswith=prefix).count(), 12
+        )
+        self.assertEqual(
+            AssetModelNumber.objects.filter(model_number__startswith=prefix).count(), 4
+        )
+        assets = Asset.objects.filter(asset_code__startswith=prefix)
+        self.assertEqual(assets.count(), 10)
+        self.assertEqual(AssetStatus.objects.filter(asset__in=assets).count(), 40)
+        self.assertEqual(AssetLog.objects.filter(asset__in=assets).count(), 30)
+
+    def test_asset_fields_agree_with_histories(self):
+        output = self._generate(
+            '--assets=8', '--users=3', '--statuses=48', '--logs=24', '--seed=3'
+        )
+        prefix = output.strip().split()[-3]
+
+        for asset in Asset.objects.filter(asset_code__startswith=prefix):
+            latest_status = AssetStatus.objects.filter(asset=asset).latest('id')
+            latest_allocation = (
+                AllocationHistory.objects.filter(asset=asset).order_by('id').last()
+            )
+            latest_log = AssetLog.objects.filter(asset=asset).latest('id')
+            self.assertEqual(asset.current_status, latest_status.current_status)
+            self.assertEqual(
+                asset.assigned_to_id,
+                latest_allocation.current_owner_id if latest_allocation else None,
+            )
+            self.assertEqual(asset.last_log_type, latest_log.log_type)
+            self.assertEqual(asset.last_logged_at, latest_log.client_timestamp)
+
+    def test_rejects_empty_taxonomy(self):
+        with self.assertRaisesMessage(
+            CommandError, '--models-per-make must be at least 1.'
+        ):
+            self._generate('--models-per-make=0')
@@ -0,0 +1,40 @@
+# Standard Library
+from unittest.mock import Mock, patch
+
+# Third-Party Imports
+from django.test import SimpleTestCase
+from psycopg2 import extensions, OperationalError
+
+# App Imports
+from core.db.green import _wait_callback, patch_psycopg
+
+
+class GreenPsycopgTestCase(SimpleTestCase):
+    def _connection(self, *states):
+        return Mock(poll=Mock(side_effect=states), fileno=Mock(return_value=7))
+
+    @patch('core.db.green.wait_write')
+    @patch('core.db.green.wait_read')
+    def test_waits_cooperatively_until_the_query_is_done(self, wait_read, wait_write):
+        connection = self._connection(
+            extensions.POLL_WRITE, extensions.POLL_READ, extensions.POLL_OK
+        )
+
+        _wait_callback(connection, timeout=3)
+
+        wait_write.assert_called_once_with(7, timeout=3)
+        wait_read.assert_called_once_with(7, timeout=3)
+        self.assertEqual(connection.poll.call_count, 3)
+
+    def test_unexpected_poll_states_are_errors(self):
+        connection = self._connection(extensions.POLL_ERROR)
+
+        with self.assertRaises(OperationalError):
+            _wait_callback(connection)
+
+    def test_patch_installs_the_wait_callback(self):
+        self.addCleanup(extensions.set_wait_callback, None)
+
+        patch_psycopg()
+
+        self.assertIs(extensions.get_wait_callback(), _wait_callback)
@@ -0,0 +1,118 @@
+# Standard Library
+from io import StringIO
+from unittest.mock import patch
+
+# Third-Party Imports
+from django.core.management import call_command
+from django.db.models import Sum
+
+# App Imports
+from core import constants
+from core.bulk_operations import transition_asset_statuses
+from core.models import (
+    AndelaCentre,
+    Asset,
+    AssetMake,
+    AssetStatus,
+    AssetType,
+    InventorySummary,
+)
+from core.models.asset import check_asset_limit
+from core.tests import CoreBaseTestCase
+
+
+class InventorySummaryTestCase(CoreBaseTestCase):
+    def _count(self, status, centre=None, model_number=None):
+        return (
+            InventorySummary.objects.filter(
+                centre=centre,
+                model_number=model_number or self.test_assetmodel,
+                status=status,
+            ).aggregate(total=Sum('count'))['total']
+            or 0
+        )
+
+    def _summary(self):
+        return list(
+            InventorySummary.objects.filter(count__gt=0).values_list(
+                'centre', 'asset_type', 'model_number', 'status', 'count'
+            )
+        )
+
+    def test_new_assets_are_counted_as_available(self):
+        self.assertEqual(self._count(constants.AVAILABLE), 2)
+        summary = InventorySummary.objects.get()
+        self.assertEqual(summary.asset_type, self.asset_type)
+
+        Asset.objects.create(
+            asset_code='IC003',
+            serial_number='SN003',
+            model_number=self.test_assetmodel,
+            asset_location=self.centre,
+        )
+        self.assertEqual(self._count(constants.AVAILABLE, self.centre), 1)
+
+    def test_status_changes_move_the_count(self):
+        AssetStatus.objects.create(
+            asset=self.test_asset, current_status=constants.DAMAGED
+        )
+        self.assertEqual(self._count(constants.AVAILABLE), 1)
+        self.assertEqual(self._count(constants.DAMAGED), 1)
+
+        transition_asset_statuses([self.test_asset.id, 'IC002'], constants.LOST)
+        self.assertEqual(self._count(constants.DAMAGED), 0)
+        self.assertEqual(self._count(constants.AVAILABLE), 0)
+        self.assertEqual(self._count(constants.LOST), 2)
+
+    def test_moving_an_asset_moves_its_count(self):
+        asset = Asset.objects.get(id=self.test_asset.id)
+        asset.asset_location = self.centre
+        asset.save()
+
+        self.assertEqual(self._count(constants.AVAILABLE), 1)
+        self.assertEqual(self._count(constants.AVAILABLE, self.centre), 1)
+
+    def test_summary_follows_the_asset_type_of_its_model_numbers(self):
+        other_type = AssetType.objects.create(
+            asset_type='Charger', asset_sub_category=self.asset_sub_category
+        )
+        self.asset_make.asset_type = other_type
+        self.asset_make.save()
+        self.assertEqual(InventorySummary.objects.get().asset_type, other_type)
+
+        self.test_assetmodel.make_label = AssetMake.objects.create(
+            make_label='Oraimo', asset_type=self.asset_type
+        )
+        self.test_assetmodel.save()
+        self.assertEqual(InventorySummary.objects.get().asset_type, self.asset_type)
+
+    @patch.dict('os.environ', {'ASSET_LIMIT': '1'})
+    def test_asset_limit_is_checked_against_the_summary(self):
+        with patch('core.models.asset.slack.send_message') as send_message:
+            check_asset_limit(self.test_assetmodel)
+            send_message.assert_not_called()
+
+            InventorySummary.objects.update(count=1)
+            check_asset_limit(self.test_assetmodel)
+            send_message.assert_called_once()
+
+    def test_reconcile_command_rebuilds_the_summary(self):
+        centre = AndelaCentre.objects.create(centre_name='Kampala')
+        Asset.objects.filter(id=self.test_asset.id).update(asset_location=centre)
+        expected = [
+            (None, self.asset_type.id, self.test_assetmodel.id, 'Available', 1),
+            (centre.id, self.asset_type.id, self.test_assetmodel.id, 'Available', 1),
+        ]
+
+        out = StringIO()
+        call_command('reconcile_inventory', stdout=out)
+
+        self.assertCountEqual(self._summary(), expected)
+        self.assertIn(
+            '2 inventory summary rows written, 2 counts corrected', out.getvalue()
+        )
+
+        out = StringIO()
+        call_command('reconcile_inventory', stdout=out)
+        self.assertCountEqual(self._summary(), expected)
+        self.assertIn('0 counts corrected', out.getvalue())
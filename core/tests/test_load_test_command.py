@@ -0,0 +1,58 @@
+# Standard Library
+import io
+from unittest.mock import patch
+
+# Third-Party Imports
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import LiveServerTestCase
+
+# App Imports
+from core.models import User
+
+
+class LoadTestCommandTestCase(LiveServerTestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            email='load.test@site.com', cohort=10, slack_handle='@load'
+        )
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_reports_each_concurrency_level(self, mock_verify_id_token):
+        mock_verify_id_token.return_value = {'email': self.user.email}
+        out = io.StringIO()
+
+        call_command(
+            'load_test',
+            '--url={}'.format(self.live_server_url),
+            '--compare-url={}'.format(self.live_server_url),
+            '--concurrency=1,4',
+            '--requests=8',
+            '--token=token',
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertIn('concurrency    4:', lines[2])
+        self.assertTrue(lines[0].endswith(' 0 errors'))
+        self.assertIn('the throughput of {}'.format(self.live_server_url), lines[5])
+        self.assertEqual(mock_verify_id_token.call_count, 32)
+
+    @patch('api.authentication.auth.verify_id_token')
+    def test_fails_when_no_request_succeeds(self, mock_verify_id_token):
+        mock_verify_id_token.side_effect = ValueError('expired')
+
+        with self.assertRaisesMessage(CommandError, 'No request'):
+            call_command(
+                'load_test',
+                '--url={}'.format(self.live_server_url),
+                '--concurrency=2',
+                '--requests=4',
+                '--token=token',
+                stdout=io.StringIO(),
+            )
+
+    def test_rejects_bad_concurrency(self):
+        with self.assertRaises(CommandError):
+            call_command('load_test', '--url=http://127.0.0.1:1', '--concurrency=a')
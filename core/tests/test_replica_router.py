@@ -0,0 +1,124 @@
+# Standard Library
+from unittest.mock import patch
+
+# Third-Party Imports
+from django.db import DatabaseError
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import override_settings, RequestFactory
+
+# App Imports
+from core.db import replicas
+from core.db.replicas import replica_lag, ReplicaMiddleware, ReplicaRouter
+from core.models import Asset
+from core.tests import CoreBaseTestCase
+
+
+@override_settings(
+    REPLICA_DATABASES=['replica_1', 'replica_2'],
+    REPLICA_STICKY_SECONDS=5,
+    REPLICA_MAX_LAG_SECONDS=5,
+    REPLICA_LAG_CHECK_INTERVAL=5,
+)
+class ReplicaRouterTestCase(CoreBaseTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+        replicas._checks.clear()
+        patcher = patch.object(replicas, 'replica_lag', return_value=0)
+        self.replica_lag = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _reads(self, request, status=200):
+        """Return the databases read from while a request is handled."""
+        databases = []
+
+        def view(request):
+            databases.append(self.router.db_for_read(Asset))
+            databases.append(self.router.db_for_read(Asset))
+            return HttpResponse(status=status)
+
+        ReplicaMiddleware(view)(request)
+        return databases
+
+    def _get(self, path='/api/v1/assets/', user=None):
+        request = self.factory.get(path)
+        if user is not None:
+            # as DRF does once it has authenticated the request
+            request.user = user
+        return request
+
+    def _post(self, user):
+        request = self.factory.post('/api/v1/assets/')
+        request.user = user
+        return request
+
+    def test_reads_outside_requests_use_the_primary(self):
+        self.assertEqual(self.router.db_for_read(Asset), 'default')
+
+    def test_api_reads_use_one_replica_per_request(self):
+        databases = self._reads(self._get(user=self.user))
+        self.assertIn(databases[0], ['replica_1', 'replica_2'])
+        self.assertEqual(databases[0], databases[1])
+
+    def test_writes_and_other_reads_use_the_primary(self):
+        self.assertEqual(self._reads(self._post(self.user)), ['default', 'default'])
+        self.assertEqual(
+            self._reads(self._get('/admin/core/asset/')), ['default', 'default']
+        )
+        self.assertEqual(self.router.db_for_write(Asset), 'default')
+
+    def test_users_read_their_writes_from_the_primary(self):
+        self._reads(self._post(self.user))
+
+        self.assertEqual(self._reads(self._get(user=self.user)), ['default', 'default'])
+        self.assertIn(
+            self._reads(self._get(user=self.user2))[0], ['replica_1', 'replica_2']
+        )
+
+    def test_failed_writes_do_not_pin_users(self):
+        self._reads(self._post(self.user), status=400)
+        self.assertIn(
+            self._reads(self._get(user=self.user))[0], ['replica_1', 'replica_2']
+        )
+
+    @override_settings(REPLICA_STICKY_SECONDS=0)
+    def test_stickiness_can_be_turned_off(self):
+        self._reads(self._post(self.user))
+        self.assertIn(
+            self._reads(self._get(user=self.user))[0], ['replica_1', 'replica_2']
+        )
+
+    def test_lagging_replicas_are_skipped(self):
+        self.replica_lag.side_effect = lambda alias: {'replica_1': 30}.get(alias, 0)
+        self.assertEqual(self._reads(self._get())[0], 'replica_2')
+
+    def test_primary_is_read_when_no_replica_is_usable(self):
+        self.replica_lag.side_effect = [30, DatabaseError('connection refused')]
+        self.assertEqual(self._reads(self._get()), ['default', 'default'])
+
+    def test_lag_is_checked_once_per_interval(self):
+        for _ in range(3):
+            self._reads(self._get())
+        self.assertEqual(self.replica_lag.call_count, 2)
+
+    def test_streamed_responses_read_from_the_replica(self):
+        databases = []
+
+        def rows():
+            databases.append(self.router.db_for_read(Asset))
+            yield b'row\n'
+
+        response = ReplicaMiddleware(lambda request: StreamingHttpResponse(rows()))(
+            self._get()
+        )
+        b''.join(response.streaming_content)
+
+        self.assertIn(databases[0], ['replica_1', 'replica_2'])
+        self.assertEqual(self.router.db_for_read(Asset), 'default')
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(self.router.allow_migrate('replica_1', 'core'))
+        self.assertIsNone(self.router.allow_migrate('default', 'core'))
+
+    def test_lag_of_databases_other_than_postgresql_is_zero(self):
+        self.assertEqual(replica_lag('default'), 0)
@@ -0,0 +1,93 @@
+# Standard Library
+from unittest.mock import patch
+
+# Third-Party Imports
+from django.db import connection
+from django.test import override_settings
+
+# App Imports
+from core.models import SlowQuery, User
+from core.slow_queries import slow_query_log
+from core.tests import CoreBaseTestCase
+
+
+@override_settings(SLOW_QUERY_MS=100)
+class SlowQueryLogTestCase(CoreBaseTestCase):
+    def _query(
+        self, sql='SELECT "core_user"."id" FROM "core_user" WHERE "core_user"."id" = %s'
+    ):
+        return {
+            'database': 'default',
+            'sql': sql,
+            'params': [self.user.pk],
+            'many': False,
+            'duration': 250.0,
+            'source': 'UserViewSet.list',
+        }
+
+    def test_timer_is_installed_on_connections(self):
+        self.assertIn(slow_query_log, connection.execute_wrappers)
+
+    def test_slow_queries_are_submitted_with_their_source(self):
+        with patch.object(slow_query_log, 'submit') as submit, patch(
+            'core.slow_queries.time.perf_counter', side_effect=[0, 0.25]
+        ):
+            User.objects.filter(pk=self.user.pk).exists()
+
+        query = submit.call_args[0][0]
+        self.assertEqual(query['duration'], 250)
+        self.assertEqual(query['params'], (self.user.pk,))
+        self.assertIn('FROM "core_user"', query['sql'])
+        self.assertIn(
+            'SlowQueryLogTestCase.test_slow_queries_are_submitted_with_their_source',
+            query['source'],
+        )
+
+    def test_fast_queries_are_not_submitted(self):
+        with patch.object(slow_query_log, 'submit') as submit, patch(
+            'core.slow_queries.time.perf_counter', side_effect=[0, 0.05]
+        ):
+            User.objects.filter(pk=self.user.pk).exists()
+        submit.assert_not_called()
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_capture_is_off_when_the_threshold_is_zero(self):
+        with patch.object(slow_query_log, 'submit') as submit, patch(
+            'core.slow_queries.time.perf_counter'
+        ) as perf_counter:
+            User.objects.filter(pk=self.user.pk).exists()
+        submit.assert_not_called()
+        perf_counter.assert_not_called()
+
+    def test_repeated_queries_are_stored_once_with_their_plan(self):
+        slow_query_log.store(self._query())
+        slow_query_log.store(dict(self._query(), duration=550.0))
+
+        slow_query = SlowQuery.objects.get()
+        self.assertEqual(slow_query.calls, 2)
+        self.assertEqual(slow_query.total_ms, 800)
+        self.assertEqual(slow_query.max_ms, 550)
+        self.assertEqual(slow_query.mean_ms, 400)
+        self.assertEqual(slow_query.source, 'UserViewSet.list')
+        self.assertIn('core_user', slow_query.plan)
+
+    @override_settings(SLOW_QUERY_EXPLAIN=False)
+    def test_plans_are_optional(self):
+        slow_query_log.store(self._query())
+        self.assertEqual(SlowQuery.objects.get().plan, '')
+
+    def test_only_select_queries_are_explained(self):
+        slow_query_log.store(
+            self._query('UPDATE "core_user" SET "cohort" = 1 WHERE "id" = %s')
+        )
+        self.assertEqual(SlowQuery.objects.get().plan, '')
+
+    @override_settings(SLOW_QUERY_LIMIT=2)
+    def test_least_recently_seen_queries_are_removed(self):
+        for table in ('core_user', 'core_asset', 'core_assetlog'):
+            slow_query_log.store(self._query('SELECT 1 FROM "{}"'.format(table)))
+
+        self.assertEqual(
+            sorted(SlowQuery.objects.values_list('sql', flat=True)),
+            ['SELECT 1 FROM "core_asset"', 'SELECT 1 FROM "core_assetlog"'],
+        )
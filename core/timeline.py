@@ -0,0 +1,110 @@
+# Standard Library
+import heapq
+from datetime import datetime
+from itertools import chain
+from operator import itemgetter
+
+# Third-Party Imports
+from django.db.models import Q
+from django.utils import timezone
+
+# App Imports
+from core.models import (
+    AllocationHistory,
+    AssetCondition,
+    AssetIncidentReport,
+    AssetLog,
+    AssetStatus,
+)
+
+ASSIGNEE_FIELDS = ('department', 'workspace', 'user')
+
+# the records making up an asset's history, with the relations they are
+# shown with; records created at the same moment are listed last kind first
+TIMELINE_SOURCES = (
+    ('status', AssetStatus, ()),
+    (
+        'allocation',
+        AllocationHistory,
+        tuple(
+            '{}__{}'.format(owner, field)
+            for owner in ('current_owner', 'previous_owner')
+            for field in ASSIGNEE_FIELDS
+        ),
+    ),
+    ('condition', AssetCondition, ()),
+    ('log', AssetLog, ('checked_by',)),
+    ('incident', AssetIncidentReport, ('submitted_by',)),
+)
+
+# the time of records filed before their model recorded one, which come last
+UNDATED = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _after(queryset, index, position, undated=False):
+    """
+    Keep the records of the `index`th kind that come after `position`, a
+    key of the timeline, in the timeline.
+    """
+    created_at, position_index, position_id = position
+    if undated and created_at != UNDATED:
+        return queryset
+    if not undated and created_at == UNDATED:
+        return queryset.none()
+    if index < position_index:
+        same_time = Q()
+    elif index == position_index:
+        same_time = Q(id__lt=position_id)
+    else:
+        same_time = Q(pk__in=[])
+    if undated:
+        return queryset.filter(same_time)
+    return queryset.filter(
+        Q(created_at__lt=created_at) | Q(created_at=created_at) & same_time
+    )
+
+
+def _records(asset, index, kind, queryset, undated=False):
+    for record in queryset.iterator():
+        # shown with the asset already loaded
+        record.asset = asset
+        yield (
+            UNDATED if undated else record.created_at,
+            index,
+            record.id,
+        ), kind, record
+
+
+def _stream(asset, index, kind, model, related, after, limit):
+    """The records of one kind, newest first, read with one query per part."""
+    queryset = model.objects.filter(asset=asset).select_related(*related)
+    parts = [(queryset.filter(created_at__isnull=False), False)]
+    if model._meta.get_field('created_at').null:
+        parts.append((queryset.filter(created_at__isnull=True), True))
+    streams = []
+    for part, undated in parts:
+        part = part.order_by('-id') if undated else part.order_by('-created_at', '-id')
+        if after is not None:
+            part = _after(part, index, after, undated)
+        if limit is not None:
+            part = part[:limit]
+        streams.append(_records(asset, index, kind, part, undated))
+    # undated records all come after the dated ones, and are only read once
+    # those run out
+    return chain(*streams)
+
+
+def asset_timeline(asset, after=None, limit=None):
+    """
+    Yield (key, kind, record) for the status, allocation, condition, check-in
+    and incident records of an asset, newest first.
+
+    Each kind is read with one query on its (asset, created_at) index and the
+    kinds are merged as they are consumed. `after` is the key of the last
+    record already seen, and `limit` the most records read of each kind.
+    """
+    streams = [
+        _stream(asset, index, kind, model, related, after, limit)
+        for index, (kind, model, related) in enumerate(TIMELINE_SOURCES)
+    ]
+    return heapq.merge(*streams, key=itemgetter(0), reverse=True)
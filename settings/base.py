@@ -12,10 +12,12 @@ https://docs.djangoproject.com/en/2.0/ref/settings/
 
 # Standard Library
 import os
+import tempfile
 
 # Third-Party Imports
 import dj_database_url
 from decouple import config, Csv
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -36,7 +38,57 @@ STATICFILES_STORAGE = 'whitenoise.django.GzipManifestStaticFilesStorage'
 
 SECRET_KEY = config('SECRET_KEY')
 
-DATABASES = {'default': dj_database_url.config()}
+# gunicorn worker class, see art/gunicorn_config.py
+GUNICORN_WORKER_CLASS = config('GUNICORN_WORKER_CLASS', 'sync')
+
+# seconds a thread keeps its database connection between requests; under
+# gevent every greenlet is a thread, so connections are never kept
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', 0, cast=int)
+if GUNICORN_WORKER_CLASS == 'gevent':
+    DB_CONN_MAX_AGE = 0
+
+# database connections pooled per worker process; 0 turns pooling off
+DB_POOL_SIZE = config('DB_POOL_SIZE', 0, cast=int)
+
+DATABASES = {'default': dj_database_url.config(conn_max_age=DB_CONN_MAX_AGE)}
+
+# read-only copies of the default database, read by safe API requests
+REPLICA_DATABASES = []
+for index, url in enumerate(config('DATABASE_REPLICA_URLS', '', cast=Csv())):
+    alias = 'replica_{}'.format(index + 1)
+    DATABASES[alias] = dj_database_url.parse(url, conn_max_age=DB_CONN_MAX_AGE)
+    # tests have no replicas; their connections use the test database
+    DATABASES[alias]['TEST'] = {'MIRROR': 'default'}
+    REPLICA_DATABASES.append(alias)
+if REPLICA_DATABASES:
+    DATABASE_ROUTERS = ['core.db.replicas.ReplicaRouter']
+
+# seconds a user reads from the default database after one of their writes
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', 5, cast=int)
+
+# replicas further behind than this many seconds are not read from
+REPLICA_MAX_LAG_SECONDS = config('REPLICA_MAX_LAG_SECONDS', 5, cast=int)
+
+# seconds between checks of a replica's lag, per worker process
+REPLICA_LAG_CHECK_INTERVAL = config('REPLICA_LAG_CHECK_INTERVAL', 5, cast=int)
+
+if DB_POOL_SIZE:
+    for database in DATABASES.values():
+        if 'postgresql' not in database['ENGINE']:
+            raise ImproperlyConfigured('DB_POOL_SIZE needs PostgreSQL databases.')
+        database.update(
+            {
+                'ENGINE': 'core.db.backends.pooled_postgresql',
+                # connections go back to the pool at the end of each request
+                'CONN_MAX_AGE': 0,
+                'POOL': {
+                    'SIZE': DB_POOL_SIZE,
+                    'TIMEOUT': config('DB_POOL_TIMEOUT', 10, cast=int),
+                    'MAX_AGE': config('DB_POOL_MAX_AGE', 600, cast=int),
+                    'CHECK_INTERVAL': config('DB_POOL_CHECK_INTERVAL', 30, cast=int),
+                },
+            }
+        )
 
 ALLOWED_HOSTS = config('HOST_IP', cast=Csv())
 # Application definition
@@ -62,6 +114,7 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = 'core.User'
 
 MIDDLEWARE = [
+    'api.perf.MetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -69,6 +122,8 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.db.replicas.ReplicaMiddleware',
+    'api.perf.PerformanceMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -131,6 +186,8 @@ JET_SIDE_MENU_COMPACT = True
 
 JET_DEFAULT_THEME = 'andela'
 
+JET_INDEX_DASHBOARD = 'api.dashboard.IndexDashboard'
+
 REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'core.pagination.PageNumberPagination',
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -176,3 +233,115 @@ SWAGGER_SETTINGS = {
 }
 
 REDOC_SETTINGS = {'LAZY_RENDERING': True}
+
+# number of rows fetched per database round-trip when streaming exports
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', 2000, cast=int)
+
+# shared cache: 'locmem' (one per process), 'file' or 'redis'; the last two
+# get a per-process LRU tier in front of them
+CACHE_BACKEND = config('CACHE_BACKEND', 'locmem')
+
+# directory for 'file', or redis://[:password@]host:port/db for 'redis'
+CACHE_LOCATION = config('CACHE_LOCATION', '')
+
+# seconds and entries kept by the per-process tier in front of the shared cache
+CACHE_LOCAL_TIMEOUT = config('CACHE_LOCAL_TIMEOUT', 5, cast=int)
+CACHE_LOCAL_MAX_ENTRIES = config('CACHE_LOCAL_MAX_ENTRIES', 1000, cast=int)
+
+SHARED_CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', ''),
+    'file': (
+        'django.core.cache.backends.filebased.FileBasedCache',
+        os.path.join(tempfile.gettempdir(), 'art-cache'),
+    ),
+    'redis': ('core.cache_backends.RedisCache', 'redis://127.0.0.1:6379/0'),
+}
+if CACHE_BACKEND not in SHARED_CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        'CACHE_BACKEND must be one of {}.'.format(', '.join(SHARED_CACHE_BACKENDS))
+    )
+SHARED_CACHE = {
+    'BACKEND': SHARED_CACHE_BACKENDS[CACHE_BACKEND][0],
+    'LOCATION': CACHE_LOCATION or SHARED_CACHE_BACKENDS[CACHE_BACKEND][1],
+}
+if CACHE_BACKEND == 'locmem':
+    CACHES = {'default': SHARED_CACHE}
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'core.cache_backends.TieredCache',
+            'LOCATION': 'default',
+            'OPTIONS': {
+                'SHARED': 'shared',
+                'SHARED_ONLY': ['art:version:'],
+                'LOCAL_TIMEOUT': CACHE_LOCAL_TIMEOUT,
+                'LOCAL_MAX_ENTRIES': CACHE_LOCAL_MAX_ENTRIES,
+            },
+        },
+        'shared': SHARED_CACHE,
+    }
+if REPLICA_DATABASES and CACHE_BACKEND == 'locmem':
+    # users are pinned to the default database in the cache, which every
+    # worker has to see
+    raise ImproperlyConfigured(
+        'DATABASE_REPLICA_URLS needs a CACHE_BACKEND shared by the workers.'
+    )
+
+# seconds a cached API list response is kept; writes invalidate it sooner
+API_CACHE_TIMEOUT = config('API_CACHE_TIMEOUT', 300, cast=int)
+
+# largest number of items accepted by a single bulk endpoint request
+BULK_OPERATION_MAX_ITEMS = config('BULK_OPERATION_MAX_ITEMS', 500, cast=int)
+
+# seconds a scanner's clock may run ahead of ours before its scans are rejected
+SCAN_CLOCK_SKEW_SECONDS = config('SCAN_CLOCK_SKEW_SECONDS', 300, cast=int)
+
+# fraction of requests whose query count and timings are recorded for /_perf/
+PERF_SAMPLE_RATE = config('PERF_SAMPLE_RATE', 0.05, cast=float)
+
+# length in seconds of each performance window, and how many are kept
+PERF_WINDOW_SECONDS = config('PERF_WINDOW_SECONDS', 60, cast=int)
+PERF_WINDOWS = config('PERF_WINDOWS', 60, cast=int)
+
+# seconds between copies of a worker's performance windows to the cache
+PERF_FLUSH_INTERVAL = config('PERF_FLUSH_INTERVAL', 30, cast=int)
+
+# directory shared by all workers where each writes its /metrics values
+METRICS_DIR = config('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'art-metrics'))
+
+# seconds between writes of a worker's /metrics values to METRICS_DIR
+METRICS_FLUSH_INTERVAL = config('METRICS_FLUSH_INTERVAL', 5, cast=int)
+
+# bearer token required to read /metrics; unset, it is only served with DEBUG on
+METRICS_TOKEN = config('METRICS_TOKEN', '')
+
+# report serializers repeating a query per row: '' (off), 'log' or 'raise'
+NPLUSONE_MODE = config('NPLUSONE_MODE', '')
+
+# identical queries made by one serializer field that count as an N+1
+NPLUSONE_THRESHOLD = config('NPLUSONE_THRESHOLD', 2, cast=int)
+
+# serializer fields ('Serializer.field' paths) known to query per row
+NPLUSONE_IGNORE = config('NPLUSONE_IGNORE', '', cast=Csv())
+
+# queries slower than this many milliseconds are kept for the admin; 0 is off
+SLOW_QUERY_MS = config('SLOW_QUERY_MS', 500, cast=int)
+
+# whether the plan of each slow SELECT is stored with it
+SLOW_QUERY_EXPLAIN = config('SLOW_QUERY_EXPLAIN', True, cast=bool)
+
+# number of slow queries kept; the least recently seen are removed first
+SLOW_QUERY_LIMIT = config('SLOW_QUERY_LIMIT', 200, cast=int)
+
+# months of asset logs, including the current one, kept in the database by
+# archive_asset_logs; older ones are moved to ASSET_LOG_ARCHIVE_DIR
+ASSET_LOG_RETENTION_MONTHS = config('ASSET_LOG_RETENTION_MONTHS', 12, cast=int)
+
+# directory of the gzipped CSV archives of asset logs, one per month
+ASSET_LOG_ARCHIVE_DIR = config(
+    'ASSET_LOG_ARCHIVE_DIR', os.path.join(BASE_DIR, 'archive', 'asset_logs')
+)
+
+# months after the current one the partitioned asset log table has
+# partitions for
+ASSET_LOG_PARTITIONS_AHEAD = config('ASSET_LOG_PARTITIONS_AHEAD', 3, cast=int)